@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Benchmark validating a CSV file read in chunks.
+
+Compares peak memory and time when a file is read into one DataFrame
+against validating the iterator of chunks returned by pandas.read_csv()
+with a *chunksize*. Peak memory is measured with tracemalloc and also
+counts the memory used to read the data. Requires pandas and Python
+3.4 or newer. Run from the project root:
+
+    python benchmarks/bench_chunks.py
+"""
+from __future__ import print_function
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas
+from datatest import validate
+
+
+def make_csv(path, size):
+    with open(path, 'w') as fh:
+        fh.write('A,B,C\n')
+        for x in range(size):
+            fh.write('{0},name{1},{2}\n'.format(x, x % 1000, x * 0.5))
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.time()
+    try:
+        func()
+        seconds = time.time() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def check_unique(data):
+    if isinstance(data, pandas.DataFrame):
+        validate.unique(data[['A']])
+    else:
+        validate.unique(chunk[['A']] for chunk in data)
+
+
+def check_set(data):
+    requirement = set('name{0}'.format(x) for x in range(1000))
+    if isinstance(data, pandas.DataFrame):
+        validate(data[['B']], requirement)
+    else:
+        validate((chunk[['B']] for chunk in data), requirement)
+
+
+def check_types(data):
+    validate(data, (int, str, float))
+
+
+def main(size=500000, chunksize=50000):
+    fd, path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        make_csv(path, size)
+        read_whole = lambda: pandas.read_csv(path)
+        read_chunks = lambda: pandas.read_csv(path, chunksize=chunksize)
+
+        checks = [
+            ('unique', check_unique),
+            ('set', check_set),
+            ('types', check_types),
+        ]
+
+        print('{0} rows, chunksize {1}:'.format(size, chunksize))
+        for label, check in checks:
+            whole_seconds, whole_peak = measure(lambda: check(read_whole()))
+            chunk_seconds, chunk_peak = measure(lambda: check(read_chunks()))
+            print('  {0:<6} whole {1:.2f}s {2:6.1f} MB  chunked {3:.2f}s {4:6.1f} MB'.format(
+                label, whole_seconds, whole_peak / 1e6, chunk_seconds, chunk_peak / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmark reading rows from non-iterable DBAPI2 cursors.
+
+Compares the row-at-a-time fetchone() loop against batched retrieval
+with fetchmany() at several cursor arraysize values (an arraysize of 1,
+the DBAPI2 default, is read 1000 rows at a time). An sqlite3 cursor is wrapped
+so that it is not iterable (which the DBAPI2 specification allows).
+Networked drivers pay a round trip per fetch, so their gains are
+usually larger than the in-process numbers shown here. Run from the
+project root:
+
+    python benchmarks/bench_cursor.py
+"""
+from __future__ import print_function
+import os
+import sqlite3
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from datatest import _normalize
+
+
+class FetchOneCursor(object):
+    """Wrap a cursor and expose only fetchone() for reading rows."""
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.rowcount = cursor.rowcount
+        self.description = cursor.description
+        self.arraysize = cursor.arraysize
+
+    def execute(self, *args):
+        self._cursor.execute(*args)
+        self.description = self._cursor.description
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+
+class FetchManyCursor(FetchOneCursor):
+    """Wrap a cursor and expose fetchone() and fetchmany()."""
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        return self._cursor.fetchmany(size)
+
+
+def make_connection(size=200000):
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE mydata(A, B, C)')
+    rows = ((x, 'name{0}'.format(x), x % 7) for x in range(size))
+    connection.executemany('INSERT INTO mydata VALUES (?, ?, ?)', rows)
+    return connection
+
+
+def run(cursor_type, connection, query, arraysize):
+    cursor = cursor_type(connection.cursor()).execute(query)
+    if arraysize is not None:
+        cursor.arraysize = arraysize
+    for _ in _normalize._normalize_lazy(cursor):
+        pass
+
+
+def main(number=3):
+    connection = make_connection()
+    count = connection.execute('SELECT COUNT(*) FROM mydata').fetchone()[0]
+    queries = [
+        ('single column', 'SELECT A FROM mydata'),
+        ('three columns', 'SELECT A, B, C FROM mydata'),
+    ]
+    configurations = [
+        ('fetchone', FetchOneCursor, None),
+        ('arraysize=1', FetchManyCursor, 1),
+        ('arraysize=100', FetchManyCursor, 100),
+        ('arraysize=10000', FetchManyCursor, 10000),
+    ]
+
+    for label, query in queries:
+        print('{0} ({1} rows):'.format(label, count))
+        for name, cursor_type, arraysize in configurations:
+            seconds = min(timeit.repeat(
+                lambda: run(cursor_type, connection, query, arraysize),
+                number=1, repeat=number))
+            print('  {0:<17} {1:.3f} seconds ({2:,.0f} rows/second)'.format(
+                name, seconds, count / seconds))
+
+
+if __name__ == '__main__':
+    main()
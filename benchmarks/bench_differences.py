@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Benchmark comparison and hashing of difference objects.
+
+Compares the cached comparison-key and hash implementation used by
+BaseDifference against the previous uncached approach (which rebuilt
+the NaN-normalized args and the hash tuple on every call) using a
+Deviation-heavy workload. Run from the project root:
+
+    python benchmarks/bench_differences.py
+"""
+from __future__ import print_function
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from datatest.differences import Deviation
+from datatest.differences import _nan_to_token
+
+
+def uncached_eq(self, other):
+    if self.__class__ != other.__class__:
+        return False
+    self_args = tuple(_nan_to_token(x) for x in self.args)
+    other_args = tuple(_nan_to_token(x) for x in other.args)
+    return self_args == other_args
+
+
+def uncached_hash(self):
+    return hash((self.__class__, self.args))
+
+
+class UncachedDeviation(Deviation):
+    __slots__ = ()
+    __eq__ = uncached_eq
+    __hash__ = uncached_hash
+
+
+def make_workload(cls, size=20000):
+    values = [x % 500 - 250 for x in range(size)]
+    values = [x or 1 for x in values]
+    left = [cls(float(x), 100.0) for x in values]
+    right = [cls(float(x), 100.0) for x in values]
+    return left, right
+
+
+def run_comparisons(left, right, repeat=5):
+    for _ in range(repeat):
+        for x, y in zip(left, right):
+            x == y
+        set(left) & set(right)
+        [x in right[:50] for x in left[:2000]]
+
+
+def main(number=3):
+    print('Comparing and hashing {0} Deviation objects:'.format(20000))
+    for label, cls in [('uncached', UncachedDeviation), ('cached', Deviation)]:
+        left, right = make_workload(cls)
+        seconds = min(timeit.repeat(
+            lambda: run_comparisons(left, right), number=1, repeat=number))
+        print('  {0:<10} {1:.3f} seconds'.format(label, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Benchmark per-row cost of Predicate matching.
+
+Compares calling a Predicate directly (which dispatches through
+MatcherTuple and MatcherObject comparisons) against calling the flat
+function returned by Predicate.compile(). Run from the project root:
+
+    python benchmarks/bench_predicate.py
+"""
+from __future__ import print_function
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from datatest._vendor.predicate import Predicate
+
+
+def is_positive(x):
+    return x > 0
+
+
+PREDICATES = [
+    ('type', Predicate(int)),
+    ('regex', Predicate(re.compile(r'^[A-Z]{2}$'))),
+    ('row tuple', Predicate((str, int, is_positive, Ellipsis, re.compile(r'^\d{5}$')))),
+    ('combined', Predicate(int) & ~Predicate(set([0, 1])) | Predicate(str)),
+]
+
+
+def make_rows(size=100000):
+    rows = []
+    for x in range(size):
+        zipcode = '{0:05d}'.format(x) if x % 10 else 'n/a'
+        rows.append(('name{0}'.format(x), x, x % 7, None, zipcode))
+    return rows
+
+
+def make_values(pred, rows):
+    if isinstance(getattr(pred, 'obj', None), tuple):
+        return rows
+    return [x for row in rows for x in (row[1], row[0][:2].upper())]
+
+
+def run(function, values):
+    for value in values:
+        function(value)
+
+
+def main(number=3):
+    rows = make_rows()
+    for label, pred in PREDICATES:
+        values = make_values(pred, rows)
+        print('{0} ({1} values):'.format(label, len(values)))
+        for name, function in [('call', pred), ('compiled', pred.compile())]:
+            seconds = min(timeit.repeat(
+                lambda: run(function, values), number=1, repeat=number))
+            per_row = seconds / len(values) * 1e9
+            print('  {0:<10} {1:.3f} seconds ({2:.0f} ns/value)'.format(
+                name, seconds, per_row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Benchmark the vectorized NumPy backend.
+
+Checks the same one-dimensional array with each requirement twice:
+once as an array (which is checked in bulk) and once as a plain
+iterator over the array's elements (which is checked one element at
+a time). Both produce the same differences. If pandas is installed,
+type checks of Series with extension dtypes (like "category" and
+"Int64") are also measured. Requires NumPy. Run from the project root:
+
+    python benchmarks/bench_vectorized.py
+"""
+from __future__ import print_function
+import os
+import sys
+import timeit
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+from datatest._normalize import normalize
+from datatest.requirements import (
+    RequiredPredicate,
+    RequiredApprox,
+    RequiredInterval,
+    RequiredSet,
+    RequiredSubset,
+    RequiredUnique,
+)
+
+warnings.filterwarnings('ignore', message='subset and superset warning')
+
+
+def make_requirements(array, unique_array):
+    return [
+        ('interval', RequiredInterval(0, 999), array),
+        ('approx', RequiredApprox(500.0, delta=600), array),
+        ('type', RequiredPredicate(numpy.integer), array),
+        ('set', RequiredSet(set(range(1000))), array),
+        ('subset', RequiredSubset(set(range(1000))), array),
+        ('unique', RequiredUnique(), unique_array),
+    ]
+
+
+def run(requirement, group):
+    differences, _ = requirement.check_group(group)
+    for _ in differences:
+        pass
+
+
+def main(size=1000000, number=3):
+    random = numpy.random.RandomState(0)
+    array = random.randint(0, 1000, size=size)
+    array[::1000] = 1001  # <- Some failing elements.
+    unique_array = random.permutation(size)
+    unique_array[::1000] = 0  # <- Some duplicates.
+
+    print('{0} elements:'.format(size))
+    for label, requirement, data in make_requirements(array, unique_array):
+        timings = []
+        for group_type in (iter, lambda x: x):
+            seconds = min(timeit.repeat(
+                lambda: run(requirement, group_type(data)),
+                number=1, repeat=number))
+            timings.append(seconds)
+        python_seconds, array_seconds = timings
+        print('  {0:<10} python {1:.3f}s  vectorized {2:.3f}s  ({3:.1f}x)'.format(
+            label, python_seconds, array_seconds, python_seconds / array_seconds))
+
+    if pandas is None:
+        return
+
+    print('{0} elements (pandas extension dtypes):'.format(size))
+    extension_series = [
+        ('Int64', int, pandas.Series(array).astype('Int64')),
+        ('category', str, pandas.Series(array.astype(str)).astype('category')),
+        ('string', str, pandas.Series(array.astype(str)).astype('string')),
+    ]
+    for label, type_, series in extension_series:
+        requirement = RequiredPredicate(type_)
+        python_seconds = min(timeit.repeat(
+            lambda: run(requirement, iter(series.values)),
+            number=1, repeat=number))
+        array_seconds = min(timeit.repeat(
+            lambda: run(requirement, normalize(series, lazy_evaluation=True)),
+            number=1, repeat=number))
+        print('  {0:<10} python {1:.3f}s  vectorized {2:.3f}s  ({3:.1f}x)'.format(
+            label, python_seconds, array_seconds, python_seconds / array_seconds))
+
+
+if __name__ == '__main__':
+    main()
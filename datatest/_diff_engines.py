@@ -0,0 +1,266 @@
+"""Sequence difference engines used to compare element order.
+
+Each engine takes two sequences, *a* and *b*, and returns a list of
+5-tuples that describe how to turn *a* into *b*. The tuples use the
+same format as difflib.SequenceMatcher.get_opcodes(): ``(tag, i1, i2,
+j1, j2)`` where *tag* is one of 'equal', 'replace', 'delete', or
+'insert'.
+"""
+from __future__ import absolute_import
+import difflib
+from bisect import bisect_left
+from ._compatibility.builtins import *
+
+
+# Sequences shorter than this are compared with difflib. At 200 items,
+# SequenceMatcher's "autojunk" heuristic begins to distort results.
+DIFFLIB_MAX_LENGTH = 200
+
+
+def _opcodes_from_blocks(blocks, len_a, len_b):
+    """Return list of opcodes built from a sorted list of matching
+    blocks--(i, j, size) triples that describe ``a[i:i+size] ==
+    b[j:j+size]``. Adjacent blocks are merged first.
+    """
+    merged = []
+    for i, j, size in blocks:
+        if merged:
+            prev_i, prev_j, prev_size = merged[-1]
+            if prev_i + prev_size == i and prev_j + prev_size == j:
+                merged[-1] = (prev_i, prev_j, prev_size + size)
+                continue
+        merged.append((i, j, size))
+    merged.append((len_a, len_b, 0))  # Sentinel (like difflib).
+
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in merged:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(('equal', ai, i, bj, j))
+    return opcodes
+
+
+def _trim_common(a, b, a0, a1, b0, b1, blocks):
+    """Record matching blocks for the common prefix and suffix of the
+    given regions and return the bounds of the remaining regions.
+    """
+    start = a0
+    while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+        a0 += 1
+        b0 += 1
+    if a0 > start:
+        blocks.append((start, b0 - (a0 - start), a0 - start))
+
+    stop = a1
+    while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+        a1 -= 1
+        b1 -= 1
+    if a1 < stop:
+        blocks.append((a1, b1, stop - a1))
+
+    return a0, a1, b0, b1
+
+
+def _middle_snake(a, a0, a1, b, b0, b1):
+    """Return the middle snake ``(x0, y0, x1, y1)`` of an optimal
+    edit path between the regions ``a[a0:a1]`` and ``b[b0:b1]`` (see
+    Myers, "An O(ND) Difference Algorithm and Its Variations", 1986).
+    Uses space linear to the lengths of the regions.
+    """
+    N = a1 - a0
+    M = b1 - b0
+    delta = N - M
+    odd = delta % 2 != 0
+    max_d = (N + M + 1) // 2
+    offset = max_d + 1
+    forward = [0] * (2 * max_d + 3)   # Furthest x along each diagonal.
+    backward = [0] * (2 * max_d + 3)  # Same, measured from the end.
+
+    for d in range(max_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < N and y < M and a[a0 + x] == b[b0 + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            if odd and delta - (d - 1) <= k <= delta + (d - 1):
+                if x + backward[offset + delta - k] >= N:
+                    return a0 + start_x, b0 + start_y, a0 + x, b0 + y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < N and y < M and a[a1 - 1 - x] == b[b1 - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            if not odd and -d <= delta - k <= d:
+                if x + forward[offset + delta - k] >= N:
+                    return a1 - x, b1 - y, a1 - start_x, b1 - start_y
+
+    raise AssertionError('middle snake not found')  # <- Unreachable.
+
+
+def _myers_blocks(a, b, a0, a1, b0, b1, blocks):
+    """Append matching blocks for the given regions to *blocks*
+    using linear-space Myers divide-and-conquer.
+    """
+    stack = [(a0, a1, b0, b1)]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+        a0, a1, b0, b1 = _trim_common(a, b, a0, a1, b0, b1, blocks)
+        if a0 == a1 or b0 == b1:
+            continue
+
+        x0, y0, x1, y1 = _middle_snake(a, a0, a1, b, b0, b1)
+        if x1 > x0:
+            blocks.append((x0, y0, x1 - x0))
+        stack.append((x1, a1, y1, b1))
+        stack.append((a0, x0, b0, y0))
+
+
+def _unique_positions(seq, start, stop):
+    """Return dictionary of values that appear exactly once in
+    ``seq[start:stop]`` mapped to their positions.
+    """
+    positions = {}
+    duplicates = set()
+    for index in range(start, stop):
+        value = seq[index]
+        if value in positions:
+            duplicates.add(value)
+        else:
+            positions[value] = index
+    for value in duplicates:
+        del positions[value]
+    return positions
+
+
+def _patience_anchors(a, b, a0, a1, b0, b1):
+    """Return a list of (i, j) positions for values that are unique
+    in both regions and that form the longest increasing sequence
+    of matches (in the order of *a*).
+    """
+    unique_b = _unique_positions(b, b0, b1)
+    if not unique_b:
+        return []
+    unique_a = _unique_positions(a, a0, a1)
+    pairs = sorted((i, unique_b[value]) for value, i in unique_a.items()
+                   if value in unique_b)
+
+    # Patience sorting to find the longest increasing subsequence.
+    tails = []         # Smallest j value ending a run of each length.
+    tail_indexes = []  # Index into *pairs* of each tail.
+    previous = [None] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        position = bisect_left(tails, j)
+        if position:
+            previous[index] = tail_indexes[position - 1]
+        if position == len(tails):
+            tails.append(j)
+            tail_indexes.append(index)
+        else:
+            tails[position] = j
+            tail_indexes[position] = index
+
+    anchors = []
+    index = tail_indexes[-1] if tail_indexes else None
+    while index is not None:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _patience_blocks(a, b, a0, a1, b0, b1, blocks):
+    """Append matching blocks for the given regions to *blocks*
+    using patience diff. Regions without unique anchors are
+    compared using Myers' algorithm.
+    """
+    stack = [(a0, a1, b0, b1)]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+        a0, a1, b0, b1 = _trim_common(a, b, a0, a1, b0, b1, blocks)
+        if a0 == a1 or b0 == b1:
+            continue
+
+        anchors = _patience_anchors(a, b, a0, a1, b0, b1)
+        if not anchors:
+            _myers_blocks(a, b, a0, a1, b0, b1, blocks)
+            continue
+
+        for i, j in anchors:
+            stack.append((a0, i, b0, j))
+            blocks.append((i, j, 1))
+            a0, b0 = i + 1, j + 1
+        stack.append((a0, a1, b0, b1))
+
+
+def difflib_opcodes(a, b):
+    """Return opcodes using difflib.SequenceMatcher."""
+    return difflib.SequenceMatcher(a=a, b=b).get_opcodes()
+
+
+def myers_opcodes(a, b):
+    """Return opcodes using a linear-space variant of Myers' O(ND)
+    difference algorithm. Elements need only support equality.
+    """
+    blocks = []
+    _myers_blocks(a, b, 0, len(a), 0, len(b), blocks)
+    blocks.sort()
+    return _opcodes_from_blocks(blocks, len(a), len(b))
+
+
+def patience_opcodes(a, b):
+    """Return opcodes using patience diff. Elements must be hashable."""
+    blocks = []
+    _patience_blocks(a, b, 0, len(a), 0, len(b), blocks)
+    blocks.sort()
+    return _opcodes_from_blocks(blocks, len(a), len(b))
+
+
+def auto_opcodes(a, b):
+    """Return opcodes using an engine selected by size: difflib
+    for short sequences and patience diff for longer ones.
+    """
+    if len(a) < DIFFLIB_MAX_LENGTH and len(b) < DIFFLIB_MAX_LENGTH:
+        return difflib_opcodes(a, b)
+    return patience_opcodes(a, b)
+
+
+ENGINES = {
+    'auto': auto_opcodes,
+    'difflib': difflib_opcodes,
+    'myers': myers_opcodes,
+    'patience': patience_opcodes,
+}
+
+
+def get_engine(engine):
+    """Return opcodes function for the given *engine* name. If
+    *engine* is callable, it is returned unchanged.
+    """
+    if callable(engine):
+        return engine
+    try:
+        return ENGINES[engine]
+    except KeyError:
+        names = ', '.join(repr(x) for x in sorted(ENGINES))
+        msg = 'engine must be callable or one of {0}, got {1!r}'
+        raise ValueError(msg.format(names, engine))
@@ -0,0 +1,145 @@
+"""Fuzzy string matching used by RequiredFuzzy and AcceptedFuzzy.
+
+Strings are similar when ``difflib.SequenceMatcher(a=a, b=b).ratio()``
+is greater than or equal to a given cutoff. The objects in this module
+give the same results while doing less work per comparison.
+"""
+from __future__ import absolute_import
+from __future__ import division
+import difflib
+from ._compatibility.builtins import *
+from ._utils import string_types
+
+
+# FuzzyMatcher builds a new SequenceMatcher for each comparison. Keeping
+# one SequenceMatcher per expected string (via set_seq2()) would be
+# cheaper, but RequiredFuzzy compares SequenceMatcher(a=expected, b=value)
+# and ratio() is not symmetric, so the expected string must stay seq1.
+# With the data value as seq2, a per-seq2 cache would almost never be
+# reused.
+class FuzzyMatcher(object):
+    """Callable that returns True if strings *a* and *b* match with
+    a similarity ratio greater than or equal to *cutoff*.
+
+    The cheaper real_quick_ratio() and quick_ratio() upper bounds are
+    checked against the cutoff before computing the full ratio(), and
+    results are cached for each (a, b) pair.
+
+    The cache holds up to *maxsize* results. When it is full, it is
+    cleared.
+    """
+    def __init__(self, cutoff=0.6, maxsize=4096):
+        self.cutoff = cutoff
+        self.maxsize = maxsize
+        self._results = {}
+
+    def _compare(self, a, b):
+        cutoff = self.cutoff
+        try:
+            matcher = difflib.SequenceMatcher(a=a, b=b)
+            return (matcher.real_quick_ratio() >= cutoff
+                    and matcher.quick_ratio() >= cutoff
+                    and matcher.ratio() >= cutoff)
+        except TypeError:
+            return False
+
+    def __call__(self, a, b):
+        try:
+            return self._results[(a, b)]
+        except KeyError:
+            result = self._compare(a, b)
+            if len(self._results) >= self.maxsize:
+                self._results.clear()
+            self._results[(a, b)] = result
+            return result
+        except TypeError:  # Unhashable values are not cached.
+            return self._compare(a, b)
+
+
+def _bigram_counts(string):
+    counts = {}
+    for i in range(len(string) - 1):
+        gram = string[i:i + 2]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class FuzzyIndex(object):
+    """Callable that returns True if a value matches any string in
+    *members* with a similarity ratio greater than or equal to
+    *cutoff* (values are compared as ``matcher(member, value)``).
+
+    An inverted index of character bigrams is used to find plausible
+    candidates. If two strings of lengths *la* and *lb* have *M*
+    matching characters, they share at least ``3*M - la - lb - 1``
+    bigrams (every matching block of size *n* shares ``n - 1``
+    bigrams and there can be no more blocks than unmatched characters
+    plus one). Since a ratio of at least *cutoff* requires that *M* is
+    at least ``cutoff * (la + lb) / 2``, members that share too few
+    bigrams (or whose lengths are too different) are never compared.
+    """
+    def __init__(self, members, cutoff=0.6, matcher=None):
+        self.members = frozenset(members)
+        self.cutoff = cutoff
+        self._matcher = matcher or FuzzyMatcher(cutoff)
+
+        by_length = {}
+        postings = {}
+        for member in self.members:
+            by_length.setdefault(len(member), []).append(member)
+            for gram, count in _bigram_counts(member).items():
+                postings.setdefault(gram, []).append((member, count))
+        self._by_length = by_length
+        self._postings = postings
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        members = sorted(self.members)
+        return '{0}({1!r}, cutoff={2!r})'.format(cls_name, members, self.cutoff)
+
+    def _is_possible_length(self, la, lb):
+        return 2 * min(la, lb) >= self.cutoff * (la + lb)
+
+    def _required_bigrams(self, la, lb):
+        return 1.5 * self.cutoff * (la + lb) - la - lb - 1
+
+    def __call__(self, value):
+        members = self.members
+        try:
+            if value in members:
+                return True
+        except TypeError:
+            return False
+
+        if not isinstance(value, string_types):
+            return value == members  # <- Same as set predicate.
+
+        matcher = self._matcher
+        la = len(value)
+
+        # Members of lengths that need no shared bigrams are all checked.
+        checked_lengths = set()
+        for lb, group in self._by_length.items():
+            if not self._is_possible_length(la, lb):
+                continue
+            if self._required_bigrams(la, lb) <= 0:
+                checked_lengths.add(lb)
+                for member in group:
+                    if matcher(member, value):
+                        return True
+
+        # Otherwise, only members that share enough bigrams are checked.
+        postings = self._postings
+        shared = {}
+        for gram, count in _bigram_counts(value).items():
+            for member, member_count in postings.get(gram, ()):
+                shared[member] = shared.get(member, 0) + min(count, member_count)
+
+        candidates = sorted(shared.items(), key=lambda x: -x[1])
+        for member, count in candidates:
+            lb = len(member)
+            if lb in checked_lengths or not self._is_possible_length(la, lb):
+                continue
+            if count >= self._required_bigrams(la, lb) and matcher(member, value):
+                return True
+        return False
@@ -1,10 +1,14 @@
 """Normalize objects for validation."""
 
 import sys
+from operator import itemgetter
+from ._compatibility.builtins import *
 from ._compatibility.collections.abc import Collection
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Iterator
 from ._compatibility.collections.abc import Mapping
+from ._compatibility.functools import partial
+from ._compatibility.itertools import chain
 
 from ._utils import exhaustible
 from ._utils import iterpeek
@@ -29,9 +33,214 @@ class TypedIterator(Iterator):
         return self.evaltype(self._iterator)
 
 
+class ArrayIterator(TypedIterator):
+    """A TypedIterator over a one-dimensional NumPy array or pandas
+    ExtensionArray. The array itself is kept as *array* so it can be
+    checked in bulk until iteration has started.
+    """
+    def __init__(self, array):
+        self.array = array
+        self.started = False
+
+        def arrays():
+            self.started = True
+            yield array
+
+        iterator = chain.from_iterable(arrays())
+        super(ArrayIterator, self).__init__(iterator, evaltype=list)
+
+
 NoneType = type(None)
 
 
+def _is_extension_array(obj):
+    """Return True if *obj* is a pandas ExtensionArray (like the values
+    of a Series with a "category", "string", or nullable dtype).
+    """
+    pandas = sys.modules.get('pandas', None)
+    try:
+        extension_array = pandas.api.extensions.ExtensionArray
+    except AttributeError:
+        return False  # <- Pandas is not loaded or is too old.
+    return isinstance(obj, extension_array)
+
+
+# Number of DataFrame rows to read at a time. Only one chunk is
+# consolidated into an array at a time so memory use stays bounded
+# for large mixed-type frames.
+DATAFRAME_CHUNK_SIZE = 65536
+
+
+def _iter_dataframe_chunks(frame, chunksize=None, tolist=False):
+    """Yield ``(chunk, columns)`` pairs for consecutive row chunks of
+    *frame* (defaults to DATAFRAME_CHUNK_SIZE rows) where *columns*
+    is a list containing a list of values for each column.
+
+    Values have the same types as those in DataFrame.values (e.g.,
+    NumPy scalars for homogeneous numeric frames but Python objects
+    and Timestamps for mixed-type frames). If *tolist* is True, values
+    are converted to Python scalars instead (like itertuples()).
+    """
+    if chunksize is None:
+        chunksize = DATAFRAME_CHUNK_SIZE
+    positions = range(len(frame.columns))
+    for start in range(0, len(frame), chunksize):
+        chunk = frame.iloc[start:start + chunksize]
+        if tolist:
+            columns = [chunk.iloc[:, i].tolist() for i in positions]
+        else:
+            values = chunk.values  # <- Consolidates this chunk only.
+            columns = [list(values[:, i]) for i in positions]
+        yield chunk, columns
+
+
+def _iter_rows(column_chunks):
+    """Return an iterator of rows built from an iterable of column
+    lists. Rows from a single column are unwrapped.
+    """
+    def rows_in(columns):
+        if len(columns) == 1:
+            return columns[0]
+        return zip(*columns)
+    return chain.from_iterable(rows_in(columns) for columns in column_chunks)
+
+
+class ColumnIterator(TypedIterator):
+    """A TypedIterator over the rows of a DataFrame that can also
+    provide its values column-wise (see iter_columns()). Only one
+    of the two forms should be consumed.
+    """
+    def __init__(self, frame, chunksize=None):
+        self.frame = frame
+        self.chunksize = chunksize
+        rows = _iter_rows(self.iter_columns())
+        super(ColumnIterator, self).__init__(rows, evaltype=list)
+
+    def iter_columns(self):
+        """Return an iterator of row chunks, each given as a list
+        of equal-length column lists.
+        """
+        chunks = _iter_dataframe_chunks(self.frame, self.chunksize)
+        return (columns for _, columns in chunks)
+
+
+class ChunkedColumnIterator(ColumnIterator):
+    """A ColumnIterator over the rows of an iterator of DataFrames
+    (like the chunks read by pandas.read_csv() with a *chunksize*).
+    Frames are read one at a time as the rows are consumed.
+    """
+    def __init__(self, frames, chunksize=None):
+        self.frames = frames
+        super(ChunkedColumnIterator, self).__init__(None, chunksize)
+
+    def iter_columns(self):
+        """Return an iterator of row chunks, each given as a list
+        of equal-length column lists.
+        """
+        chunks = chain.from_iterable(
+            _iter_dataframe_chunks(frame, self.chunksize) for frame in self.frames
+        )
+        return (columns for _, columns in chunks)
+
+
+def _iter_dataframe_items(frame):
+    """Return an iterator of (index value, row) items for *frame*."""
+    chunks = _iter_dataframe_chunks(frame, tolist=True)
+    return chain.from_iterable(
+        zip(chunk.index.tolist(), _iter_rows([columns]))
+        for chunk, columns in chunks
+    )
+
+
+def _iter_series_items(series):
+    """Return an iterator of (index value, value) items for *series*."""
+    items = getattr(series, 'iteritems', None)  # <- Removed in pandas 2.0.
+    if items is None:
+        items = series.items
+    return items()
+
+
+def _iter_checked_chunks(chunks, chunk_type, is_mapping):
+    """Yield chunks from an iterator of DataFrame or Series *chunks*
+    after checking that each is an instance of *chunk_type*. When
+    *is_mapping* is True, index values must be unique across all of
+    the chunks.
+    """
+    seen_keys = set()
+    for chunk in chunks:
+        if not isinstance(chunk, chunk_type):
+            msg = 'chunks must all be {0} objects, got {1}'
+            raise TypeError(msg.format(chunk_type.__name__,
+                                       chunk.__class__.__name__))
+
+        if is_mapping:
+            keys = chunk.index.tolist()
+            if not chunk.index.is_unique or not seen_keys.isdisjoint(keys):
+                msg = '{0} index contains duplicates, must be unique'
+                raise ValueError(msg.format(chunk_type.__name__))
+            seen_keys.update(keys)
+        yield chunk
+
+
+def _normalize_chunks(chunks):
+    """Return a single iterator for an iterator of DataFrame or Series
+    *chunks* that are treated as one dataset. Chunks are normalized as
+    they are consumed so only one needs to be held in memory at a time.
+
+    The first chunk decides how every chunk is read: if it has a
+    RangeIndex, the rows of all chunks are treated as one iterator,
+    otherwise all chunks are treated as one mapping.
+    """
+    pandas = sys.modules['pandas']
+    first, chunks = iterpeek(chunks)
+    if isinstance(first, pandas.DataFrame):
+        chunk_type = pandas.DataFrame
+        get_items = _iter_dataframe_items
+    else:
+        chunk_type = pandas.Series
+        get_items = _iter_series_items
+    is_mapping = not isinstance(first.index, pandas.RangeIndex)
+    chunks = _iter_checked_chunks(chunks, chunk_type, is_mapping)
+
+    if is_mapping:
+        return IterItems(chain.from_iterable(get_items(x) for x in chunks))
+
+    if chunk_type is pandas.DataFrame:
+        return ChunkedColumnIterator(chunks)
+    values = chain.from_iterable(x.values for x in chunks)
+    return TypedIterator(values, evaltype=list)
+
+
+def _cursor_rows(cursor):
+    """Return an iterator of rows retrieved from *cursor* in batches
+    using fetchmany(). Batches use the cursor's arraysize unless it is
+    missing or left at the DBAPI2 default of 1, in which case 1000
+    rows are retrieved at a time.
+    """
+    size = getattr(cursor, 'arraysize', None)
+    if not size or size == 1:
+        size = 1000
+    fetch = partial(cursor.fetchmany, size)
+
+    def batches():
+        while True:
+            rows = fetch()
+            if not rows:
+                return
+            yield rows
+
+    return chain.from_iterable(batches())
+
+
+def _cursor_rows_fetchone(cursor):
+    """Return a generator of rows retrieved using fetchone()."""
+    while True:
+        row = cursor.fetchone()
+        if row is None:
+            break
+        yield row
+
+
 def _normalize_lazy(obj):
     """Return an iterator for lazy evaluation."""
     if isinstance(obj, TypedIterator):
@@ -62,18 +271,10 @@ def _normalize_lazy(obj):
 
             if isinstance(obj.index, pandas.RangeIndex):
                 # DataFrame with RangeIndex is treated as an iterator.
-                if len(obj.columns) == 1:
-                    obj = (x[0] for x in obj.values)
-                else:
-                    obj = (tuple(x) for x in obj.values)
-                return TypedIterator(obj, evaltype=list)  # <- EXIT!
+                return ColumnIterator(obj)  # <- EXIT!
             else:
                 # DataFrame with another index type is treated as a mapping.
-                if len(obj.columns) == 1:
-                    gen = ((x[0], x[1]) for x in obj.itertuples())
-                else:
-                    gen = ((x[0], tuple(x[1:])) for x in obj.itertuples())
-                return IterItems(gen)  # <- EXIT!
+                return IterItems(_iter_dataframe_items(obj))  # <- EXIT!
         elif isinstance(obj, pandas.Series):
             if not obj.index.is_unique:
                 msg = '{0} index contains duplicates, must be unique'
@@ -81,10 +282,16 @@ def _normalize_lazy(obj):
 
             if isinstance(obj.index, pandas.RangeIndex):
                 # Series with RangeIndex is treated as an iterator.
-                return TypedIterator(obj.values, evaltype=list)  # <- EXIT!
+                values = obj.values
+                numpy = sys.modules.get('numpy', None)
+                if numpy and isinstance(values, numpy.ndarray) and values.ndim == 1:
+                    return ArrayIterator(values)  # <- EXIT!
+                if _is_extension_array(values):
+                    return ArrayIterator(values)  # <- EXIT!
+                return TypedIterator(values, evaltype=list)  # <- EXIT!
             else:
                 # Series with another index type is treated as a mapping.
-                return IterItems(obj.iteritems())  # <- EXIT!
+                return IterItems(_iter_series_items(obj))  # <- EXIT!
 
     numpy = sys.modules.get('numpy', None)
     if numpy and isinstance(obj, numpy.ndarray):
@@ -97,27 +304,31 @@ def _normalize_lazy(obj):
         if obj.ndim == 1:
             if len(obj.dtype) == 1:        # Unpack single-valued recarray
                 obj = (x[0] for x in obj)  # or structured array.
-            else:
-                obj = iter(obj)
-            return TypedIterator(obj, evaltype=list)  # <- EXIT!
+                return TypedIterator(obj, evaltype=list)  # <- EXIT!
+            return ArrayIterator(obj)  # <- EXIT!
 
     # Check for cursor-like object (if obj has DBAPI2 cursor attributes).
     if all(hasattr(obj, n) for n in ('fetchone', 'execute',
                                      'rowcount', 'description')):
-        if not isinstance(obj, Iterable):
-            def cursor_to_gen(cursor):       # While most cursor objects are
-                while True:                  # iterable, it is not required
-                    row = cursor.fetchone()  # by the DBAPI2 specification.
-                    if row is None:
-                        break
-                    yield row
-            obj = cursor_to_gen(obj)
+        if not isinstance(obj, Iterable):  # While most cursor objects are
+            if hasattr(obj, 'fetchmany'):  # iterable, it is not required
+                obj = _cursor_rows(obj)    # by the DBAPI2 specification.
+            else:
+                obj = _cursor_rows_fetchone(obj)
 
         first, obj = iterpeek(obj)
         if first and len(first) == 1:
-            obj = iter(x[0] for x in obj)  # Unwrap single-value records.
+            obj = map(itemgetter(0), obj)  # Unwrap single-value records.
         return obj  # <- EXIT!
 
+    # Check for an iterator (like a generator or the TextFileReader
+    # returned by pandas.read_csv() with a chunksize) that provides
+    # DataFrame or Series chunks. Only checked if pandas is loaded.
+    if pandas and isinstance(obj, Iterator) and not isinstance(obj, IterItems):
+        first, obj = iterpeek(obj)
+        if isinstance(first, (pandas.DataFrame, pandas.Series)):
+            return _normalize_chunks(obj)  # <- EXIT!
+
     return obj
 
 
@@ -23,121 +23,156 @@ class ValidationAccessor(object):
     # adding any useful information. This should be avoided--even at the cost
     # of some code duplication.
 
-    def __call__(self, requirement, msg=None):
+    def __call__(self, requirement, msg=None, max_differences=None):
         try:
-            return validate(self._data, requirement, msg=msg)
+            return validate(self._data, requirement, msg=msg,
+                            max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def predicate(self, requirement, msg=None):
+    def predicate(self, requirement, msg=None, max_differences=None):
         """Check that elements satisfy predicate requirement."""
         try:
-            return validate.predicate(self._data, requirement, msg=msg)
+            return validate.predicate(self._data, requirement, msg=msg,
+                                      max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def regex(self, requirement, flags=0, msg=None):
+    def regex(self, requirement, flags=0, msg=None, max_differences=None):
         """Check that elements match regex requirement."""
         try:
-            return validate.regex(self._data, requirement, flags=flags, msg=msg)
+            return validate.regex(self._data, requirement, flags=flags, msg=msg,
+                                  max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def approx(self, requirement, places=None, msg=None, delta=None):
+    def approx(self, requirement, places=None, msg=None, delta=None,
+               max_differences=None):
         """Check that elements approximately match requirement."""
         try:
-            return validate.approx(self._data, requirement, places=places, msg=msg, delta=delta)
+            return validate.approx(self._data, requirement, places=places, msg=msg,
+                                   delta=delta, max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def fuzzy(self, requirement, cutoff=0.6, msg=None):
+    def fuzzy(self, requirement, cutoff=0.6, msg=None, max_differences=None):
         """Check that strings are similar to requirement strings.
         Strings are considered similar if they measure equal to or
         greater than cutoff (default 0.6) as determined by the
         difflib.SequenceMatcher class (from the Standard Library).
         """
         try:
-            return validate.fuzzy(self._data, requirement, cutoff=cutoff, msg=msg)
+            return validate.fuzzy(self._data, requirement, cutoff=cutoff, msg=msg,
+                                  max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def interval(self, min=None, max=None, msg=None):
+    def interval(self, min=None, max=None, msg=None, max_differences=None):
         """Check that element values are within the given interval."""
         try:
-            return validate.interval(self._data, min=min, max=max, msg=msg)
+            return validate.interval(self._data, min=min, max=max, msg=msg,
+                                     max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def set(self, requirement, msg=None):
+    def set(self, requirement, msg=None, max_differences=None):
         """Check that set of elements equals *requirement* set."""
         try:
-            return validate.set(self._data, requirement, msg=msg)
+            return validate.set(self._data, requirement, msg=msg,
+                                max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def subset(self, requirement, msg=None):
+    def subset(self, requirement, msg=None, max_differences=None):
         """Check that data elements are a subset of *requirement*."""
         try:
-            return validate.subset(self._data, requirement, msg=msg)
+            return validate.subset(self._data, requirement, msg=msg,
+                                   max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def superset(self, requirement, msg=None):
+    def superset(self, requirement, msg=None, max_differences=None):
         """Check that data is a superset of *requirement* elements."""
         try:
-            return validate.superset(self._data, requirement, msg=msg)
+            return validate.superset(self._data, requirement, msg=msg,
+                                     max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def unique(self, msg=None):
+    def unique(self, msg=None, max_differences=None):
         """Check that elements are unique."""
         try:
-            return validate.unique(self._data, msg=msg)
+            return validate.unique(self._data, msg=msg,
+                                   max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
-    def order(self, requirement, msg=None):
+    def order(self, requirement, msg=None, max_differences=None):
         """Check that elements match the relative order of requirement
         elements.
         """
         try:
-            return validate.order(self._data, requirement, msg=msg)
+            return validate.order(self._data, requirement, msg=msg,
+                                  max_differences=max_differences)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
             err.__cause__ = None
             raise err
 
+    def sorted(self, key=None, reverse=False, strict=False, msg=None,
+               max_differences=None):
+        """Check that elements are in sorted order."""
+        try:
+            return validate.sorted(self._data, key=key, reverse=reverse,
+                                   strict=strict, msg=msg,
+                                   max_differences=max_differences)
+        except ValidationError as err:
+            __tracebackhide__ = True
+            err.__traceback__ = None
+            err.__cause__ = None
+            raise err
+
+    def all(self, requirement, msg=None, max_differences=None):
+        """Check that data satisfies every requirement in *requirement*."""
+        try:
+            return validate.all(self._data, requirement, msg=msg,
+                                max_differences=max_differences)
+        except ValidationError as err:
+            __tracebackhide__ = True
+            err.__traceback__ = None
+            err.__cause__ = None
+            raise err
 
 # From the documented Pandas API, it's not entirely clear that
 # a single class is intended to be registered as an accessor on
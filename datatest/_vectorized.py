@@ -0,0 +1,228 @@
+"""Vectorized helpers for checking NumPy arrays in bulk.
+
+These functions are used by requirement classes when a group of data
+is a one-dimensional NumPy array (including the values of a pandas
+Series) or, for type checks, a pandas ExtensionArray. They only
+decide which positions need attention--difference objects are
+still built by the requirements' own element-wise code, so results
+are the same as when the array is checked one element at a time.
+
+NumPy is never imported here. If it has not already been imported by
+the user (directly or through pandas), arrays can not be present and
+every helper returns None.
+"""
+from __future__ import absolute_import
+import sys
+from numbers import Integral
+
+from ._normalize import ArrayIterator
+from ._normalize import _is_extension_array
+
+
+_NUMERIC_KINDS = 'iuf'           # Signed/unsigned integers and floats.
+_DISTINCT_KINDS = 'biufSU'       # Kinds that np.unique() can handle.
+
+# Names of pandas.arrays classes whose non-missing elements all have
+# the same type (as produced by iteration).
+_UNIFORM_EXTENSION_ARRAYS = (
+    'IntegerArray',
+    'FloatingArray',
+    'BooleanArray',
+    'StringArray',
+    'ArrowStringArray',
+)
+
+
+def _unwrap(group):
+    """Return the array of an ArrayIterator if none of its elements
+    have been consumed, otherwise return *group* unchanged.
+    """
+    if isinstance(group, ArrayIterator):
+        if group.started:
+            return None  # <- Some elements were already consumed.
+        return group.array
+    return group
+
+
+def as_array(group):
+    """Return *group* as a one-dimensional NumPy array or None if it
+    is not array-backed. An ArrayIterator is only unwrapped if none
+    of its elements have been consumed.
+    """
+    numpy = sys.modules.get('numpy', None)
+    if numpy is None:
+        return None
+
+    group = _unwrap(group)
+    if (isinstance(group, numpy.ndarray)
+            and group.ndim == 1
+            and not group.dtype.names):
+        return group
+    return None
+
+
+def _is_real_bound(obj):
+    numpy = sys.modules['numpy']
+    if isinstance(obj, bool):
+        return False
+    return isinstance(obj, (Integral, float, numpy.floating))
+
+
+def uniform_mask(array, check):
+    """Return a mask marking every position as a candidate failure if
+    *check* (a function returning a difference or None) fails for the
+    first element, or no positions if it passes. Only valid when the
+    result of *check* depends on the element's type alone and every
+    element has the same type (any dtype except object).
+    """
+    numpy = sys.modules['numpy']
+    if array.dtype.kind == 'O':
+        return None
+    if not len(array) or check(array[0]) is None:
+        return numpy.zeros(len(array), dtype=bool)
+    return numpy.ones(len(array), dtype=bool)
+
+
+def as_extension_array(group):
+    """Return *group* as a pandas ExtensionArray or None if it is not
+    backed by one. Like as_array(), an ArrayIterator is only unwrapped
+    if none of its elements have been consumed.
+    """
+    if 'numpy' not in sys.modules:
+        return None
+    group = _unwrap(group)
+    if _is_extension_array(group):
+        return group
+    return None
+
+
+def extension_type_mask(array, check):
+    """Return a mask of positions in a pandas ExtensionArray that
+    might not satisfy *check* (a function returning a difference or
+    None) or None if the array's dtype can not decide it. Like
+    uniform_mask(), the result of *check* must depend on the element's
+    type alone.
+
+    The dtype lets non-missing elements be decided without visiting
+    them: each category of a Categorical is checked once and, for a
+    nullable or string array, only the first non-missing element is
+    checked. Missing values are always marked.
+    """
+    numpy = sys.modules['numpy']
+    pandas = sys.modules['pandas']
+
+    if isinstance(array, pandas.Categorical):
+        failing = [code for code, category in
+                   enumerate(array.categories.tolist())
+                   if check(category) is not None]
+        failing.append(-1)  # <- Code of missing values.
+        return numpy.isin(numpy.asarray(array.codes), failing)
+
+    arrays = getattr(pandas, 'arrays', None)
+    uniform_types = tuple(getattr(arrays, name) for name in
+                          _UNIFORM_EXTENSION_ARRAYS if hasattr(arrays, name))
+    if not uniform_types or not isinstance(array, uniform_types):
+        return None
+
+    missing = numpy.asarray(array.isna(), dtype=bool)
+    for element, is_missing in zip(array, missing):
+        if not is_missing:
+            if check(element) is not None:
+                return numpy.ones(len(array), dtype=bool)
+            break
+    return missing
+
+
+def interval_mask(array, min=None, max=None):
+    """Return a mask of positions that may fall outside the interval
+    from *min* to *max* (either can be None) or None if the array or
+    bounds are not supported.
+    """
+    numpy = sys.modules['numpy']
+    if array.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    for bound in (min, max):
+        if bound is not None and not _is_real_bound(bound):
+            return None
+
+    try:
+        with numpy.errstate(all='ignore'):
+            inside = numpy.ones(len(array), dtype=bool)
+            if min is not None:
+                inside &= array >= min
+            if max is not None:
+                inside &= array <= max
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return ~inside
+
+
+def approx_mask(array, expected, places=7, delta=None):
+    """Return a mask of positions that may not be approximately equal
+    to *expected* or None if the array or arguments are not supported.
+
+    The mask is conservative: values that are close to the rounding or
+    delta threshold are marked so the exact element-wise check can
+    decide them.
+    """
+    numpy = sys.modules['numpy']
+    if array.dtype.kind not in _NUMERIC_KINDS or not _is_real_bound(expected):
+        return None
+    if delta is not None and not _is_real_bound(delta):
+        return None
+
+    if delta is None:
+        threshold = 0.4 * 10.0 ** -places  # <- Always rounds to zero.
+    else:
+        threshold = delta
+
+    try:
+        with numpy.errstate(all='ignore'):
+            close = numpy.abs(array - expected) < threshold
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return ~close
+
+
+def _first_positions(array):
+    """Return a sorted array of the positions where each distinct
+    value first appears or None if the array is not supported.
+    """
+    numpy = sys.modules['numpy']
+    kind = array.dtype.kind
+    if kind not in _DISTINCT_KINDS:
+        return None
+    if kind == 'f' and numpy.isnan(array).any():
+        return None  # <- Each NaN is distinct when compared in Python.
+
+    _, positions = numpy.unique(array, return_index=True)
+    positions.sort()
+    return positions
+
+
+def distinct_elements(array):
+    """Return a list of the distinct elements in *array* in the order
+    they first appear or None if the array is not supported.
+    """
+    positions = _first_positions(array)
+    if positions is None:
+        return None
+    return [array[i] for i in positions]
+
+
+def duplicate_positions(array):
+    """Return an array of positions whose values already appeared
+    earlier in *array* or None if the array is not supported.
+    """
+    numpy = sys.modules['numpy']
+    positions = _first_positions(array)
+    if positions is None:
+        return None
+    mask = numpy.ones(len(array), dtype=bool)
+    mask[positions] = False
+    return numpy.flatnonzero(mask)
+
+
+def masked_positions(mask):
+    """Return an array of positions that are set in *mask*."""
+    return sys.modules['numpy'].flatnonzero(mask)
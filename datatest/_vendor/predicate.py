@@ -95,6 +95,23 @@ def _check_set(set_, value):
         return False
 
 
+def _get_type_alternatives(type_):
+    """Return *type_* or, if NumPy is loaded and *type_* is one of
+    the builtin scalar types, a tuple that also contains the
+    equivalent NumPy base type.
+    """
+    if 'numpy' in sys.modules:
+        if type_ is str:
+            return (str, sys.modules['numpy'].character)
+        elif type_ is int:
+            return (int, sys.modules['numpy'].integer)
+        elif type_ is float:
+            return (float, sys.modules['numpy'].floating)
+        elif type_ is complex:
+            return (complex, sys.modules['numpy'].complexfloating)
+    return type_
+
+
 def _get_matcher_parts(obj):
     """Return a 2-tuple containing a handler function (to check for
     matches) and a string (to use for displaying a user-readable
@@ -102,19 +119,7 @@ def _get_matcher_parts(obj):
     and requires no other special handling.
     """
     if isinstance(obj, type):
-        if 'numpy' in sys.modules:
-            if obj is str:
-                alt_obj = (str, sys.modules['numpy'].character)
-            elif obj is int:
-                alt_obj = (int, sys.modules['numpy'].integer)
-            elif obj is float:
-                alt_obj = (float, sys.modules['numpy'].floating)
-            elif obj is complex:
-                alt_obj = (complex, sys.modules['numpy'].complexfloating)
-            else:
-                alt_obj = obj
-        else:
-            alt_obj = obj
+        alt_obj = _get_type_alternatives(obj)
         pred_handler = lambda x: _check_type(alt_obj, x)
         repr_string = getattr(obj, '__name__', repr(obj))
     elif callable(obj):
@@ -151,6 +156,144 @@ def _get_matcher_or_original(obj):
     return obj
 
 
+def _compile_element(obj):
+    """Return a function of one argument that checks a value against
+    *obj* with the same result as the handler from _get_matcher_parts()
+    but without going through MatcherObject.__eq__() and the generic
+    _check_*() helpers. Return None if *obj* requires no special
+    handling and can be matched with the "==" operator.
+    """
+    if isinstance(obj, type):
+        alt_obj = _get_type_alternatives(obj)
+        if alt_obj is obj:
+            def check_type(value):
+                return value is obj or isinstance(value, obj)
+        else:
+            def check_type(value):
+                return isinstance(value, alt_obj)  # <- Tuple is never value.
+        return check_type
+
+    if isinstance(obj, Predicate):
+        pred = obj
+        compiled = pred.compile()
+        def check_predicate(value):
+            return value is pred or compiled(value)
+        return check_predicate
+
+    if callable(obj):
+        def check_callable(value):
+            return value is obj or obj(value)
+        return check_callable
+
+    if obj is Ellipsis:
+        return _check_wildcard
+    if obj is True:
+        return bool
+    if obj is False:
+        return _check_falsy
+    if _check_nan(obj):
+        return _check_nan
+
+    if isinstance(obj, regex_types):
+        search = obj.search
+        def check_regex(value):
+            try:
+                return search(value) is not None
+            except TypeError:
+                return value is obj
+        return check_regex
+
+    if isinstance(obj, set):
+        def check_set(value):
+            try:
+                return value in obj or value == obj
+            except TypeError:
+                return False
+        return check_set
+
+    return None
+
+
+_tuple_template = """
+def check_tuple(other):
+    if not isinstance(other, tuple):
+        return matcher == other  # <- Let the other object decide.
+    if len(other) != {size}:
+        return False
+    {values}, = other
+    return bool({conditions})
+"""
+
+
+def _compile_tuple(obj, matcher):
+    """Return a function that checks a tuple of values against the
+    tuple of predicate objects *obj* (whose MatcherTuple is given as
+    *matcher*). Like tuple comparison, values are matched positionally
+    and identical objects always match.
+
+    The function's source is generated so that each position is
+    checked inline (without looping or dispatching through matcher
+    objects): type checks become isinstance() calls, wildcards are
+    skipped entirely, and other objects are called or compared
+    directly.
+    """
+    namespace = {'matcher': matcher}
+    values = []
+    conditions = []
+    for index, item in enumerate(obj):
+        value = 'v{0}'.format(index)
+        name = 'o{0}'.format(index)
+        values.append(value)
+
+        if item is Ellipsis:
+            continue  # <- Wildcard matches everything.
+
+        if isinstance(item, type):
+            alt_item = _get_type_alternatives(item)
+            namespace[name] = alt_item
+            if alt_item is item:
+                condition = '({0} is {1} or isinstance({0}, {1}))'
+            else:
+                condition = 'isinstance({0}, {1})'
+        else:
+            check = _compile_element(item)
+            if check is None:
+                namespace[name] = item
+                condition = '({0} is {1} or {1} == {0})'
+            else:
+                namespace[name] = check
+                condition = '{1}({0})'
+        conditions.append(condition.format(value, name))
+
+    source = _tuple_template.format(
+        size=len(obj),
+        values=', '.join(values),
+        conditions=' and '.join(conditions) or 'True',
+    )
+    exec(source, namespace)
+    return namespace['check_tuple']
+
+
+def _compile_positions(obj):
+    """Return a list of functions, one for each position in the tuple
+    of predicate objects *obj*, that check a single value with the
+    same result as that position of _compile_tuple(). Wildcard
+    positions are given as None.
+    """
+    checks = []
+    for item in obj:
+        if item is Ellipsis:
+            checks.append(None)
+            continue
+
+        check = _compile_element(item)
+        if check is None:
+            def check(value, item=item):
+                return value is item or item == value
+        checks.append(check)
+    return checks
+
+
 def get_matcher(obj):
     """Return an object suitable for comparing against other objects
     using the "==" operator.
@@ -322,6 +465,46 @@ class Predicate(object):
             return not is_match
         return is_match
 
+    def compile(self):
+        """Return a function of one argument that gives the same
+        results as the predicate itself. The returned function is
+        specialized for the predicate's objects so it does not need
+        to dispatch through matcher objects on each call::
+
+            >>> pred = Predicate((str, int))
+            >>> check = pred.compile()
+            >>> check(('A', 1))
+            True
+            >>> check(('A', 'B'))
+            False
+
+        The function is built once and does not reflect changes made
+        to the predicate afterward.
+        """
+        matcher = self.matcher
+        if isinstance(matcher, MatcherTuple):
+            check = _compile_tuple(self.obj, matcher)
+        else:
+            check = _compile_element(self.obj)
+
+        if check is None:
+            def check(other):
+                return matcher == other
+
+        if self._inverted:
+            def compiled(other):
+                try:
+                    return not check(other)
+                except TypeError:
+                    return True
+        else:
+            def compiled(other):
+                try:
+                    return check(other)
+                except TypeError:
+                    return False
+        return compiled
+
     def __copy__(self):
         new_pred = self.__class__.__new__(self.__class__)
         new_pred.obj = self.obj
@@ -433,6 +616,17 @@ class PredicateIntersectionType(PredicateCombinedType):
             return not is_match
         return is_match
 
+    def compile(self):
+        left = self._left.compile()
+        right = self._right.compile()
+        if self._inverted:
+            def compiled(other):
+                return not (left(other) and right(other))
+        else:
+            def compiled(other):
+                return left(other) and right(other)
+        return compiled
+
 
 class PredicateUnionType(PredicateCombinedType):
     @property
@@ -444,3 +638,14 @@ class PredicateUnionType(PredicateCombinedType):
         if self._inverted:
             return not is_match
         return is_match
+
+    def compile(self):
+        left = self._left.compile()
+        right = self._right.compile()
+        if self._inverted:
+            def compiled(other):
+                return not (left(other) or right(other))
+        else:
+            def compiled(other):
+                return left(other) or right(other)
+        return compiled
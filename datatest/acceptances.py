@@ -14,32 +14,66 @@ __all__ = [
     'AcceptedFuzzy',
 ]
 
-import difflib
+import copy
 import inspect
+import threading
 from numbers import Number
 from ._compatibility.builtins import *
 from ._compatibility import abc
 from ._compatibility.collections import defaultdict
 from ._compatibility.collections.abc import Mapping
 from ._compatibility import contextlib
-from ._compatibility import itertools
 
+from ._fuzzy import FuzzyMatcher
 from ._utils import BaseElement
 from ._utils import exhaustible
+from ._utils import iterpeek
 from ._utils import nonstringiter
 from ._vendor.predicate import get_matcher
 from .validation import ValidationError
 from .differences import (
     BaseDifference,
+    DifferenceTable,
     Missing,
     Extra,
     Invalid,
+    NOVALUE,
 )
 
 
 __datatest = True  # Used to detect in-module stack frames (which are
                    # omitted from output).
 
+
+_active = threading.local()  # Holds per-thread stack of active acceptances.
+
+
+def _get_active_acceptances():
+    """Return a list of acceptances whose contexts are currently
+    active in this thread (innermost acceptance last).
+    """
+    try:
+        return _active.stack
+    except AttributeError:
+        _active.stack = []
+        return _active.stack
+
+
+def _get_pushdown_acceptances():
+    """Return a list of the innermost, contiguous, element-scoped
+    acceptances that are currently active (innermost first). These
+    can be applied while differences are generated because their
+    results depend only on each individual difference.
+    """
+    element_scope = frozenset(['element'])
+    pushdown = []
+    for acceptance in reversed(_get_active_acceptances()):
+        if acceptance.scope != element_scope:
+            break
+        pushdown.append(acceptance)
+    return pushdown
+
+
 class BaseAcceptance(abc.ABC):
     """Context manager base class to accept certain differences without
     triggering a test failure.
@@ -140,20 +174,33 @@ class BaseAcceptance(abc.ABC):
     def _filterfalse(self, serialized):
         self.start_collection()
 
-        def make_key(item):
-            return item[0]
-        grouped = itertools.groupby(serialized, key=make_key)
-
-        for key, group in grouped:
-            self.start_group(key)
-            for item in group:
-                if self.call_predicate(item):
-                    continue
-                yield item
+        # Group boundaries are tracked as items arrive (keys of
+        # serialized items are contiguous).
+        key = NOVALUE
+        for item in serialized:
+            if key is NOVALUE or item[0] != key:
+                if key is not NOVALUE:
+                    self.end_group(key)
+                key = item[0]
+                self.start_group(key)
+
+            if self.call_predicate(item):
+                continue
+            yield item
+
+        if key is not NOVALUE:
             self.end_group(key)
 
         self.end_collection()
 
+    def _copy_for_use(self):
+        """Return a copy of the acceptance to filter the differences
+        of a single error. Differences of lazy errors are filtered
+        after __exit__() returns, so each use needs its own working
+        state (the same acceptance may be used again before then).
+        """
+        return copy.copy(self)
+
     @staticmethod
     def _serialized_items(iterable):
         if isinstance(iterable, Mapping):
@@ -168,61 +215,72 @@ class BaseAcceptance(abc.ABC):
             for value in iterable:
                 yield (None, value)
 
-    @staticmethod
-    def _deserialized_items(iterable):
-        def make_key(item):
-            return item[0]
-
-        grouped = itertools.groupby(iterable, key=make_key)
-
-        def make_value(group):
-            value = [item[1] for item in group]
-            if len(value) == 1:
-                return value.pop()
-            return value
-
-        return dict((key, make_value(group)) for key, group in grouped)
+    def _extend_description(self, description):
+        """Return *description* prefixed with acceptance message."""
+        if self.msg:
+            if description:
+                return '{0}: {1}'.format(self.msg, description)
+            return self.msg
+        return description
 
     def __enter__(self):
+        _get_active_acceptances().append(self)
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        # Remove this acceptance and any acceptances entered after it
+        # that were not exited (e.g., from an abandoned generator) so
+        # stale entries can not filter later validations.
+        active = _get_active_acceptances()
+        for index in range(len(active) - 1, -1, -1):
+            if active[index] is self:
+                del active[index:]
+                break
+
         if exc_type and not issubclass(exc_type, ValidationError):
             raise exc_value
 
-        differences = getattr(exc_value, 'differences', [])
-        is_not_mapping = not isinstance(differences, Mapping)
+        if getattr(exc_value, '_stream', None) is not None:
+            # Chain onto the unevaluated differences of a lazy error.
+            is_mapping = exc_value._is_mapping
+            container = exc_value._container
+            stream = exc_value._detach_stream()
+        else:
+            differences = getattr(exc_value, 'differences', [])
+            is_mapping = isinstance(differences, Mapping)
 
-        stream = self._serialized_items(differences)
-        stream = self._filterfalse(stream)
-        differences = self._deserialized_items(stream)
+            # Remaining differences from a compact table stay compact.
+            if is_mapping:
+                use_table = any(isinstance(x, DifferenceTable)
+                                for x in differences.values())
+            else:
+                use_table = isinstance(differences, DifferenceTable)
+            container = DifferenceTable if use_table else list
 
-        if not differences:
+            stream = self._serialized_items(differences)
+
+        stream = self._copy_for_use()._filterfalse(stream)
+
+        first_item, stream = iterpeek(stream, NOVALUE)
+        if first_item is NOVALUE:
             return True  # <- EXIT!
 
         __tracebackhide__ = True  # Set pytest flag to hide traceback.
 
-        if is_not_mapping:
-            assert len(differences) == 1
-            differences = differences.popitem()[1]
-            if isinstance(differences, BaseDifference):
-                differences = [differences]
-
         # Extend description with acceptance message.
-        if self.msg:
-            if exc_value.description:
-                message = '{0}: {1}'.format(self.msg, exc_value.description)
-            else:
-                message = self.msg
-        else:
-            message = exc_value.description
+        message = self._extend_description(exc_value.description)
 
-        # Build new ValidationError with remaining differences.
-        exc = ValidationError(differences, message)
+        # Build new ValidationError that consumes the filtered stream
+        # when its differences are needed.
+        exc = ValidationError._from_stream(
+            stream, is_mapping, message, getattr(exc_value, '_retain', None))
+        exc._container = container
 
         # Re-raised error inherits truncation behavior of original.
         exc._should_truncate = exc_value._should_truncate
         exc._truncation_notice = exc_value._truncation_notice
+        exc._sorted_str = exc_value._sorted_str
+        exc._partial = exc_value._partial  # Remaining count is a lower bound.
 
         exc.__cause__ = None  # <- Suppress context using verbose
         raise exc             #    alternative to support older Python
@@ -242,6 +300,12 @@ class CombinedAcceptance(BaseAcceptance):
         """Return a combined set scope strings."""
         return self.left.scope | self.right.scope
 
+    def _copy_for_use(self):
+        new = copy.copy(self)
+        new.left = self.left._copy_for_use()
+        new.right = self.right._copy_for_use()
+        return new
+
     def start_collection(self):
         self.left.start_collection()
         self.right.start_collection()
@@ -303,6 +367,50 @@ class UnionedAcceptance(CombinedAcceptance):
         return first.call_predicate(item) or second.call_predicate(item)
 
 
+class _DifferenceMultiset(object):
+    """A multiset of accepted differences used to check and remove
+    matches in constant time. Hashable differences are counted in a
+    dictionary (differences hash and compare using their NaN-normalized
+    args) while unhashable differences fall back to a list that is
+    searched with a linear scan.
+    """
+    def __init__(self, differences=()):
+        self._counts = {}
+        self._unhashable = []
+        for diff in differences:
+            try:
+                self._counts[diff] = self._counts.get(diff, 0) + 1
+            except TypeError:
+                self._unhashable.append(diff)
+
+    def copy(self):
+        new = self.__class__()
+        new._counts = self._counts.copy()
+        new._unhashable = list(self._unhashable)
+        return new
+
+    def __contains__(self, diff):
+        try:
+            return diff in self._counts
+        except TypeError:
+            return diff in self._unhashable
+
+    def remove(self, diff):
+        try:
+            count = self._counts[diff]
+        except TypeError:
+            self._unhashable.remove(diff)
+            return  # <- EXIT!
+
+        if count > 1:
+            self._counts[diff] = count - 1
+        else:
+            del self._counts[diff]
+
+    def __len__(self):
+        return sum(self._counts.values()) + len(self._unhashable)
+
+
 class AcceptedDifferences(BaseAcceptance):
     """Accepts differences that match *obj* without triggering a test
     failure. The given *obj* can be a difference class, a difference
@@ -348,6 +456,7 @@ class AcceptedDifferences(BaseAcceptance):
         self._current_scope = None
         self._current_allowance = None
         self._current_check = None
+        self._multisets = {}  # Allowance multisets by group key.
 
     @staticmethod
     def _normalize_differences(obj):
@@ -391,19 +500,22 @@ class AcceptedDifferences(BaseAcceptance):
 
         return frozenset([scope])
 
+    def start_collection(self):
+        self._multisets = {}  # <- Allowances are not shared between uses.
+
     def start_group(self, key):
         """Called before processing each group."""
         # Get current allowance object.
         obj = self._obj
         if isinstance(obj, Mapping):
             current_allowance = obj.get(key, [])
-        elif nonstringiter(obj):
-            if self._scope == 'whole':
-                current_allowance = obj  # Use a single persistent object.
-            else:
-                current_allowance = list(obj)  # Make a copy for each group.
+            is_persistent = True
         else:
             current_allowance = obj
+            key = None
+            # Use a single persistent object for whole-error scope
+            # or else make a copy for each group.
+            is_persistent = self._scope == 'whole'
 
         # Get current scope and check function.
         if isinstance(current_allowance, type):
@@ -415,8 +527,14 @@ class AcceptedDifferences(BaseAcceptance):
         else:
             if nonstringiter(current_allowance):
                 default_scope = 'group'
-                if not hasattr(current_allowance, 'remove'):
-                    current_allowance = list(current_allowance)
+                multiset = self._multisets.get(key)
+                if multiset is None:
+                    multiset = _DifferenceMultiset(current_allowance)
+                    self._multisets[key] = multiset
+                if is_persistent or self._scope == 'element':
+                    current_allowance = multiset
+                else:
+                    current_allowance = multiset.copy()
             else:
                 default_scope = 'element'
                 current_allowance = [current_allowance]
@@ -676,6 +794,8 @@ class AcceptedFuzzy(BaseAcceptance):
     the :py:class:`difflib.SequenceMatcher` class. The values range
     from 0.0 (completely different) to 1.0 (exactly the same):
     """
+    _fuzzy_match = None  # FuzzyMatcher built on first use.
+
     def __init__(self, cutoff=0.6, msg=None):
         self.cutoff = cutoff
         super(AcceptedFuzzy, self).__init__(msg)
@@ -699,13 +819,10 @@ class AcceptedFuzzy(BaseAcceptance):
         except AttributeError:
             return False  # <- EXIT!
 
-        try:
-            matcher = difflib.SequenceMatcher(a=a, b=b)
-            similarity = matcher.ratio()
-        except TypeError:
-            return False  # <- EXIT!
-
-        return similarity >= self.cutoff
+        fuzzy_match = self._fuzzy_match
+        if fuzzy_match is None or fuzzy_match.cutoff != self.cutoff:
+            fuzzy_match = self._fuzzy_match = FuzzyMatcher(self.cutoff)
+        return fuzzy_match(a, b)
 
 
 class AcceptedCount(BaseAcceptance):
@@ -56,62 +56,91 @@ class DataTestCase(TestCase):
 
             raise err
 
-    def assertValid(self, data, requirement, msg=None):
+    def assertValid(self, data, requirement, msg=None, max_differences=None):
         """Wrapper for :func:`validate`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate, data, requirement, msg=msg)
+        self._apply_validation(validate, data, requirement, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidApprox(self, data, requirement, places=None, msg=None, delta=None):
+    def assertValidAll(self, data, requirement, msg=None, max_differences=None):
+        """Wrapper for :meth:`validate.all`."""
+        __tracebackhide__ = _pytest_tracebackhide
+        self._apply_validation(validate.all, data, requirement, msg=msg,
+                               max_differences=max_differences)
+
+    def assertValidApprox(self, data, requirement, places=None, msg=None,
+                          delta=None, max_differences=None):
         """Wrapper for :meth:`validate.approx`."""
         __tracebackhide__ = _pytest_tracebackhide
         self._apply_validation(validate.approx, data, requirement,
-                               places=places, msg=msg, delta=delta)
+                               places=places, msg=msg, delta=delta,
+                               max_differences=max_differences)
 
-    def assertValidFuzzy(self, data, requirement, cutoff=0.6, msg=None):
+    def assertValidFuzzy(self, data, requirement, cutoff=0.6, msg=None,
+                         max_differences=None):
         """Wrapper for :meth:`validate.fuzzy`."""
         __tracebackhide__ = _pytest_tracebackhide
         self._apply_validation(validate.fuzzy, data, requirement,
-                               cutoff=cutoff, msg=msg)
+                               cutoff=cutoff, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidInterval(self, data, min=None, max=None, msg=None):
+    def assertValidInterval(self, data, min=None, max=None, msg=None,
+                            max_differences=None):
         """Wrapper for :meth:`validate.interval`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.interval, data, min, max, msg=msg)
+        self._apply_validation(validate.interval, data, min, max, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidOrder(self, data, sequence, msg=None):
+    def assertValidOrder(self, data, sequence, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.order`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.order, data, sequence, msg=msg)
+        self._apply_validation(validate.order, data, sequence, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidPredicate(self, data, requirement, msg=None):
+    def assertValidPredicate(self, data, requirement, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.predicate`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.predicate, data, requirement, msg=msg)
+        self._apply_validation(validate.predicate, data, requirement, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidRegex(self, data, requirement, flags=0, msg=None):
+    def assertValidRegex(self, data, requirement, flags=0, msg=None,
+                         max_differences=None):
         """Wrapper for :meth:`validate.regex`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.regex, data, requirement, flags=flags, msg=msg)
+        self._apply_validation(validate.regex, data, requirement, flags=flags,
+                               msg=msg, max_differences=max_differences)
 
-    def assertValidSet(self, data, requirement, msg=None):
+    def assertValidSet(self, data, requirement, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.set`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.set, data, requirement, msg=msg)
+        self._apply_validation(validate.set, data, requirement, msg=msg,
+                               max_differences=max_differences)
+
+    def assertValidSorted(self, data, key=None, reverse=False, strict=False,
+                          msg=None, max_differences=None):
+        """Wrapper for :meth:`validate.sorted`."""
+        __tracebackhide__ = _pytest_tracebackhide
+        self._apply_validation(validate.sorted, data, key=key, reverse=reverse,
+                               strict=strict, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidSubset(self, data, requirement, msg=None):
+    def assertValidSubset(self, data, requirement, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.subset`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.subset, data, requirement, msg=msg)
+        self._apply_validation(validate.subset, data, requirement, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidSuperset(self, data, requirement, msg=None):
+    def assertValidSuperset(self, data, requirement, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.superset`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.superset, data, requirement, msg=msg)
+        self._apply_validation(validate.superset, data, requirement, msg=msg,
+                               max_differences=max_differences)
 
-    def assertValidUnique(self, data, msg=None):
+    def assertValidUnique(self, data, msg=None, max_differences=None):
         """Wrapper for :meth:`validate.unique`."""
         __tracebackhide__ = _pytest_tracebackhide
-        self._apply_validation(validate.unique, data, msg=msg)
+        self._apply_validation(validate.unique, data, msg=msg,
+                               max_differences=max_differences)
 
     def accepted(self, obj, msg=None, scope=None):
         """Wrapper for :func:`accepted`."""
@@ -6,12 +6,16 @@ __all__ = [
     'Extra',
     'Invalid',
     'Deviation',
+    'DifferenceTable',
+    'register_difference_handler',
 ]
 
+from array import array
 from cmath import isnan
 from datetime import timedelta
 from ._compatibility.builtins import *
 from ._compatibility import abc
+from ._compatibility.collections.abc import Sequence
 from ._compatibility.contextlib import suppress
 
 from ._utils import _make_token
@@ -58,7 +62,7 @@ class BaseDifference(abc.ABC):
     """The base class for "difference" objects---all other difference
     classes are derived from this base.
     """
-    __slots__ = ()
+    __slots__ = ('_cmp_key', '_hash')  # Cached on first use.
 
     @property
     @abc.abstractmethod
@@ -72,24 +76,55 @@ class BaseDifference(abc.ABC):
         # Concrete method should return tuple of args used in __init__().
         raise NotImplementedError
 
+    def _get_cmp_key(self):
+        """Return args tuple with NaN values replaced by NANTOKEN. The
+        key is built on first use and cached for later comparisons.
+        """
+        try:
+            return self._cmp_key
+        except AttributeError:
+            self._cmp_key = tuple(_nan_to_token(x) for x in self.args)
+            return self._cmp_key
+
     def __eq__(self, other):
         if self.__class__ != other.__class__:
             return False
-        self_args = tuple(_nan_to_token(x) for x in self.args)
-        other_args = tuple(_nan_to_token(x) for x in other.args)
-        return self_args == other_args
+        return self._get_cmp_key() == other._get_cmp_key()
 
     def __ne__(self, other):           # <- For Python 2.x support. There is
         return not self.__eq__(other)  #    no implicit relationship between
                                        #    __eq__() and __ne__() in Python 2.
     def __hash__(self):
         try:
-            return hash((self.__class__, self.args))
+            return self._hash
+        except AttributeError:
+            pass
+
+        try:
+            self._hash = hash((self.__class__, self._get_cmp_key()))
         except TypeError as err:
             msg = '{0} in args tuple {1!r}'.format(str(err), self.args)
             hashfail = TypeError(msg)
             hashfail.__cause__ = getattr(err, '__cause__', None)  # getattr for 2.x support
             raise hashfail
+        return self._hash
+
+    def __getstate__(self):
+        # Cached values are left out of the pickled state (the cached
+        # key can contain NANTOKEN which is not picklable).
+        slot_state = {}
+        for cls in self.__class__.__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name in ('_cmp_key', '_hash'):
+                    continue
+                try:
+                    slot_state[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        return (getattr(self, '__dict__', None) or None, slot_state)
 
     def __repr__(self):
         cls_name = self.__class__.__name__
@@ -323,6 +358,210 @@ class Deviation(BaseDifference):
         return '{0}({1}, {2})'.format(cls_name, deviation_repr, expected_repr)
 
 
+_column_typecodes = {int: 'l', float: 'd'}
+
+
+def _new_column(value):
+    """Return a new column containing *value*. Integers and floats
+    are stored in typed arrays, other values are stored in a list.
+    """
+    typecode = _column_typecodes.get(value.__class__)
+    if typecode:
+        try:
+            return array(typecode, [value])
+        except OverflowError:
+            pass
+    return [value]
+
+
+def _column_append(column, value):
+    """Append *value* to *column* and return the column. If *column*
+    is a typed array that cannot hold *value* exactly, it is first
+    converted into a list.
+    """
+    if column.__class__ is not list:
+        if _column_typecodes.get(value.__class__) == column.typecode:
+            try:
+                column.append(value)
+                return column
+            except OverflowError:
+                pass
+        column = list(column)
+    column.append(value)
+    return column
+
+
+class DifferenceTable(Sequence):
+    """A compact sequence of difference objects.
+
+    Rather than keeping a separate object for every difference, the
+    table stores the difference class and the *args* of each one in
+    parallel columns---using typed :mod:`array` storage for integer
+    and float values. Difference objects are created as needed when
+    the table is iterated over or indexed::
+
+        table = DifferenceTable(Deviation(x, 100) for x in deviations)
+
+        raise ValidationError(table, 'does not satisfy requirement')
+
+    A table can be used anywhere a list of differences is accepted.
+    Difference classes must accept their *args* values as
+    constructor arguments.
+    """
+    def __init__(self, differences=()):
+        self._shapes = []       # List of (class, list of columns) pairs.
+        self._shape_codes = {}  # Mapping of (class, arity) to shape code.
+        self._codes = array('H')  # Shape code for each row.
+        self._offsets = None    # Row positions in shape columns.
+        self.extend(differences)
+
+    def append(self, difference):
+        """Append *difference* to the end of the table."""
+        if not isinstance(difference, BaseDifference):
+            msg = 'expected difference object, got {0!r}'
+            raise TypeError(msg.format(difference))
+
+        args = difference.args
+        shape_key = (difference.__class__, len(args))
+        code = self._shape_codes.get(shape_key)
+        if code is None:
+            code = len(self._shapes)
+            self._shape_codes[shape_key] = code
+            columns = [_new_column(x) for x in args]
+            self._shapes.append((difference.__class__, columns))
+        else:
+            columns = self._shapes[code][1]
+            for index, value in enumerate(args):
+                columns[index] = _column_append(columns[index], value)
+        self._codes.append(code)
+        self._offsets = None
+
+    def extend(self, differences):
+        """Append every difference from the *differences* iterable."""
+        for difference in differences:
+            self.append(difference)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        shapes = self._shapes
+        positions = [0] * len(shapes)
+        for code in self._codes:
+            cls, columns = shapes[code]
+            position = positions[code]
+            positions[code] = position + 1
+            yield cls(*[column[position] for column in columns])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            return self.__class__(self[i] for i in indices)
+
+        if self._offsets is None:
+            positions = [0] * len(self._shapes)
+            offsets = array('l')
+            for code in self._codes:
+                offsets.append(positions[code])
+                positions[code] += 1
+            self._offsets = offsets
+
+        code = self._codes[index]
+        cls, columns = self._shapes[code]
+        position = self._offsets[index]
+        return cls(*[column[position] for column in columns])
+
+    def __eq__(self, other):
+        if not isinstance(other, (DifferenceTable, list)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return '{0}({1!r})'.format(cls_name, list(self))
+
+
+def _make_invalid(actual, expected, show_expected):
+    if show_expected:
+        return Invalid(actual, expected)
+    return Invalid(actual)
+
+
+def _make_deviation(actual, expected, show_expected):
+    try:
+        deviation = actual - expected
+        return Deviation(deviation, expected)
+    except (TypeError, ValueError):
+        return _make_invalid(actual, expected, show_expected)
+
+
+_registered_handlers = {}  # Maps (actual type, expected type) to handler.
+_handler_cache = {}        # Same as above, but filled in as types are seen.
+
+
+def register_difference_handler(actual_type, expected_type, handler):
+    """Register a *handler* to build differences for unequal values
+    of *actual_type* and *expected_type* (subclasses included). The
+    handler is called as ``handler(actual, expected, show_expected)``
+    and must return a difference object. When *show_expected* is
+    False, an :class:`Invalid` difference should omit the expected
+    value.
+
+    By default, values that support subtraction are reported as
+    :class:`Deviation` differences and other values as
+    :class:`Invalid`. Types that do not define subtraction at all
+    are recognized once for each pair of types. Register a handler
+    for types that need other handling::
+
+        def money_difference(actual, expected, show_expected):
+            return Deviation(actual.amount - expected.amount, expected.amount)
+
+        register_difference_handler(Money, Money, money_difference)
+    """
+    if not callable(handler):
+        msg = 'handler must be callable, got {0!r}'
+        raise TypeError(msg.format(handler))
+    _registered_handlers[(actual_type, expected_type)] = handler
+    _handler_cache.clear()
+
+
+def _get_handler(actual, expected):
+    """Return the handler used to build differences for values of
+    the same types as *actual* and *expected*.
+    """
+    actual_type = type(actual)
+    expected_type = type(expected)
+
+    if _registered_handlers:
+        for actual_base in actual_type.__mro__:
+            for expected_base in expected_type.__mro__:
+                handler = _registered_handlers.get((actual_base, expected_base))
+                if handler:
+                    return handler
+
+    if issubclass(actual_type, bool) or issubclass(expected_type, bool):
+        return _make_invalid
+
+    if not (hasattr(actual_type, '__sub__')
+            or hasattr(expected_type, '__rsub__')):
+        return _make_invalid  # <- Types do not support subtraction.
+
+    # Types that define subtraction may still raise a TypeError for
+    # some values (like naive and aware datetimes) so the subtraction
+    # is always retried by _make_deviation().
+    return _make_deviation
+
+
 def _make_difference(actual, expected, show_expected=True):
     """Returns an appropriate difference for *actual* and *expected*
     values that are known to be unequal.
@@ -331,6 +570,11 @@ def _make_difference(actual, expected, show_expected=True):
     argument should be omitted when creating an Invalid difference
     (this is useful for reducing duplication when validating data
     against a single function or object).
+
+    The function used to build the difference is looked up by the
+    types of *actual* and *expected* (see register_difference_handler())
+    so that values which do not support subtraction do not raise and
+    catch an exception each time.
     """
     if actual is NOVALUE:
         return Missing(expected)
@@ -338,15 +582,9 @@ def _make_difference(actual, expected, show_expected=True):
     if expected is NOVALUE:
         return Extra(actual)
 
-    if isinstance(expected, bool) or isinstance(actual, bool):
-        if show_expected:
-            return Invalid(actual, expected)
-        return Invalid(actual)
-
+    key = (type(actual), type(expected))
     try:
-        deviation = actual - expected
-        return Deviation(deviation, expected)
-    except (TypeError, ValueError):
-        if show_expected:
-            return Invalid(actual, expected)
-        return Invalid(actual)
+        handler = _handler_cache[key]
+    except KeyError:
+        handler = _handler_cache[key] = _get_handler(actual, expected)
+    return handler(actual, expected, show_expected)
@@ -2,13 +2,13 @@
 
 from __future__ import absolute_import
 from __future__ import division
-import difflib
 import re
+import sys
 from numbers import Number
 from types import FunctionType
 from ._compatibility.builtins import *
 from ._compatibility import abc
-from ._compatibility.collections.abc import Hashable
+from ._compatibility.collections import namedtuple
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Mapping
 from ._compatibility.collections.abc import Sequence
@@ -26,13 +26,25 @@ from .differences import (
     _make_difference,
     NOVALUE,
 )
+from ._diff_engines import get_engine
+from ._fuzzy import FuzzyIndex
+from ._fuzzy import FuzzyMatcher
+from ._normalize import ColumnIterator
+from ._normalize import _iter_rows
 from ._normalize import normalize
 from ._utils import BaseElement
 from ._utils import IterItems
+from . import _vectorized
+from ._utils import exhaustible
 from ._utils import iterpeek
 from ._utils import nonstringiter
 from ._utils import string_types
+from ._vendor.predicate import MatcherBase
 from ._vendor.predicate import Predicate
+from ._vendor.predicate import _compile_positions
+from ._vendor.predicate import get_matcher
+from ._vendor.predicate import PredicateIntersectionType
+from ._vendor.predicate import PredicateUnionType
 
 
 def _get_formatted_name_or_repr(obj):
@@ -85,41 +97,256 @@ def _build_description(obj):
     return 'does not satisfy {0}'.format(obj_repr)
 
 
+def _compile_predicate(pred):
+    """Return a flat function equivalent to *pred* if it's one of
+    the built-in predicate types, else return *pred* unchanged.
+    """
+    if pred.__class__ in _compilable_predicate_types:
+        return pred.compile()
+    return pred
+
+
+_compilable_predicate_types = (
+    Predicate,
+    PredicateIntersectionType,
+    PredicateUnionType,
+)
+
+
+class _DeepHasher(object):
+    """Callable that returns a "deep hash" value for a given object.
+    Unhashable sequences, sets, and mappings are hashed by their
+    contents (iteratively, so deeply nested objects do not reach the
+    recursion limit). Values for compound objects are cached by
+    identity, so a single instance should only be used while the
+    objects being hashed are not modified (e.g., for the duration
+    of a single validation). If an object can not be deep-hashed,
+    a TypeError is raised.
+    """
+    # Adapted from "deephash" Copyright 2017 Shawn Brown, Apache License 2.0.
+    def __init__(self):
+        self._cache = {}  # Maps id(obj) to (obj, hash value) pairs.
+
+    def __call__(self, obj):
+        try:
+            return hash(obj)
+        except TypeError:
+            pass
+
+        cache = self._cache
+        in_progress = set()  # Guards against recursive references.
+        results = []
+        stack = [(obj, None)]
+        while stack:
+            current, children = stack.pop()
+
+            if children is not None:
+                # Children are hashed, combine them into a single value.
+                kind, keys, count = children
+                values = results[len(results) - count:]
+                del results[len(results) - count:]
+                if kind is Sequence:
+                    proxy = tuple(values)
+                elif kind is Set:
+                    proxy = frozenset(values)
+                else:
+                    proxy = frozenset(zip(keys, values))
+                value = hash((current.__class__, proxy))
+                cache[id(current)] = (current, value)
+                in_progress.discard(id(current))
+                results.append(value)
+                continue
+
+            try:
+                results.append(hash(current))
+                continue
+            except TypeError:
+                pass
+
+            current_id = id(current)
+            if current_id in cache:
+                results.append(cache[current_id][1])
+                continue
+            if current_id in in_progress:
+                results.append(hash((current.__class__, '<recursive>')))
+                continue
+
+            if isinstance(current, Sequence):
+                kind, keys, items = Sequence, None, list(current)
+            elif isinstance(current, Set):
+                kind, keys, items = Set, None, list(current)
+            elif isinstance(current, Mapping):
+                keys = list(current.keys())
+                kind, items = Mapping, [current[k] for k in keys]
+            else:
+                message = 'unhashable type: {0!r}'.format(
+                    current.__class__.__name__)
+                raise TypeError(message)
+
+            in_progress.add(current_id)
+            stack.append((current, (kind, keys, len(items))))
+            stack.extend((x, None) for x in reversed(items))
+
+        return results[0]
+
+
 def _deephash(obj):
     """Return a "deep hash" value for the given object. If the
     object can not be deep-hashed, a TypeError is raised.
     """
-    # Adapted from "deephash" Copyright 2017 Shawn Brown, Apache License 2.0.
-    already_seen = {}
+    return _DeepHasher()(obj)
 
-    def _hashable_proxy(obj):
-        if isinstance(obj, Hashable) and not isinstance(obj, tuple):
-            return obj  # <- EXIT!
 
-        # Guard against recursive references in compound objects.
-        obj_id = id(obj)
-        if obj_id in already_seen:
-            return already_seen[obj_id]  # <- EXIT!
-        else:
-            already_seen[obj_id] = object()  # Token for duplicates.
-
-        # Recurse into compound object to make hashable proxies.
-        if isinstance(obj, Sequence):
-            proxy = tuple(_hashable_proxy(x) for x in obj)
-        elif isinstance(obj, Set):
-            proxy = frozenset(_hashable_proxy(x) for x in obj)
-        elif isinstance(obj, Mapping):
-            items = ((k, _hashable_proxy(v)) for k, v in IterItems(obj))
-            proxy = frozenset(items)
+class _DeepHashSet(object):
+    """A set-like collection that also accepts unhashable objects.
+    Unhashable objects are grouped by their deep-hash values and
+    then compared for equality.
+    """
+    def __init__(self):
+        self._hashable = set()
+        self._unhashable = {}  # Maps deep-hash values to lists of objects.
+        self._deephash = _DeepHasher()
+
+    def add(self, obj):
+        """Add *obj* to the collection. Returns True if it was added
+        or False if an equal object was already present.
+        """
+        try:
+            if obj in self._hashable:
+                return False
+            self._hashable.add(obj)
+            return True
+        except TypeError:
+            bucket = self._unhashable.setdefault(self._deephash(obj), [])
+            if obj in bucket:
+                return False
+            bucket.append(obj)
+            return True
+
+    def __iter__(self):
+        for obj in self._hashable:
+            yield obj
+        for bucket in self._unhashable.values():
+            for obj in bucket:
+                yield obj
+
+    def __len__(self):
+        return len(self._hashable) + sum(len(x) for x in self._unhashable.values())
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _memo_key(element):
+    """Return a key for *element* that also distinguishes its type
+    (and the types of any tuple items) because values like ``1`` and
+    ``1.0`` are equal but may not satisfy the same predicate.
+    """
+    cls = element.__class__
+    if isinstance(element, tuple):
+        return (cls, tuple(_memo_key(x) for x in element))
+    return (cls, element)
+
+
+class _LRUMemo(object):
+    """Bounded, least-recently-used memo that maps element values to
+    the result of *function* (using a circular doubly linked list as
+    in functools.lru_cache). Unhashable elements are passed through to
+    *function* without being cached.
+    """
+    def __init__(self, function, maxsize):
+        self._function = function
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._root = root = []  # Links are [prev, next, key, result].
+        root[:] = [root, root, None, None]
+
+    def __call__(self, element):
+        try:
+            key = _memo_key(element)
+            link = self._cache.get(key)
+        except TypeError:  # Unhashable element.
+            self.misses += 1
+            return self._function(element)
+
+        root = self._root
+        if link is not None:
+            # Move link to the most-recently-used position.
+            prev, next_, _, result = link
+            prev[1] = next_
+            next_[0] = prev
+            last = root[0]
+            last[1] = root[0] = link
+            link[0] = last
+            link[1] = root
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._function(element)
+        if len(self._cache) >= self.maxsize:
+            # Reuse the least-recently-used link for the new entry.
+            oldest = root[1]
+            del self._cache[oldest[2]]
+            oldest[2] = key
+            oldest[3] = result
+            root[1] = oldest[1]
+            oldest[1][0] = root
         else:
-            message = 'unhashable type: {0!r}'.format(obj.__class__.__name__)
-            raise TypeError(message)
-        return obj.__class__, proxy
+            oldest = [None, None, key, result]
+        last = root[0]
+        last[1] = root[0] = oldest
+        oldest[0] = last
+        oldest[1] = root
+        self._cache[key] = oldest
+        return result
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._cache.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+
+
+class _BufferedAccumulator(object):
+    """Collect elements pushed one at a time and check them with the
+    requirement's check_data() method when finished. If *distinct*
+    is True, duplicate elements are not kept (for requirements whose
+    results only depend on the distinct elements in a group).
+    """
+    def __init__(self, requirement, distinct=False):
+        self.requirement = requirement
+        self._buffer = _DeepHashSet() if distinct else []
+        self.push = self._buffer.add if distinct else self._buffer.append
 
-    try:
-        return hash(obj)
-    except TypeError:
-        return hash(_hashable_proxy(obj))
+    def finish(self):
+        return self.requirement.check_data(list(self._buffer))
+
+
+class _ElementAccumulator(object):
+    """Check elements as they are pushed using *check*, a function
+    that returns a difference or None. Nothing but the differences
+    are kept.
+    """
+    def __init__(self, requirement, check):
+        self.requirement = requirement
+        self._check = check
+        self._differences = []
+
+    def push(self, element):
+        diff = self._check(element)
+        if diff is not None:
+            self._differences.append(diff)
+
+    def finish(self):
+        _, description = self.requirement.check_group([])
+        return self._differences, description
 
 
 ##############################
@@ -203,6 +430,28 @@ class BaseRequirement(abc.ABC):
         result = self.check_data(data)
         return self._normalize(result)
 
+    def valid_data(self, data):
+        """Return True if *data* satisfies the requirement or False if
+        it does not. Evaluation stops as soon as the answer is known.
+        Subclasses can override this method to short-circuit without
+        building any difference objects.
+        """
+        result = self.check_data(data)
+        return self._normalize(result) is None
+
+    def _accumulator(self):
+        """Return an object whose push() method accepts the elements
+        of a group one at a time and whose finish() method returns
+        the result of checking them. This lets RequiredAll check many
+        requirements in a single pass over the data.
+        """
+        return _BufferedAccumulator(self)
+
+    def __and__(self, other):
+        if not isinstance(other, BaseRequirement):
+            return NotImplemented
+        return RequiredAll([self, other])
+
 
 class ItemsRequirement(BaseRequirement):
     """A class to check that items or mappings of data fulfill a
@@ -218,22 +467,46 @@ class ItemsRequirement(BaseRequirement):
             data = IterItems(data)
         return self.check_items(data)
 
+    def valid_items(self, items):
+        """Return True if *items* satisfy the requirement else False."""
+        result = self.check_items(items)
+        return self._normalize(result) is None
+
+    def valid_data(self, data):
+        data = normalize(data, lazy_evaluation=True)
+        if isinstance(data, Mapping):
+            data = IterItems(data)
+        return self.valid_items(data)
 
-_INCONSISTENT = object()  # Marker for inconsistent descriptions.
 
 class GroupRequirement(BaseRequirement):
     """A class to check that groups of data fulfill a specific need
     or expectation.
+
+    Requirements that can check data one column at a time should set
+    *accepts_columns* to True and implement check_columns(). It is
+    used instead of check_group() when data can be read column-wise
+    (like a pandas DataFrame with a RangeIndex).
     """
+    accepts_columns = False
+
     @abc.abstractmethod
     def check_group(self, group):
         raise NotImplementedError()
 
-    def check_items(self, items, autowrap=True):
-        differences = []
-        description = ''
-        check_group = self.check_group
+    def check_columns(self, chunks):
+        """Check a group of rows given as *chunks*--an iterable of row
+        chunks where each chunk is a list of equal-length columns. The
+        default implementation rebuilds the rows and calls
+        check_group().
+        """
+        return self.check_group(_iter_rows(chunks))
 
+    def _iter_item_results(self, items, autowrap=True):
+        """Yield a ``(key, differences, description)`` tuple for each
+        group in *items* that does not satisfy the requirement.
+        """
+        check_group = self.check_group
         for key, value in items:
             if isinstance(value, BaseElement) and autowrap:
                 value = [value]  # Wrap element to treat it as a group.
@@ -248,19 +521,21 @@ class GroupRequirement(BaseRequirement):
                 first_element, diff = iterpeek(diff, None)
                 if not first_element:
                     continue
+            yield key, diff, desc
 
-            differences.append((key, diff))
-
-            if description == desc or description is _INCONSISTENT:
-                continue
-
-            if not description:
-                description = desc
-            else:
-                description = _INCONSISTENT
-
-        if description is _INCONSISTENT:
-            description = ''
+    def check_items(self, items, autowrap=True):
+        """Check *items* and return an iterator of (key, differences)
+        pairs and a description. Items are only checked as far as the
+        first group with differences before returning (the description
+        is taken from that group), the rest are checked as the pairs
+        are consumed.
+        """
+        results = self._iter_item_results(items, autowrap)
+        first_result = next(results, None)
+        if first_result is None:
+            return [], ''
+        key, diff, description = first_result
+        differences = chain([(key, diff)], ((k, d) for k, d, _ in results))
         return differences, description
 
     def check_data(self, data):
@@ -272,21 +547,110 @@ class GroupRequirement(BaseRequirement):
         if isinstance(data, IterItems):
             return self.check_items(data)
 
+        if isinstance(data, ColumnIterator) and self.accepts_columns:
+            return self.check_columns(data.iter_columns())
+
         if isinstance(data, BaseElement):
             data = [data]
         return self.check_group(data)
 
+    def valid_group(self, group):
+        """Return True if *group* satisfies the requirement else False.
+        The default implementation only evaluates the first difference
+        (if any) returned by check_group().
+        """
+        differences, _ = self.check_group(group)
+        return next(iter(differences), NOVALUE) is NOVALUE
+
+    def valid_items(self, items, autowrap=True):
+        """Return True if all *items* satisfy the requirement else
+        False. Stops checking at the first group that fails.
+        """
+        valid_group = self.valid_group
+        for key, value in items:
+            if isinstance(value, BaseElement) and autowrap:
+                value = [value]  # Wrap element to treat it as a group.
+            if not valid_group(value):
+                return False
+        return True
+
+    def valid_data(self, data):
+        data = normalize(data, lazy_evaluation=True)
+
+        if isinstance(data, Mapping):
+            data = IterItems(data)
+
+        if isinstance(data, IterItems):
+            return self.valid_items(data)
+
+        if isinstance(data, BaseElement):
+            data = [data]
+        return self.valid_group(data)
+
 
 ##############################
 # Concrete Requirement Classes
 ##############################
 
 class RequiredPredicate(GroupRequirement):
-    """A requirement to test data for predicate matches."""
-    def __init__(self, obj, show_expected=False):
+    """A requirement to test data for predicate matches.
+
+    If *cache_size* is given, the differences (or lack of differences)
+    for up to that many distinct element values are kept in a least-
+    recently-used memo so that repeated values are not checked again.
+    This is useful for columns with few distinct values and many rows
+    but it assumes the predicate's result depends only on the value
+    (and type) of each element. Memo statistics are available from
+    :meth:`cache_info`.
+    """
+    _memo = None
+    _compiled_pred = None
+
+    def __init__(self, obj, show_expected=False, cache_size=None):
         self._pred = self.predicate_factory(obj)
         self._obj = obj
         self.show_expected = show_expected
+        if cache_size:
+            self._memo = _LRUMemo(self._check_element, cache_size)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_compiled_pred', None)  # <- Rebuilt as needed.
+        return state
+
+    def _get_compiled_predicate(self):
+        """Return the compiled predicate function. It's built the
+        first time it's needed and then reused.
+        """
+        pred = self._compiled_pred
+        if pred is None:
+            pred = _compile_predicate(self._pred)
+            self._compiled_pred = pred
+        return pred
+
+    def cache_info(self):
+        """Return a named tuple of (hits, misses, maxsize, currsize)
+        for the memo or None if *cache_size* was not given.
+        """
+        if self._memo is None:
+            return None
+        return self._memo.cache_info()
+
+    def cache_clear(self):
+        """Clear the memo and its statistics."""
+        if self._memo is not None:
+            self._memo.cache_clear()
+
+    def _check_element(self, element):
+        """Return the difference for *element* or None if it
+        satisfies the predicate.
+        """
+        result = self._pred(element)
+        if not result:
+            return _make_difference(element, self._obj, self.show_expected)
+        if isinstance(result, BaseDifference):
+            return result
+        return None
 
     def predicate_factory(self, obj):
         """Accepts an object *obj* and returns an appropriate predicate
@@ -297,8 +661,66 @@ class RequiredPredicate(GroupRequirement):
             return obj
         return Predicate(obj)
 
-    def _get_differences(self, group):
+    def _candidate_mask(self, array):
+        """Return a boolean mask of positions in *array* that might not
+        satisfy the requirement or None if the array can not be checked
+        in bulk. Positions left unmarked must be valid.
+        """
         pred = self._pred
+        if pred.__class__ is Predicate and isinstance(pred.obj, type):
+            return _vectorized.uniform_mask(array, self._check_element)
+        return None
+
+    def _extension_mask(self, array):
+        """Like _candidate_mask() but for pandas ExtensionArrays whose
+        dtype can decide type predicates without checking elements.
+        """
+        pred = self._pred
+        if pred.__class__ is Predicate and isinstance(pred.obj, type):
+            return _vectorized.extension_type_mask(array, self._check_element)
+        return None
+
+    def _get_array_differences(self, group):
+        """Return a generator of differences for an array-backed
+        *group* or None if it can not be checked in bulk.
+        """
+        if self.__class__ not in _predicate_fastpath_types:
+            return None
+        array = _vectorized.as_array(group)
+        if array is not None:
+            mask = self._candidate_mask(array)
+        else:
+            array = _vectorized.as_extension_array(group)
+            if array is None:
+                return None
+            mask = self._extension_mask(array)
+        if mask is None:
+            return None
+
+        check = self._memo or self._check_element
+        def generate_differences():
+            for index in _vectorized.masked_positions(mask):
+                diff = check(array[index])
+                if diff is not None:
+                    yield diff
+        return generate_differences()
+
+    def _get_differences(self, group):
+        array_differences = self._get_array_differences(group)
+        if array_differences is not None:
+            for diff in array_differences:
+                yield diff
+            return
+
+        memo = self._memo
+        if memo is not None:
+            for element in group:
+                diff = memo(element)
+                if diff is not None:
+                    yield diff
+            return
+
+        pred = self._get_compiled_predicate()
         obj = self._obj
         show_expected = self.show_expected
         for element in group:
@@ -313,41 +735,132 @@ class RequiredPredicate(GroupRequirement):
         description = _build_description(self._obj)
         return differences, description
 
+    @property
+    def accepts_columns(self):
+        """True if the predicate is a tuple that can be checked one
+        column at a time.
+        """
+        pred = self._pred
+        return (self.__class__ in _predicate_fastpath_types
+                and self._memo is None
+                and pred.__class__ is Predicate
+                and not pred._inverted
+                and isinstance(pred.obj, tuple)
+                and len(pred.obj) > 1)
+
+    def _get_column_differences(self, chunks):
+        checks = _compile_positions(self._pred.obj)
+        obj = self._obj
+        show_expected = self.show_expected
+        for columns in chunks:
+            if len(columns) != len(checks):  # <- Every row fails.
+                for row in _iter_rows([columns]):
+                    yield _make_difference(row, obj, show_expected)
+                continue
+
+            # Each column is only checked for rows that have passed
+            # all previous columns (like the "and" of a tuple check).
+            size = len(columns[0])
+            passed = range(size)
+            for check, column in zip(checks, columns):
+                if check is None:
+                    continue
+                still_passed = []
+                for index in passed:
+                    try:
+                        if check(column[index]):
+                            still_passed.append(index)
+                    except TypeError:
+                        pass
+                passed = still_passed
+
+            if len(passed) == size:
+                continue
+            passed = set(passed)
+            for index in range(size):
+                if index not in passed:
+                    row = tuple(column[index] for column in columns)
+                    yield _make_difference(row, obj, show_expected)
+
+    def check_columns(self, chunks):
+        if not self.accepts_columns:
+            return super(RequiredPredicate, self).check_columns(chunks)
+        differences = self._get_column_differences(chunks)
+        _, description = self.check_group([])  # <- Subclass description.
+        return differences, description
+
     def check_items(self, items):
         if self.__class__ is not RequiredPredicate:
             return super(RequiredPredicate, self).check_items(items)
 
-        pred = self._pred
+        pred = self._get_compiled_predicate()
         obj = self._obj
         show_expected = self.show_expected
         check_group = self.check_group
 
-        differences = []
-        for key, value in items:
-            if isinstance(value, BaseElement):
-                result = pred(value)
-                if not result:
-                    diff = _make_difference(value, obj, show_expected)
-                elif isinstance(result, BaseDifference):
-                    diff = result
+        memo = self._memo
+
+        def generate_differences():
+            for key, value in items:
+                if isinstance(value, BaseElement):
+                    if memo is not None:
+                        diff = memo(value)
+                        if diff is None:
+                            continue
+                        yield key, diff
+                        continue
+
+                    result = pred(value)
+                    if not result:
+                        diff = _make_difference(value, obj, show_expected)
+                    elif isinstance(result, BaseDifference):
+                        diff = result
+                    else:
+                        continue
                 else:
-                    continue
-            else:
-                diff, desc = check_group(value)
-                first_element, diff = iterpeek(diff, None)
-                if not first_element:
-                    continue
-            differences.append((key, diff))
+                    diff, desc = check_group(value)
+                    first_element, diff = iterpeek(diff, None)
+                    if not first_element:
+                        continue
+                yield key, diff
 
         description = _build_description(obj)
-        return differences, description
+        return generate_differences(), description
+
+    def _accumulator(self):
+        if self.__class__ not in _predicate_fastpath_types:
+            return super(RequiredPredicate, self)._accumulator()
+        return _ElementAccumulator(self, self._memo or self._check_element)
+
+    def valid_group(self, group):
+        if self.__class__ not in _predicate_fastpath_types:
+            return super(RequiredPredicate, self).valid_group(group)
+
+        array_differences = self._get_array_differences(group)
+        if array_differences is not None:
+            return next(array_differences, NOVALUE) is NOVALUE
+
+        memo = self._memo
+        if memo is not None:
+            for element in group:
+                if memo(element) is not None:
+                    return False
+            return True
+
+        pred = self._get_compiled_predicate()
+        for element in group:
+            result = pred(element)
+            if not result or isinstance(result, BaseDifference):
+                return False
+        return True
 
 
 class RequiredRegex(RequiredPredicate):
     """Require that strings match the given regular expression."""
-    def __init__(self, obj, flags=0, show_expected=False):
+    def __init__(self, obj, flags=0, show_expected=False, cache_size=None):
         self.flags = flags
-        super(RequiredRegex, self).__init__(obj, show_expected=show_expected)
+        super(RequiredRegex, self).__init__(obj, show_expected=show_expected,
+                                            cache_size=cache_size)
 
     def predicate_factory(self, obj):
         """Return Predicate object where string components have been
@@ -413,6 +926,12 @@ class RequiredApprox(RequiredPredicate):
             return Predicate(tuple(approx_or_orig(x) for x in obj))
         return Predicate(approx_or_orig(obj))
 
+    def _candidate_mask(self, array):
+        obj = self._obj
+        if not isinstance(obj, Number):
+            return None
+        return _vectorized.approx_mask(array, obj, self.places, self.delta)
+
     def _get_description(self):
         if self.delta is not None:
             return 'not equal within delta of {0}'.format(self.delta)
@@ -430,26 +949,30 @@ class RequiredFuzzy(RequiredPredicate):
     Similarity measures are determined using the ratio() method
     of the difflib.SequenceMatcher class. The values range from
     1.0 (exactly the same) to 0.0 (completely different).
+
+    A set made up only of strings is treated as a fuzzy membership
+    requirement--a value passes if it matches any of the set's
+    members. Other sets are matched exactly.
     """
-    def __init__(self, obj, cutoff=0.6, show_expected=False):
+    def __init__(self, obj, cutoff=0.6, show_expected=False, cache_size=None):
         self.cutoff = cutoff
-        super(RequiredFuzzy, self).__init__(obj, show_expected=show_expected)
+        super(RequiredFuzzy, self).__init__(obj, show_expected=show_expected,
+                                            cache_size=cache_size)
 
     def predicate_factory(self, obj):
         """Return Predicate object where string components have been
-        replaced with fuzzy_match() function.
+        replaced with fuzzy matching functions. Sets of strings are
+        replaced with a FuzzyIndex that matches values similar to any
+        of the set's members.
         """
-        cutoff = self.cutoff
-        def fuzzy_match(cutoff, a, b):
-            try:
-                matcher = difflib.SequenceMatcher(a=a, b=b)
-                return matcher.ratio() >= cutoff
-            except TypeError:
-                return False
+        fuzzy_match = FuzzyMatcher(self.cutoff)
 
         def fuzzy_or_orig(a):
             if isinstance(a, string_types):
-                return partial(fuzzy_match, cutoff, a)
+                return partial(fuzzy_match, a)
+            if (isinstance(a, set) and a
+                    and all(isinstance(x, string_types) for x in a)):
+                return FuzzyIndex(a, self.cutoff, fuzzy_match)
             return a
 
         if isinstance(obj, tuple):
@@ -518,13 +1041,29 @@ class RequiredInterval(RequiredPredicate):
             raise TypeError("must provide at least one: 'min' or 'max'")
 
         self._description = description
+        self._min = min
+        self._max = max
         super(RequiredInterval, self).__init__(interval, show_expected=show_expected)
 
+    def _candidate_mask(self, array):
+        return _vectorized.interval_mask(array, self._min, self._max)
+
     def check_group(self, group):
         differences, _ = super(RequiredInterval, self).check_group(group)
         return differences, self._description
 
 
+# Predicate requirements whose differences come directly from
+# _get_differences() and can safely use the valid_group() fast path.
+_predicate_fastpath_types = (
+    RequiredPredicate,
+    RequiredRegex,
+    RequiredApprox,
+    RequiredFuzzy,
+    RequiredInterval,
+)
+
+
 class RequiredSet(GroupRequirement):
     """A requirement to test data for set membership."""
     def __init__(self, requirement):
@@ -532,13 +1071,26 @@ class RequiredSet(GroupRequirement):
             requirement = set(requirement)
         self._set = requirement
 
+    def _accumulator(self):
+        return _BufferedAccumulator(self, distinct=True)
+
     def check_group(self, group):
         requirement = self._set
 
+        array = _vectorized.as_array(group)
+        if array is not None:
+            # Results only depend on distinct elements.
+            group = _vectorized.distinct_elements(array) or group
+
         matches = set()
-        extras = set()
+        extras = _DeepHashSet()
         for element in group:
-            if element in requirement:
+            try:
+                is_match = element in requirement
+            except TypeError:
+                is_match = False  # <- Unhashable objects can't be in a set.
+
+            if is_match:
                 matches.add(element)
             else:
                 extras.add(element)  # <- Build set of Extras so we
@@ -551,6 +1103,23 @@ class RequiredSet(GroupRequirement):
         )
         return differences, 'does not satisfy set membership'
 
+    def valid_group(self, group):
+        requirement = self._set
+
+        array = _vectorized.as_array(group)
+        if array is not None:
+            group = _vectorized.distinct_elements(array) or group
+
+        matches = set()
+        for element in group:
+            try:
+                if element not in requirement:
+                    return False  # <- EXIT! (element would be an Extra)
+            except TypeError:
+                return False  # <- EXIT! (unhashable element is an Extra)
+            matches.add(element)
+        return len(matches) == len(requirement)
+
 
 _subset_superset_warning = """subset and superset warning:
 
@@ -587,6 +1156,9 @@ class RequiredSuperset(GroupRequirement):
             requirement = set(requirement)
         self._set = requirement
 
+    def _accumulator(self):
+        return _BufferedAccumulator(self, distinct=True)
+
     def check_group(self, group):
         missing = self._set.copy()
         for element in group:
@@ -609,7 +1181,14 @@ class RequiredSubset(GroupRequirement):
             requirement = set(requirement)
         self._set = requirement
 
+    def _accumulator(self):
+        return _BufferedAccumulator(self, distinct=True)
+
     def check_group(self, group):
+        array = _vectorized.as_array(group)
+        if array is not None:
+            group = _vectorized.distinct_elements(array) or group
+
         superset = self._set
         extras = set()
         for element in group:
@@ -620,17 +1199,22 @@ class RequiredSubset(GroupRequirement):
         description = 'may only contain elements of given requirement'
         return differences, description
 
+    def valid_group(self, group):
+        superset = self._set
+        for element in group:
+            if element not in superset:
+                return False
+        return True
+
 
 class RequiredUnique(GroupRequirement):
     """A requirement to test that elements are unique."""
     @staticmethod
     def _generate_differences(group):
-        seen = set()
+        seen = _DeepHashSet()
         for element in group:
-            if element in seen:
+            if not seen.add(element):
                 yield Extra(element)
-            else:
-                seen.add(element)
 
     def check_group(self, group):
         if isinstance(group, BaseElement):
@@ -638,9 +1222,41 @@ class RequiredUnique(GroupRequirement):
             msg = 'expected non-tuple, non-string sequence, got {0}: {1!r}'
             raise ValueError(msg.format(cls_name, group))
 
-        differences = self._generate_differences(group)
+        array = _vectorized.as_array(group)
+        positions = None if array is None else _vectorized.duplicate_positions(array)
+        if positions is not None:
+            differences = (Extra(array[i]) for i in positions)
+        else:
+            differences = self._generate_differences(group)
         return differences, 'elements should be unique'
 
+    def _accumulator(self):
+        seen = _DeepHashSet()
+
+        def check(element):
+            if not seen.add(element):
+                return Extra(element)
+            return None
+
+        return _ElementAccumulator(self, check)
+
+    def valid_group(self, group):
+        if isinstance(group, BaseElement):
+            cls_name = group.__class__.__name__
+            msg = 'expected non-tuple, non-string sequence, got {0}: {1!r}'
+            raise ValueError(msg.format(cls_name, group))
+
+        array = _vectorized.as_array(group)
+        positions = None if array is None else _vectorized.duplicate_positions(array)
+        if positions is not None:
+            return len(positions) == 0
+
+        seen = _DeepHashSet()
+        for element in group:
+            if not seen.add(element):
+                return False
+        return True
+
     def check_data(self, data):
         data = normalize(data, lazy_evaluation=True)
 
@@ -652,13 +1268,32 @@ class RequiredUnique(GroupRequirement):
 
         return self.check_group(data)
 
+    def valid_data(self, data):
+        data = normalize(data, lazy_evaluation=True)
+
+        if isinstance(data, Mapping):
+            data = IterItems(data)
+
+        if isinstance(data, IterItems):
+            return self.valid_items(data, autowrap=False)
+
+        return self.valid_group(data)
+
 
 class RequiredOrder(GroupRequirement):
-    """A requirement to test data for element order."""
-    def __init__(self, sequence):
+    """A requirement to test data for element order.
+
+    The *engine* used to compare sequences can be ``'difflib'``,
+    ``'myers'``, ``'patience'``, or a function that returns opcodes
+    in the format of difflib.SequenceMatcher.get_opcodes(). The
+    default, ``'auto'``, uses difflib for short sequences and
+    patience diff (backed by Myers' algorithm) for long ones.
+    """
+    def __init__(self, sequence, engine='auto'):
         if not isinstance(sequence, Sequence):
             sequence = list(sequence)
         self.sequence = sequence
+        self._get_opcodes = get_engine(engine)
 
     def _generate_differences(self, group):
         if not isinstance(group, Sequence):
@@ -668,14 +1303,15 @@ class RequiredOrder(GroupRequirement):
 
         try:
             # Try sequences directly.
-            matcher = difflib.SequenceMatcher(a=group, b=requirement)
+            opcodes = self._get_opcodes(group, requirement)
         except TypeError:
             # Fall-back to slower proxy method when needed.
-            data_proxy = tuple(_deephash(x) for x in group)
-            required_proxy = tuple(_deephash(x) for x in requirement)
-            matcher = difflib.SequenceMatcher(a=data_proxy, b=required_proxy)
+            deephash = _DeepHasher()
+            data_proxy = tuple(deephash(x) for x in group)
+            required_proxy = tuple(deephash(x) for x in requirement)
+            opcodes = self._get_opcodes(data_proxy, required_proxy)
 
-        for tag, istart, istop, jstart, jstop in matcher.get_opcodes():
+        for tag, istart, istop, jstart, jstop in opcodes:
             if tag == 'insert':
                 jvalues = requirement[jstart:jstop]
                 for value in jvalues:
@@ -709,12 +1345,170 @@ class RequiredOrder(GroupRequirement):
         return differences, 'does not match required order'
 
 
+class RequiredSorted(GroupRequirement):
+    """A requirement to test that elements are in sorted order.
+
+    Data is consumed in a single pass and only the previous element's
+    key is kept, so iterators and database cursors of any length can
+    be checked without being loaded into memory. Elements that are
+    out of order relative to the element before them are reported as
+    :class:`Invalid` differences of ``(index, value)`` pairs. Elements
+    that can not be compared with the element before them (like ``1``
+    and ``'a'``) are also reported as out of order.
+
+    The *key* and *reverse* arguments work as they do for the built-in
+    :func:`sorted`. When *strict* is True, equal neighbors are also
+    considered out of order.
+
+    When checking mapping data, *key* can also be a mapping of group
+    keys to key functions. Groups without an entry in the *key* mapping
+    are checked in natural order (as if their key function was None)
+    and entries for groups that are not present in the data are
+    ignored--a missing group has no elements to be out of order.
+    Because *key* is the first argument, this class can also be used
+    as a factory for :class:`RequiredMapping`.
+    """
+    def __init__(self, key=None, reverse=False, strict=False):
+        if key is NOVALUE:
+            key = None  # <- Group has no entry in a RequiredMapping.
+        self.key = key
+        self.reverse = reverse
+        self.strict = strict
+
+    def _is_out_of_order(self, previous, current):
+        if self.reverse:
+            previous, current = current, previous
+        if self.strict:
+            return not previous < current
+        return current < previous
+
+    def _generate_differences(self, group, key):
+        is_out_of_order = self._is_out_of_order
+
+        iterator = enumerate(group)
+        for _, value in iterator:
+            previous = key(value) if key else value
+            break
+        else:
+            return  # <- Empty group, nothing to check.
+
+        for index, value in iterator:
+            current = key(value) if key else value
+            try:
+                out_of_order = is_out_of_order(previous, current)
+            except TypeError:
+                out_of_order = True  # <- Values can not be compared.
+            if out_of_order:
+                yield Invalid((index, value))
+            previous = current
+
+    def _description(self):
+        if self.reverse:
+            order = 'strictly descending' if self.strict else 'descending'
+        else:
+            order = 'strictly ascending' if self.strict else 'ascending'
+        return 'elements are not in {0} order'.format(order)
+
+    def check_group(self, group):
+        if isinstance(group, BaseElement):
+            cls_name = group.__class__.__name__
+            msg = 'expected non-tuple, non-string sequence, got {0}: {1!r}'
+            raise ValueError(msg.format(cls_name, group))
+
+        if isinstance(self.key, Mapping):
+            msg = ('a mapping of keys can only be used to check mapping '
+                   'data, got {0}')
+            raise ValueError(msg.format(group.__class__.__name__))
+
+        differences = self._generate_differences(group, self.key)
+        return differences, self._description()
+
+    def _iter_item_differences(self, items):
+        """Yield ``(key, differences)`` pairs for groups in *items*
+        that are not in order, using a key function from the *key*
+        mapping for each group.
+        """
+        key_functions = self.key
+        for item_key, value in items:
+            if isinstance(value, BaseElement):
+                continue  # <- A single element is always in order.
+            key = key_functions.get(item_key, None)
+            differences = self._generate_differences(value, key)
+            first_item, differences = iterpeek(differences, None)
+            if first_item:
+                yield item_key, differences
+
+    def check_items(self, items, autowrap=True):
+        if not isinstance(self.key, Mapping):
+            return super(RequiredSorted, self).check_items(items, autowrap)
+        differences = self._iter_item_differences(items)
+        return differences, self._description()
+
+    def valid_items(self, items, autowrap=True):
+        if not isinstance(self.key, Mapping):
+            return super(RequiredSorted, self).valid_items(items, autowrap)
+        for _ in self._iter_item_differences(items):
+            return False
+        return True
+
+    def valid_group(self, group):
+        for _ in self.check_group(group)[0]:
+            return False
+        return True
+
+
+def _is_plain_value(obj):
+    """Return True if *obj* is matched using the "==" operator when
+    used as a predicate (i.e., it has no special matching behavior).
+    """
+    return not isinstance(obj, MatcherBase) and get_matcher(obj) is obj
+
+
+def _bulk_equal(group, values):
+    """Return True if *group* is known to equal the list of plain
+    *values* at every position. Returns False when the group is not
+    equal or when equality can not be determined in bulk (in which
+    case positions should be compared one-by-one).
+    """
+    numpy = sys.modules.get('numpy', None)
+    if numpy and isinstance(group, numpy.ndarray):
+        if group.ndim != 1 or len(group) != len(values):
+            return False
+        try:
+            # Expected values are kept as objects so they are compared
+            # with "==" as-is (not coerced to a common dtype first).
+            expected = numpy.empty(len(values), dtype=object)
+            expected[:] = values
+            result = expected == group  # Vectorized equality.
+            if not isinstance(result, numpy.ndarray) or result.shape != group.shape:
+                return False
+            return bool(result.all())
+        except (TypeError, ValueError):
+            return False
+
+    if isinstance(group, tuple):
+        group = list(group)
+    elif not isinstance(group, list):
+        return False  # <- Iterators can not be compared and then re-used.
+
+    try:
+        return bool(values == group)
+    except (TypeError, ValueError):
+        return False
+
+
 class RequiredSequence(GroupRequirement):
     """A requirement to test elements in data against an *iterable*
     of predicate matches (compared by iteration order). If *factory*
     is given, it should be a callable object of one argument that
     accepts the data under test and returns a requirement instance
     that is a subclass of GroupRequirement.
+
+    When using the default factory, *iterable* is compiled the first
+    time it's used: positions with plain values are compared directly
+    with the "==" operator and predicates are only built for positions
+    that need them (types, regexes, callables, etc.). If every position
+    is a plain value, list and array data are first compared in bulk.
     """
     def __init__(self, iterable, factory=None):
         if not nonstringiter(iterable):
@@ -723,52 +1517,192 @@ class RequiredSequence(GroupRequirement):
         if not factory:
             factory = RequiredPredicate
         self._grouprequirement_factory = factory
-
-    def _generate_differences(self, group):
-        factory = self._grouprequirement_factory
-
-        zipped = zip_longest(group, self.iterable, fillvalue=NOVALUE)
-        for actual, expected in zipped:
-            if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
-                                              #    to use `is` here, do NOT
-                                              #    check using isinstance().
-                pred = Predicate(expected)
+        self._compiled = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_compiled'] = None  # <- Rebuilt as needed.
+        return state
+
+    def _get_compiled(self):
+        """Return a tuple of three items: a list of expected values,
+        a list of Predicate objects for each position (or None for
+        positions with plain values), and a boolean that is True when
+        all positions contain plain values.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            values = list(self.iterable)
+            predicates = [None if _is_plain_value(x) else Predicate(x) for x in values]
+            all_plain = all(x is None for x in predicates)
+            compiled = (values, predicates, all_plain)
+            if isinstance(self.iterable, Sequence):
+                self._compiled = compiled  # <- Cache only if re-iterable.
+        return compiled
+
+    def _generate_predicate_differences(self, group):
+        values, predicates, all_plain = self._get_compiled()
+        if all_plain and _bulk_equal(group, values):
+            return  # <- EXIT!
+
+        zipped = zip_longest(group, values, predicates, fillvalue=NOVALUE)
+        for actual, expected, pred in zipped:
+            if pred is None or pred is NOVALUE:
+                try:
+                    if expected == actual:
+                        continue
+                except TypeError:
+                    pass
+                yield _make_difference(actual, expected, show_expected=True)
+            else:
                 result = pred(actual)
                 if not result:
                     yield _make_difference(actual, expected, show_expected=True)
                 elif isinstance(result, BaseDifference):
                     yield result
-            else:
-                # Get requirement.
-                requirement = factory(expected)
-                if isinstance(requirement, RequiredPredicate):
-                    requirement.show_expected = True
 
-                # Check element as group and yield unwrapped result.
-                diff, desc = requirement.check_group([actual])
-                diff = list(diff)
-                if diff:
-                    if len(diff) > 1:
-                        msg = 'expected 0 or 1 differences, got {0}: {1!r}'
-                        raise ValueError(msg.format(len(diff), diff))
-                    yield diff[0]
+    def _generate_differences(self, group):
+        factory = self._grouprequirement_factory
+
+        if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
+                                          #    to use `is` here, do NOT
+                                          #    check using isinstance().
+            return self._generate_predicate_differences(group)
+
+        return self._generate_factory_differences(group)
+
+    def _generate_factory_differences(self, group):
+        factory = self._grouprequirement_factory
+
+        zipped = zip_longest(group, self.iterable, fillvalue=NOVALUE)
+        for actual, expected in zipped:
+            # Get requirement.
+            requirement = factory(expected)
+            if isinstance(requirement, RequiredPredicate):
+                requirement.show_expected = True
+
+            # Check element as group and yield unwrapped result.
+            diff, desc = requirement.check_group([actual])
+            diff = list(diff)
+            if diff:
+                if len(diff) > 1:
+                    msg = 'expected 0 or 1 differences, got {0}: {1!r}'
+                    raise ValueError(msg.format(len(diff), diff))
+                yield diff[0]
 
     def check_group(self, group):
         differences = self._generate_differences(group)
         return differences, 'does not match required sequence'
 
+    def valid_group(self, group):
+        factory = self._grouprequirement_factory
+
+        if factory is RequiredPredicate:  # <- Use `is`, see above.
+            values, predicates, all_plain = self._get_compiled()
+            if all_plain and _bulk_equal(group, values):
+                return True
+
+            zipped = zip_longest(group, values, predicates, fillvalue=NOVALUE)
+            for actual, expected, pred in zipped:
+                if pred is None or pred is NOVALUE:
+                    try:
+                        if expected == actual:
+                            continue
+                    except TypeError:
+                        pass
+                    return False
+                result = pred(actual)
+                if not result or isinstance(result, BaseDifference):
+                    return False
+            return True
+
+        zipped = zip_longest(group, self.iterable, fillvalue=NOVALUE)
+        for actual, expected in zipped:
+            if not factory(expected).valid_group([actual]):
+                return False
+        return True
+
+
+class _MappingEntry(object):
+    """The objects used to check values for a single key of a
+    RequiredMapping. Entries are built the first time a key is seen
+    and requirements are only constructed when first needed.
+    """
+    __slots__ = ('expected', 'factory', 'predicate',
+                 '_group_requirement', '_element_requirement')
+
+    def __init__(self, expected, factory):
+        self.expected = expected
+        self.factory = factory
+        if factory is RequiredPredicate:  # <- Use `is`, see check_items().
+            self.predicate = Predicate(expected)
+        else:
+            self.predicate = None
+        self._group_requirement = None
+        self._element_requirement = None
+
+    def group_requirement(self):
+        """Return requirement used to check groups of values."""
+        requirement = self._group_requirement
+        if requirement is None:
+            factory = self.factory
+            requirement = factory(self.expected) if factory else self.expected
+            self._group_requirement = requirement
+        return requirement
+
+    def element_requirement(self):
+        """Return requirement used to check single elements (these
+        show expected values in their differences).
+        """
+        requirement = self._element_requirement
+        if requirement is None:
+            factory = self.factory
+            requirement = factory(self.expected) if factory else self.expected
+            if isinstance(requirement, RequiredPredicate):
+                requirement.show_expected = True
+            self._element_requirement = requirement
+        return requirement
+
 
 class RequiredMapping(ItemsRequirement):
     """A requirement to test a mapping of data against a *mapping* of
     required objects. If *factory* is given, it should be a callable
     object of one argument that accepts the data under test and returns
     a requirement instance that is a subclass of GroupRequirement.
+
+    When the same RequiredMapping instance is used more than once, the
+    predicates and requirements for each key are built on the second
+    use and then reused (a single use builds them once, as needed, and
+    does not keep them). For this reason, *mapping* should not be
+    modified after the requirement is created. The built objects live
+    as long as the requirement, so reusing an instance with a very
+    large mapping keeps an object for each key in memory. They are
+    not pickled--they are rebuilt as needed after unpickling.
     """
     def __init__(self, mapping, factory=None):
         if not isinstance(mapping, Mapping):
             mapping = dict(mapping)
         self.mapping = mapping
         self._grouprequirement_factory = factory
+        self._entries = None  # <- Created after first use.
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_entries'] = None  # <- Rebuilt as needed (may hold closures).
+        return state
+
+    def _get_entry(self, key):
+        """Return the _MappingEntry for the given *key*. Entries are
+        only kept after the requirement's first use.
+        """
+        entries = self._entries
+        entry = None if entries is None else entries.get(key)
+        if entry is None:
+            expected = self.mapping.get(key, NOVALUE)
+            entry = _MappingEntry(expected, self.abstract_factory(expected))
+            if entries is not None and expected is not NOVALUE:
+                entries[key] = entry
+        return entry
 
     def abstract_factory(self, obj):
         """Return a group requirement type appropriate for the given
@@ -788,20 +1722,13 @@ class RequiredMapping(ItemsRequirement):
 
         return RequiredPredicate
 
-    @staticmethod
-    def _update_description(current, new):
-        if current == new or current is _INCONSISTENT or new is NOVALUE:
-            return current
-
-        if not current:
-            return new
-
-        return _INCONSISTENT
-
-    def check_items(self, items):
+    def _iter_item_results(self, items, entries):
+        """Yield a ``(key, differences, description)`` tuple for each
+        item that does not satisfy the requirement of its key followed
+        by tuples for required keys that are missing from *items*. When
+        *entries* is None, the objects for each key are not kept.
+        """
         required_mapping = self.mapping
-        differences = []
-        description = ''
 
         # Check values using requirement of corresponding key.
         keys_seen = set()
@@ -815,8 +1742,14 @@ class RequiredMapping(ItemsRequirement):
 
             keys_seen.add(key)
 
-            expected = required_mapping.get(key, NOVALUE)
-            factory = self.abstract_factory(expected)
+            if entries is None:  # <- First use, entries are not kept.
+                entry = None
+                expected = required_mapping.get(key, NOVALUE)
+                factory = self.abstract_factory(expected)
+            else:
+                entry = entries.get(key) or self._get_entry(key)
+                expected = entry.expected
+                factory = entry.factory
 
             if isinstance(value, BaseElement):
                 if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
@@ -826,22 +1759,23 @@ class RequiredMapping(ItemsRequirement):
                     # Note: Performance benchmarking shows that this
                     # optimization can finish in 72% of the time it
                     # takes for the unoptimized case.
-                    pred = Predicate(expected)
+                    if entry is None:
+                        pred = Predicate(expected)
+                    else:
+                        pred = entry.predicate
                     result = pred(value)
                     if not result:
                         diff = _make_difference(value, expected, show_expected=True)
-                        differences.append((key, diff))
-                        desc = _build_description(expected)
-                        description = self._update_description(description, desc)
+                        yield key, diff, _build_description(expected)
                     elif isinstance(result, BaseDifference):
-                        differences.append((key, result))
-                        desc = _build_description(expected)
-                        description = self._update_description(description, desc)
+                        yield key, result, _build_description(expected)
                 else:
-                    # Get requirement.
-                    requirement = factory(expected) if factory else expected
-                    if isinstance(requirement, RequiredPredicate):
-                        requirement.show_expected = True
+                    if entry is None:
+                        requirement = factory(expected) if factory else expected
+                        if isinstance(requirement, RequiredPredicate):
+                            requirement.show_expected = True
+                    else:
+                        requirement = entry.element_requirement()
 
                     # Check element as group and unwrap single element result.
                     diff, desc = requirement.check_group([value])
@@ -849,34 +1783,204 @@ class RequiredMapping(ItemsRequirement):
                     if len(diff) == 1:
                         diff = diff[0]  # Unwrap if single difference.
                     if diff:
-                        differences.append((key, diff))
-                        description = self._update_description(description, desc)
+                        yield key, diff, desc
             else:
                 # Normal group handling (`value` is already a group).
-                requirement = factory(expected) if factory else expected
+                if entry is None:
+                    requirement = factory(expected) if factory else expected
+                else:
+                    requirement = entry.group_requirement()
                 diff, desc = requirement.check_group(value)
                 first_item, diff = iterpeek(diff, None)
                 if first_item:
-                    differences.append((key, diff))
-                    description = self._update_description(description, desc)
+                    yield key, diff, desc
 
         # Check for expected keys that are missing from items.
         for key, expected in IterItems(required_mapping):
             if key not in keys_seen:
-                factory = self.abstract_factory(expected)
-                requirement = factory(expected) if factory else expected
+                entry = None if entries is None else entries.get(key)
+                if entry is None:
+                    factory = self.abstract_factory(expected)
+                    requirement = factory(expected) if factory else expected
+                else:
+                    requirement = entry.group_requirement()
 
                 diff, desc = requirement.check_group([])  # Try empty container.
                 first_item, diff = iterpeek(diff, None)
                 if not first_item:
                     diff = _make_difference(NOVALUE, expected)
-                differences.append((key, diff))
-                description = self._update_description(description, desc)
+                yield key, diff, desc
 
-        if description is _INCONSISTENT or not description:
+    def check_items(self, items):
+        """Check *items* and return an iterator of (key, differences)
+        pairs and a description. Items are only checked as far as the
+        first difference before returning (the description is taken
+        from that difference), the rest are checked as the pairs are
+        consumed.
+        """
+        entries = self._entries
+        if entries is None:
+            self._entries = {}  # <- Build and keep entries on next use.
+
+        results = self._iter_item_results(items, entries)
+        first_result = next(results, None)
+        if first_result is None:
+            return [], 'does not satisfy mapping requirements'
+        key, diff, description = first_result
+        if not description:
             description = 'does not satisfy mapping requirements'
+        differences = chain([(key, diff)], ((k, d) for k, d, _ in results))
         return differences, description
 
+    def valid_items(self, items):
+        required_mapping = self.mapping
+        get_entry = self._get_entry
+
+        keys_seen = set()
+        for item in items:
+            try:
+                key, value = item
+            except ValueError:
+                msg = ('item {0!r} is not a valid key/value pair; {1} '
+                       'expects a mapping or iterable of key/value pairs')
+                raise ValueError(msg.format(item, self.__class__.__name__))
+
+            keys_seen.add(key)
+            entry = get_entry(key)
+
+            if isinstance(value, BaseElement):
+                if entry.factory is RequiredPredicate:  # <- Use `is`, see above.
+                    result = entry.predicate(value)
+                    if not result or isinstance(result, BaseDifference):
+                        return False
+                    continue
+                value = [value]  # Wrap element to treat it as a group.
+
+            if not entry.group_requirement().valid_group(value):
+                return False
+
+        # Any expected key that is missing from items is a difference.
+        for key in required_mapping:
+            if key not in keys_seen:
+                return False
+        return True
+
+
+class RequiredAll(GroupRequirement):
+    """A requirement to test data against several requirements at
+    once. The given *requirements* can be an iterable of requirement
+    objects (or objects accepted by :func:`get_requirement`) or a
+    mapping of labels to requirement objects. Requirements can also
+    be combined with the ``&`` operator::
+
+        requirement = RequiredInterval(0, 100) & RequiredUnique()
+
+    When *data* is a group of elements, each element is pushed to
+    every requirement in a single pass, so the data can be an
+    iterator or a database cursor. Predicate and uniqueness
+    requirements check elements as they arrive, others keep the
+    elements (or just the distinct elements, for set requirements)
+    they need.
+
+    Differences are labeled by requirement. Labels are taken from
+    the given mapping or else from each requirement's description.
+    For a group of elements, differences are keyed by label and for
+    a mapping of groups, they are keyed by ``(label, key)`` tuples.
+
+    When a RequiredAll is used to check a single group (e.g., as a
+    value in a mapping of requirements), the differences from all of
+    the requirements are combined without labels.
+    """
+    def __init__(self, requirements):
+        if isinstance(requirements, Mapping):
+            pairs = [(label, get_requirement(obj))
+                     for label, obj in requirements.items()]
+        else:
+            pairs = []
+            for obj in requirements:
+                obj = get_requirement(obj)
+                if isinstance(obj, RequiredAll):
+                    pairs.extend(obj._requirements)
+                else:
+                    pairs.append((None, obj))
+
+        if not pairs:
+            raise ValueError('requires at least one requirement')
+        self._requirements = pairs
+
+    @property
+    def requirements(self):
+        """A list of the combined requirement objects."""
+        return [requirement for _, requirement in self._requirements]
+
+    def _check_group(self, group):
+        accumulators = [req._accumulator() for req in self.requirements]
+        pushes = [accumulator.push for accumulator in accumulators]
+        for element in group:
+            for push in pushes:
+                push(element)
+        return [accumulator.finish() for accumulator in accumulators]
+
+    def check_group(self, group):
+        results = self._check_group(group)
+        differences = []
+        descriptions = []
+        for requirement, result in zip(self.requirements, results):
+            result = requirement._normalize(result)
+            if result is not None:
+                differences.append(result[0])
+                descriptions.append(result[1])
+
+        if len(descriptions) == 1:
+            description = descriptions[0]
+        else:
+            description = 'does not satisfy all requirements'
+        return chain.from_iterable(differences), description
+
+    def valid_data(self, data):
+        # Mappings are checked with check_data() rather than group-by-
+        # group because some of the requirements may be items-based.
+        result = self.check_data(data)
+        return self._normalize(result) is None
+
+    def check_data(self, data):
+        data = normalize(data, lazy_evaluation=True)
+
+        if isinstance(data, Mapping):
+            data = IterItems(data)
+
+        if isinstance(data, IterItems):
+            items = [(k, list(v) if nonstringiter(v) and exhaustible(v) else v)
+                     for k, v in data]
+            results = [req.check_data(IterItems(items))
+                       for req in self.requirements]
+        elif isinstance(data, BaseElement):
+            results = [req.check_data(data) for req in self.requirements]
+        else:
+            results = self._check_group(data)
+
+        differences = []
+        labels_seen = set()
+        for index, (label, requirement) in enumerate(self._requirements):
+            result = requirement._normalize(results[index])
+            if result is None:
+                continue
+            diffs, description = result
+
+            if label is None:
+                label = description
+                if label in labels_seen:
+                    label = '{0} ({1})'.format(description, index)
+            labels_seen.add(label)
+
+            first_item, diffs = iterpeek(diffs, NOVALUE)
+            if isinstance(first_item, tuple):
+                differences.extend(((label, k), v) for k, v in diffs)
+            else:
+                differences.append((label, diffs))
+
+        return differences, 'does not satisfy all requirements'
+
 
 def get_requirement(obj):
     """Return a requirement instance appropriate for the given *obj*."""
@@ -6,13 +6,21 @@ __all__ = [
     'ValidationError',
 ]
 
+import random
 import sys
+from heapq import nsmallest
+from operator import itemgetter
+from numbers import Integral
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Mapping
 from ._compatibility.collections.abc import Set
 from ._compatibility.functools import partial
+from ._compatibility.itertools import chain
+from ._compatibility.itertools import groupby
+from ._compatibility.itertools import islice
 
 from .differences import BaseDifference
+from .differences import NOVALUE
 from ._normalize import normalize
 from . import requirements
 from ._utils import BaseElement
@@ -26,18 +34,155 @@ from ._utils import _safesort_key
 __unittest = True  # Hides internal stack frames from unittest output.
 
 
+class RetainFirst(object):
+    """Retention policy that keeps the first *k* differences (per key
+    for mapping results) and discards the rest.
+    """
+    def __init__(self, k):
+        if not isinstance(k, Integral) or isinstance(k, bool) or k < 1:
+            raise ValueError('k must be a positive integer, got {0!r}'.format(k))
+        self.k = k
+
+    def retain(self, differences):
+        """Consume the *differences* iterable completely and return
+        a list of those differences that should be kept.
+        """
+        differences = iter(differences)
+        retained = list(islice(differences, self.k))
+        for _ in differences:
+            pass  # Exhaust iterator so every difference gets counted.
+        return retained
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.k)
+
+
+class RetainSample(RetainFirst):
+    """Retention policy that keeps a uniform random sample of *k*
+    differences (per key for mapping results) using reservoir
+    sampling. If given, *seed* is used to make the sample
+    reproducible.
+    """
+    def __init__(self, k, seed=None):
+        super(RetainSample, self).__init__(k)
+        self.seed = seed
+
+    def retain(self, differences):
+        k = self.k
+        randrange = random.Random(self.seed).randrange
+        reservoir = []
+        for index, diff in enumerate(differences):
+            if index < k:
+                reservoir.append(diff)
+            else:
+                position = randrange(index + 1)
+                if position < k:
+                    reservoir[position] = diff
+        return reservoir
+
+    def __repr__(self):
+        if self.seed is None:
+            return super(RetainSample, self).__repr__()
+        cls_name = self.__class__.__name__
+        return '{0}({1!r}, seed={2!r})'.format(cls_name, self.k, self.seed)
+
+
+def _get_retention(retain):
+    """Return a retention policy for the given *retain* value (an
+    integer is treated as the *k* argument for RetainFirst).
+    """
+    if isinstance(retain, RetainFirst):
+        return retain
+    return RetainFirst(retain)
+
+
+def _serialize_differences(differences, is_mapping, single_keys=None):
+    """Return an iterator of (key, difference) pairs. When results
+    are not a mapping, the key is always None. If a *single_keys* set
+    is given, keys whose value is a single difference (rather than a
+    container of differences) are added to it as they are reached.
+    """
+    if not is_mapping:
+        for diff in differences:
+            yield (None, diff)
+        return
+
+    for key, value in differences:
+        if nonstringiter(value):
+            for diff in value:
+                yield (key, diff)
+        else:
+            if single_keys is not None:
+                single_keys.add(key)
+            yield (key, value)
+
+
+def _count_differences(differences):
+    """Return the number of individual differences in a list of
+    differences or in a dict of differences and groups.
+    """
+    if isinstance(differences, dict):
+        return sum(len(x) if nonstringiter(x) else 1
+                   for x in differences.values())
+    return len(differences)
+
+
+def _lazy_sorted(collection, key):
+    """Yield items of *collection* in the same order as sorted()
+    but select them in growing batches with heapq.nsmallest() so
+    that callers who stop early avoid sorting the whole collection.
+    """
+    size = len(collection)
+    batch_size = 16
+    position = 0
+    while position < size:
+        batch = nsmallest(batch_size, collection, key=key)
+        for item in islice(batch, position, None):
+            yield item
+        position = len(batch)
+        batch_size *= 4
+
+
 class ValidationError(AssertionError):
     """This exception is raised when data validation fails."""
 
     __module__ = 'datatest'
 
-    def __init__(self, differences, description=None):
+    def __init__(self, differences, description=None, retain=None,
+                 lazy=False):
         if isinstance(differences, BaseDifference):
             differences = [differences]
         elif not nonstringiter(differences):
             msg = 'expected an iterable or mapping of differences, got {0}'
             raise TypeError(msg.format(differences.__class__.__name__))
 
+        if retain is not None or lazy:
+            # Differences are left unevaluated until they are needed.
+            if isinstance(differences, Mapping):
+                is_mapping = True
+                differences = IterItems(differences)
+            else:
+                first_item, differences = iterpeek(differences, NOVALUE)
+                if first_item is NOVALUE:
+                    raise ValueError('differences container must not be empty')
+                is_mapping = not isinstance(first_item, BaseDifference)
+                if is_mapping and not (isinstance(first_item, tuple)
+                                       and len(first_item) == 2):
+                    msg = ('expected differences or valid dictionary '
+                           'update sequences, found {0}: {1!r}')
+                    raise TypeError(msg.format(
+                        first_item.__class__.__name__, first_item))
+
+            single_keys = set() if is_mapping else None
+            stream = _serialize_differences(differences, is_mapping, single_keys)
+            first_item, stream = iterpeek(stream, NOVALUE)
+            if first_item is NOVALUE:
+                raise ValueError('differences container must not be empty')
+
+            self._init_stream(stream, is_mapping, description, retain)
+            self._single_keys = single_keys
+            return  # <- EXIT!
+
         # Convert dictionary update sequences to dict.
         if not isinstance(differences, Mapping):
             first_item, differences = iterpeek(differences)
@@ -71,12 +216,150 @@ class ValidationError(AssertionError):
         self._should_truncate = None
         self._truncation_notice = None
         self._sorted_str = True
+        self._partial = False  # True if differences were cut short.
+        self._stream = None    # Unevaluated (key, difference) pairs.
+        self._buffer = []      # Pairs already taken from the stream.
+        self._is_mapping = isinstance(differences, Mapping)
+        self._container = list  # Container type for evaluated groups.
+        self._retain = None    # Retention policy.
+        self._counts = None    # Total differences by (key, type).
+        self._single_keys = None  # Keys given a single difference.
+
+    def _init_stream(self, stream, is_mapping, description, retain):
+        """Initialize error from an iterator of (key, difference)
+        pairs that are consumed (using the given *retain* policy)
+        the first time differences are needed. When *retain* is
+        None, every difference is kept and the stream is consumed
+        only as far as needed to display the error.
+        """
+        self._differences = None
+        self._description = description
+        self._should_truncate = None
+        self._truncation_notice = None
+        self._sorted_str = retain is not None  # Lazy errors keep stream order.
+        self._partial = False
+        self._stream = stream
+        self._buffer = []
+        self._is_mapping = is_mapping
+        self._container = list
+        self._retain = _get_retention(retain) if retain is not None else None
+        self._counts = None
+        self._single_keys = None
+
+    @classmethod
+    def _from_stream(cls, stream, is_mapping, description=None, retain=None):
+        """Return a new error built from an iterator of non-empty
+        (key, difference) pairs. Keys must be contiguous.
+        """
+        err = cls.__new__(cls)
+        err._init_stream(stream, is_mapping, description, retain)
+        return err
+
+    def _detach_stream(self):
+        """Return an iterator of every (key, difference) pair that
+        has not been evaluated into the differences collection and
+        detach it from the error.
+        """
+        stream = chain(self._buffer, self._stream)
+        self._buffer = []
+        self._stream = None
+        return stream
+
+    def _pull_stream(self):
+        """Yield (key, difference) pairs from the unevaluated stream,
+        keeping each one in the buffer so it is not lost.
+        """
+        for item in self._stream:
+            self._buffer.append(item)
+            yield item
+
+    def _unwrap_group(self, key, group):
+        """Return the single difference in *group* if it should be
+        shown without a container, else return *group* itself.
+
+        When the keys that were given a single difference are known,
+        only groups for those keys are unwrapped. Otherwise (e.g., for
+        the remaining differences of an acceptance), any group with
+        one difference is unwrapped.
+        """
+        if len(group) != 1:
+            return group
+        single_keys = self._single_keys
+        if single_keys is None or key in single_keys:
+            return group[0]
+        return group
+
+    def _consume_stream(self):
+        """Count every difference in the stream and keep only those
+        selected by the retention policy. If there is no policy,
+        keep all of them.
+        """
+        if self._retain is None:
+            self._differences = self._deserialize_stream(self._detach_stream())
+            return  # <- EXIT!
+
+        counts = {}
+        def counted(stream):
+            for key, diff in stream:
+                count_key = (key, diff.__class__)
+                counts[count_key] = counts.get(count_key, 0) + 1
+                yield diff
+
+        retain = self._retain.retain
+        stream = self._detach_stream()
+        if self._is_mapping:
+            differences = {}
+            for key, group in groupby(stream, key=itemgetter(0)):
+                differences.setdefault(key, []).extend(retain(counted(group)))
+
+            # Unwrap groups that contain only a single difference.
+            totals = {}
+            for (key, _), count in counts.items():
+                totals[key] = totals.get(key, 0) + count
+            for key, total in totals.items():
+                if total == 1:
+                    differences[key] = self._unwrap_group(key, differences[key])
+        else:
+            differences = retain(counted(stream))
+
+        self._differences = differences
+        self._counts = counts
+
+    def _deserialize_stream(self, stream):
+        """Return a list or dict of differences built from an iterator
+        of (key, difference) pairs.
+        """
+        container = self._container
+        if not self._is_mapping:
+            return container(diff for _, diff in stream)
+
+        differences = {}
+        for key, group in self._grouped_stream(stream):
+            differences.setdefault(key, []).extend(group)
+
+        # Unwrap groups that contain only a single difference.
+        for key, value in list(differences.items()):
+            value = self._unwrap_group(key, value)
+            if container is not list and isinstance(value, list):
+                value = container(value)
+            differences[key] = value
+        return differences
+
+    @staticmethod
+    def _grouped_stream(stream):
+        """Yield (key, list_of_differences) pairs from an iterator of
+        (key, difference) pairs with contiguous keys.
+        """
+        for key, group in groupby(stream, key=itemgetter(0)):
+            yield key, [diff for _, diff in group]
 
     @property
     def differences(self):
         """A collection of "difference" objects to describe elements
         in the data under test that do not satisfy the requirement.
         """
+        if self._stream is not None:
+            self._consume_stream()
         return self._differences
 
     @property
@@ -87,13 +370,37 @@ class ValidationError(AssertionError):
     @property
     def args(self):
         """The tuple of arguments given to the exception constructor."""
-        return (self._differences, self._description)
+        return (self.differences, self._description)
+
+    def _iter_lines(self):
+        """Yield the lines of the error message one at a time."""
+        if self._should_truncate and self._stream is not None \
+                and self._retain is None and not self._sorted_str:
+            # Render lazy errors directly from the stream so that it
+            # is consumed no further than needed to display it.
+            is_lazy = True
+            buffered = islice(self._buffer, len(self._buffer))
+            stream = chain(buffered, self._pull_stream())
+            if self._is_mapping:
+                begin, end = '{', '}'
+                iterator = (
+                    (key, self._unwrap_group(key, group))
+                    for key, group in self._grouped_stream(stream)
+                )
+                format_diff = lambda x: '    {0!r}: {1!r},'.format(x[0], x[1])
+            else:
+                begin, end = '[', ']'
+                iterator = (diff for _, diff in stream)
+                format_diff = lambda x: '    {0!r},'.format(x)
 
-    def __str__(self):
         # Prepare a format-differences callable.
-        if isinstance(self._differences, dict):
+        elif isinstance(self.differences, dict):
+            is_lazy = False
             begin, end = '{', '}'
-            all_keys = sorted(self._differences.keys(), key=_safesort_key)
+            if self._should_truncate:
+                all_keys = _lazy_sorted(list(self._differences), _safesort_key)
+            else:
+                all_keys = sorted(self._differences.keys(), key=_safesort_key)
             def sorted_value(key):
                 value = self._differences[key]
                 if nonstringiter(value):
@@ -105,39 +412,74 @@ class ValidationError(AssertionError):
             iterator = iter((key, sorted_value(key)) for key in all_keys)
             format_diff = lambda x: '    {0!r}: {1!r},'.format(x[0], x[1])
         else:
+            is_lazy = False
             begin, end = '[', ']'
             sort_args = lambda diff: _safesort_key(diff.args)
-            if self._sorted_str:
+            if self._sorted_str and self._should_truncate:
+                iterator = _lazy_sorted(self._differences, sort_args)
+            elif self._sorted_str:
                 iterator = iter(sorted(self._differences, key=sort_args))
             else:
                 iterator = iter(self._differences)
             format_diff = lambda x: '    {0!r},'.format(x)
 
         # Format differences as a list of strings and get line count.
+        is_partial = self._partial
+        if is_lazy and self._is_mapping:
+            count_in = lambda x: len(x[1]) if nonstringiter(x[1]) else 1
+        else:
+            count_in = lambda x: 1
+        difference_count = None  # Counted from self._differences if None.
         if self._should_truncate:
             line_count = 0
             char_count = 0
             list_of_strings = []
+            if is_lazy:
+                difference_count = 0
             for x in iterator:                  # For-loop used to build list
                 line_count += 1                 # iteratively to optimize for
                 diff_string = format_diff(x)    # memory (in case the iter of
                 char_count += len(diff_string)  # diffs is extremely long).
+                if is_lazy:
+                    difference_count += count_in(x)
                 if self._should_truncate(line_count, char_count):
-                    line_count += sum(1 for x in iterator)
+                    if is_lazy:
+                        x = next(iterator, NOVALUE)
+                        if x is not NOVALUE:
+                            line_count += 1
+                            difference_count += count_in(x)
+                            is_partial = True  # Stream not fully consumed.
+                    else:
+                        line_count = len(self._differences)
                     end = '    ...'
                     if self._truncation_notice:
                         end += '\n\n{0}'.format(self._truncation_notice)
                     break
                 list_of_strings.append(diff_string)
+            iterator = iter(list_of_strings)
+            format_diff = lambda x: x
         else:
-            list_of_strings = [format_diff(x) for x in iterator]
-            line_count = len(list_of_strings)
-
-        # Prepare count-of-differences string.
-        count_message = '{0} difference{1}'.format(
-            line_count,
-            '' if line_count == 1 else 's',
+            line_count = len(self._differences)
+
+        # Prepare count-of-differences string. When the count is a
+        # lower bound, each difference in a group is counted.
+        if self._counts is not None:
+            total_count = sum(self._counts.values())
+        elif is_partial:
+            if difference_count is None:
+                difference_count = _count_differences(self._differences)
+            total_count = difference_count
+        else:
+            total_count = line_count
+        count_message = '{0}{1} difference{2}'.format(
+            'at least ' if is_partial else '',
+            total_count,
+            '' if total_count == 1 else 's',
         )
+        if self._counts is not None:
+            retained_count = _count_differences(self._differences)
+            if retained_count < total_count:
+                count_message += ', {0} retained'.format(retained_count)
 
         # Prepare description string.
         if self._description:
@@ -145,14 +487,23 @@ class ValidationError(AssertionError):
         else:
             description = count_message
 
-        # Prepare final output.
-        output = '{0}: {1}\n{2}\n{3}'.format(
-            description,
-            begin,
-            '\n'.join(list_of_strings),
-            end,
-        )
-        return output
+        # Yield final output.
+        yield '{0}: {1}'.format(description, begin)
+        for x in iterator:
+            yield format_diff(x)
+        yield end
+
+    def __str__(self):
+        return '\n'.join(self._iter_lines())
+
+    def write_to(self, file):
+        """Write the error message to the file-like object *file*
+        one line at a time (instead of building the whole message
+        as a single string).
+        """
+        for line in self._iter_lines():
+            file.write(line)
+            file.write('\n')
 
     def __repr__(self):
         cls_name = self.__class__.__name__
@@ -232,6 +583,71 @@ if sys.version_info[:2] >= (3, 7):
     ValidationError._render_traceback_ = _render_traceback_
 
 
+def _limit_differences(differences, max_differences):
+    """Return a 2-tuple containing a list of no more than
+    *max_differences* items from the given *differences* and a
+    boolean that is True if additional differences were found.
+
+    The *differences* can be an iterable of difference objects or an
+    iterable of key/value items whose values are differences or lazy
+    iterables of differences. Difference iterables are consumed no
+    further than needed to detect that the limit was exceeded.
+    """
+    differences = iter(differences)
+    first_item, differences = iterpeek(differences, NOVALUE)
+
+    if not isinstance(first_item, tuple):
+        limited = list(islice(differences, max_differences))
+        is_partial = next(differences, NOVALUE) is not NOVALUE
+        return limited, is_partial  # <- EXIT!
+
+    limited = []
+    remaining = max_differences
+    for key, value in differences:
+        if remaining < 1:
+            return limited, True  # <- EXIT!
+
+        if nonstringiter(value):
+            value = iter(value)
+            group = list(islice(value, remaining))
+            remaining -= len(group)
+            if group:
+                limited.append((key, group))
+            if next(value, NOVALUE) is not NOVALUE:
+                return limited, True  # <- EXIT!
+        else:
+            limited.append((key, value))
+            remaining -= 1
+    return limited, False
+
+
+def _apply_acceptances(differences, acceptances):
+    """Return *differences* filtered through the given *acceptances*
+    (innermost acceptance first) or None if all differences were
+    accepted.
+
+    The *differences* can be an iterable of difference objects or an
+    iterable of key/value items. Returned items contain a list of
+    differences or a single difference (when only one remains).
+    """
+    first_item, differences = iterpeek(differences)
+    is_mapping = isinstance(first_item, tuple)
+
+    stream = _serialize_differences(differences, is_mapping)
+    for acceptance in acceptances:
+        stream = acceptance._filterfalse(stream)
+
+    first_item, stream = iterpeek(stream, NOVALUE)
+    if first_item is NOVALUE:
+        return None  # <- EXIT!
+
+    if not is_mapping:
+        return (diff for _, diff in stream)
+
+    grouped = ValidationError._grouped_stream(stream)
+    return ((k, v[0] if len(v) == 1 else v) for k, v in grouped)
+
+
 def _pytest_tracebackhide(excinfo):
     """Pytest integration for hiding error tracebacks. To use, assign
     to the special traceback-hide value inside a function or method::
@@ -349,9 +765,106 @@ class ValidateType(object):
         When *requirement* is a subclass of :class:`BaseRequirement`,
         then validation and difference generation are delegated to the
         *requirement* itself.
+
+    **Limiting Differences:**
+
+        When *max_differences* is given, validation stops consuming
+        *data* once the given number of differences has been found.
+        If more differences remain, the error is marked as partial
+        and its message reports "at least" the number collected:
+
+        .. code-block:: python
+            :emphasize-lines: 5
+
+            from datatest import validate
+
+            data = range(50000000)
+
+            validate(data, lambda x: x < 10, max_differences=100)
+
+    **Retaining Differences:**
+
+        When *retain* is given, every difference is still counted
+        but only a bounded number of them are kept (per key when
+        differences are grouped in a mapping). The *retain* value can
+        be an integer to keep the first *k* differences or a policy
+        object like :class:`RetainSample <datatest.validation.RetainSample>`
+        to keep a random sample:
+
+        .. code-block:: python
+            :emphasize-lines: 6
+
+            from datatest import validate
+            from datatest.validation import RetainSample
+
+            data = range(50000000)
+
+            validate(data, lambda x: x < 10, retain=RetainSample(100))
+
+        The error message reports the total number of differences
+        alongside the retained ones. Differences are not consumed
+        until they are needed, so acceptances still receive the
+        full stream.
+
+    **Lazy Errors:**
+
+        When *lazy* is True, the raised error holds the unevaluated
+        stream of differences and consumes it only as needed. When
+        the error message is truncated, just the displayed differences
+        are evaluated and the message reports "at least" the number
+        seen. Differences are listed in the order they were found and
+        the full collection is still available from the
+        :attr:`differences <ValidationError.differences>` attribute.
+        To write a long message without building it as a single
+        string, use :meth:`write_to() <ValidationError.write_to>`:
+
+        .. code-block:: python
+            :emphasize-lines: 4
+
+            from datatest import validate, ValidationError
+
+            try:
+                validate(data, requirement, lazy=True)
+            except ValidationError as err:
+                with open('differences.txt', 'w') as fh:
+                    err.write_to(fh)
+
+    **Accepting Differences:**
+
+        An *acceptance* can be given to filter differences as they
+        are generated, before they are collected into an error. The
+        following is equivalent to wrapping the validation in a
+        ``with accepted.tolerance(5):`` block:
+
+        .. code-block:: python
+            :emphasize-lines: 7
+
+            from datatest import validate, accepted
+
+            data = {'A': 101, 'B': 206, 'C': 299}
+
+            requirement = {'A': 100, 'B': 200, 'C': 300}
+
+            validate(data, requirement, acceptance=accepted.tolerance(5))
+
+        When validate() is called inside one or more ``with accepted(...)``
+        blocks, the innermost acceptances that have an element-wise
+        scope are also applied this way. If every difference is accepted,
+        validate() returns without raising an error.
     """
-    def __call__(self, data, requirement, msg=None):
+    def __call__(self, data, requirement, msg=None, max_differences=None,
+                 retain=None, lazy=False, acceptance=None):
         __tracebackhide__ = _pytest_tracebackhide
+        from .acceptances import BaseAcceptance
+        from .acceptances import _get_pushdown_acceptances
+
+        if max_differences is not None and max_differences < 1:
+            message = 'max_differences must be a positive integer, got {0!r}'
+            raise ValueError(message.format(max_differences))
+
+        if acceptance is not None and not isinstance(acceptance, BaseAcceptance):
+            message = 'acceptance must be an acceptance object, got {0!r}'
+            raise TypeError(message.format(acceptance))
 
         requirement_object = requirements.get_requirement(requirement)
         result = requirement_object(data)  # <- Apply requirement.
@@ -359,10 +872,30 @@ class ValidateType(object):
         if result:
             differences, description = result
             message = msg or description or 'does not satisfy requirement'
-            err = ValidationError(differences, message)
+
+            # Apply acceptances before differences are collected.
+            acceptances = _get_pushdown_acceptances()
+            if acceptance is not None:
+                acceptances.insert(0, acceptance)
+                message = acceptance._extend_description(message)
+            if acceptances:
+                differences = _apply_acceptances(differences, acceptances)
+                if differences is None:
+                    return  # <- EXIT!
+
+            if max_differences is not None:
+                differences, is_partial = \
+                    _limit_differences(differences, max_differences)
+            else:
+                is_partial = False
+
+            err = ValidationError(differences, message, retain=retain,
+                                  lazy=lazy)
+            err._partial = is_partial
 
             sequence_or_order_types = (requirements.RequiredSequence,
-                                       requirements.RequiredOrder)
+                                       requirements.RequiredOrder,
+                                       requirements.RequiredSorted)
             if isinstance(requirement_object, sequence_or_order_types):
                 err._sorted_str = False
             raise err
@@ -387,17 +920,29 @@ class ValidateType(object):
             return requirements.RequiredMapping(requirement, wrapped_factory)
         return wrapped_factory(requirement)
 
-    def predicate(self, data, requirement, msg=None):
+    def predicate(self, data, requirement, msg=None, max_differences=None,
+                  retain=None, lazy=False, acceptance=None, cache_size=None):
         """Use *requirement* to construct a :class:`Predicate` and
         check elements in *data* for matches (see :ref:`predicate
         validation <predicate-validation>` for more details).
+
+        If *cache_size* is given, results for up to that many distinct
+        element values are memoized so repeated values are not checked
+        again (useful for columns with few distinct values and many
+        rows).
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = requirements.RequiredPredicate
+        if cache_size:
+            factory = partial(requirements.RequiredPredicate,
+                              cache_size=cache_size)
+        else:
+            factory = requirements.RequiredPredicate
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def regex(self, data, requirement, flags=0, msg=None):
+    def regex(self, data, requirement, flags=0, msg=None, max_differences=None,
+              retain=None, lazy=False, acceptance=None, cache_size=None):
         r"""Require that string values match a given regular
         expression (also see :ref:`python:re-syntax`):
 
@@ -421,13 +966,20 @@ class ValidateType(object):
             data = ['46532', '43206', '60632']
 
             validate(data, re.compile(r'^\d{5}$'))
+
+        If *cache_size* is given, match results for up to that many
+        distinct strings are memoized (see :meth:`validate.predicate`).
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredRegex, flags=flags)
+        factory = partial(requirements.RequiredRegex, flags=flags,
+                          cache_size=cache_size)
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def approx(self, data, requirement, places=None, msg=None, delta=None):
+    def approx(self, data, requirement, places=None, msg=None, delta=None,
+               max_differences=None, retain=None, lazy=False,
+               acceptance=None):
         """Require that numeric values are approximately equal. The
         given *requirement* can be a single element or a mapping.
 
@@ -456,9 +1008,11 @@ class ValidateType(object):
         __tracebackhide__ = _pytest_tracebackhide
         factory = partial(requirements.RequiredApprox, places=places, delta=delta)
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def fuzzy(self, data, requirement, cutoff=0.6, msg=None):
+    def fuzzy(self, data, requirement, cutoff=0.6, msg=None, max_differences=None,
+              retain=None, lazy=False, acceptance=None, cache_size=None):
         """Require that strings match with a similarity greater than
         or equal to *cutoff* (default ``0.6``).
 
@@ -486,13 +1040,37 @@ class ValidateType(object):
             }
 
             validate.fuzzy(data, requirement, cutoff=0.8)
+
+        If *requirement* is a set of strings, values must match at
+        least one of its members with a similarity greater than or
+        equal to *cutoff*:
+
+        .. code-block:: python
+
+            from datatest import validate
+
+            data = ['Saint Louis', 'Cincinatti']
+
+            requirement = {'St. Louis', 'Cincinnati', 'New York City'}
+
+            validate.fuzzy(data, requirement, cutoff=0.8)
+
+        In earlier versions, sets of strings were matched exactly
+        (the same as :meth:`validate`).
+
+        Fuzzy matching is relatively expensive. If *cache_size* is
+        given, match results for up to that many distinct strings are
+        memoized (see :meth:`validate.predicate`).
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff)
+        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff,
+                          cache_size=cache_size)
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def interval(self, data, min=None, max=None, msg=None):
+    def interval(self, data, min=None, max=None, msg=None, max_differences=None,
+                 retain=None, lazy=False, acceptance=None):
         """Require that values are within the defined interval:
 
         .. code-block:: python
@@ -530,9 +1108,11 @@ class ValidateType(object):
         """
         __tracebackhide__ = _pytest_tracebackhide
         requirement = requirements.RequiredInterval(min, max)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def set(self, data, requirement, msg=None):
+    def set(self, data, requirement, msg=None, max_differences=None,
+            retain=None, lazy=False, acceptance=None):
         """Check that the set of elements in *data* matches the set
         of elements in *requirement* (applies :ref:`set validation
         <set-validation>` using a *requirement* of any iterable type).
@@ -547,9 +1127,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSet(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def subset(self, data, requirement, msg=None):
+    def subset(self, data, requirement, msg=None, max_differences=None,
+               retain=None, lazy=False, acceptance=None):
         """Check that the set of elements in *data* is a subset of the
         set of elements in *requirement* (i.e., that every element of
         *data* is also a member of *requirement*).
@@ -596,9 +1178,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSubset(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def superset(self, data, requirement, msg=None):
+    def superset(self, data, requirement, msg=None, max_differences=None,
+                 retain=None, lazy=False, acceptance=None):
         """Check that the set of elements in *data* is a superset of the
         set of elements in *requirement* (i.e., that members of *data*
         include all elements of *requirement*).
@@ -645,9 +1229,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSuperset(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
-    def unique(self, data, msg=None):
+    def unique(self, data, msg=None, max_differences=None, retain=None,
+               lazy=False, acceptance=None):
         """Require that elements in *data* are unique:
 
         .. code-block:: python
@@ -660,9 +1246,12 @@ class ValidateType(object):
             validate.unique(data)
         """
         __tracebackhide__ = _pytest_tracebackhide
-        self(data, requirements.RequiredUnique(), msg=msg)
+        self(data, requirements.RequiredUnique(), msg=msg,
+             max_differences=max_differences, retain=retain,
+             lazy=lazy, acceptance=acceptance)
 
-    def order(self, data, requirement, msg=None):
+    def order(self, data, requirement, msg=None, max_differences=None,
+              retain=None, lazy=False, acceptance=None):
         r"""Check that elements in *data* match the relative order of
         elements in *requirement*:
 
@@ -731,7 +1320,120 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredOrder(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
+
+    def sorted(self, data, key=None, reverse=False, strict=False, msg=None,
+               max_differences=None, retain=None, lazy=False,
+               acceptance=None):
+        """Check that elements in *data* are in sorted order:
+
+        .. code-block:: python
+            :emphasize-lines: 5
+
+            from datatest import validate
+
+            data = [1, 2, 3, 5, 4, ...]
+
+            validate.sorted(data)
+
+        The *key* and *reverse* arguments work the same as they do
+        for the built-in :func:`sorted` function. When *strict* is
+        True, equal neighbors are also treated as out of order.
+
+        Elements are checked in a single pass and only the previous
+        key is kept in memory, so *data* can be a large iterator or
+        a database cursor. Each element that is out of order relative
+        to the element before it is reported as an :class:`Invalid`
+        difference containing its index and value:
+
+        .. code-block:: none
+
+            ValidationError: elements are not in ascending order (1 difference): [
+                Invalid((4, 4)),
+            ]
+
+        Elements that can not be compared with the element before them
+        (like ``1`` and ``'a'``) are reported the same way.
+
+        When *data* is a mapping, each group of values is checked
+        separately. To use a different sort key for each group, *key*
+        can also be a mapping of group keys to key functions. Groups
+        that have no entry in the *key* mapping are checked in natural
+        order and entries for groups that are missing from *data* are
+        ignored.
+        """
+        __tracebackhide__ = _pytest_tracebackhide
+
+        requirement = requirements.RequiredSorted(key, reverse, strict)
+
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
+
+    def all(self, data, requirement, msg=None, max_differences=None,
+            retain=None, lazy=False, acceptance=None):
+        """Check *data* against every requirement in *requirement*, a
+        list of requirement objects (or any objects accepted by
+        :meth:`validate`) or a mapping of labels to requirements:
+
+        .. code-block:: python
+            :emphasize-lines: 8
+
+            from datatest import validate
+            from datatest.requirements import RequiredInterval
+            from datatest.requirements import RequiredUnique
+
+            data = [3, 7, 7, 12, ...]
+
+            validate.all(data, [RequiredInterval(0, 10), RequiredUnique()])
+
+        The *data* is only iterated over once, so it can be an
+        iterator or a database cursor. Differences are labeled with
+        the description of the requirement that produced them (or
+        with the label given in a mapping):
+
+        .. code-block:: none
+
+            ValidationError: does not satisfy all requirements (2 differences): {
+                'elements `x` do not satisfy `0 <= x <= 10`': [Deviation(+2, 10)],
+                'elements should be unique': [Extra(7)],
+            }
+
+        Requirement objects can also be combined with the ``&``
+        operator. The combined requirement can be used anywhere a
+        requirement is accepted, including as a value in a mapping
+        of requirements:
+
+        .. code-block:: python
+            :emphasize-lines: 12
+
+            from datatest import validate
+            from datatest.requirements import RequiredInterval
+            from datatest.requirements import RequiredUnique
+
+            data = {
+                'A': [3, 7, 8],
+                'B': [1, 2, 2],
+            }
+
+            in_range_and_unique = RequiredInterval(0, 10) & RequiredUnique()
+
+            validate(data, {'A': in_range_and_unique, 'B': in_range_and_unique})
+
+        When a combined requirement checks a group of values in a
+        mapping, the differences from every requirement are listed
+        together (without labels):
+
+        .. code-block:: none
+
+            ValidationError: elements should be unique (1 difference): {
+                'B': [Extra(2)],
+            }
+        """
+        __tracebackhide__ = _pytest_tracebackhide
+        requirement = requirements.RequiredAll(requirement)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             retain=retain, lazy=lazy, acceptance=acceptance)
 
 
 validate = ValidateType()  # Use as instance.
@@ -742,9 +1444,9 @@ def valid(data, requirement):
 
     See :func:`validate` for supported *data* and *requirement* values
     and detailed validation behavior.
+
+    Unlike :func:`validate`, this function stops checking at the first
+    element that fails and does not build any difference objects.
     """
-    try:
-        validate(data, requirement)
-    except ValidationError:
-        return False
-    return True
+    requirement_object = requirements.get_requirement(requirement)
+    return requirement_object.valid_data(data)
@@ -12,6 +12,7 @@ from datatest._utils import nonstringiter
 from datatest.validation import ValidationError
 from datatest.differences import (
     BaseDifference,
+    DifferenceTable,
     Missing,
     Extra,
     Invalid,
@@ -60,22 +61,6 @@ class TestBaseAcceptance(unittest.TestCase):
         expected = [('A', 'x'), ('A', 'y'), ('B', 'x'), ('B', 'y')]
         self.assertEqual(sorted(actual), expected, 'serialize mapping of lists')
 
-    def test_deserialized_items(self):
-        stream = [(None, 1), (None, 2)]
-        actual = BaseAcceptance._deserialized_items(stream)
-        expected = {None: [1, 2]}
-        self.assertEqual(actual, expected)
-
-        stream = [('A', 'x'), ('B', 'y')]
-        actual = BaseAcceptance._deserialized_items(stream)
-        expected = {'A': 'x', 'B': 'y'}
-        self.assertEqual(actual, expected)
-
-        stream = [('A', 'x'), ('A', 'y'), ('B', 'x'), ('B', 'y')]
-        actual = BaseAcceptance._deserialized_items(stream)
-        expected = {'A': ['x', 'y'], 'B': ['x', 'y']}
-        self.assertEqual(actual, expected)
-
     def test_filterfalse(self):
         class accepted_missing(MinimalAcceptance):
             def call_predicate(_self, item):
@@ -94,6 +79,7 @@ class TestBaseAcceptance(unittest.TestCase):
         """
         acceptance = MinimalAcceptance()
         self.assertIs(acceptance, acceptance.__enter__())
+        acceptance.__exit__(None, None, None)  # <- Leave no active entry.
 
     def test_exit_context(self):
         """The __exit__() method should re-raise exceptions that are
@@ -126,6 +112,79 @@ class TestBaseAcceptance(unittest.TestCase):
         description = cm.exception.description
         self.assertEqual(description, 'acceptance message')
 
+    def test_exit_context_nested_chaining(self):
+        """Nested acceptances should chain their filters over the
+        unevaluated stream instead of rebuilding differences at
+        every layer.
+        """
+        class accepted_missing(MinimalAcceptance):
+            def call_predicate(_self, item):
+                return isinstance(item[1], Missing)
+
+        class accepted_key_a(MinimalAcceptance):
+            def call_predicate(_self, item):
+                return item[0] == 'A'
+
+        differences = {
+            'A': [Missing(1), Extra(2)],
+            'B': [Missing(3), Extra(4), Extra(5)],
+        }
+        with self.assertRaises(ValidationError) as cm:
+            with accepted_key_a():
+                with accepted_missing():
+                    raise ValidationError(differences)
+
+        exc = cm.exception
+        self.assertIsNotNone(exc._stream, msg='should be unevaluated')
+        self.assertEqual(exc.differences, {'B': [Extra(4), Extra(5)]})
+
+    def test_exit_context_difference_table(self):
+        class accepted_missing(MinimalAcceptance):
+            def call_predicate(_self, item):
+                return isinstance(item[1], Missing)
+
+        table = DifferenceTable([Missing(1), Extra(2), Missing(3), Extra(4)])
+        with self.assertRaises(ValidationError) as cm:
+            with accepted_missing():
+                raise ValidationError(table)
+
+        remaining = cm.exception.differences
+        self.assertIsInstance(remaining, DifferenceTable)
+        self.assertEqual(remaining, [Extra(2), Extra(4)])
+
+        table = DifferenceTable([Missing(1), Extra(2), Missing(3), Extra(4)])
+        with self.assertRaises(ValidationError) as cm:
+            with accepted_missing():
+                raise ValidationError({'A': table, 'B': Missing(5)})
+        self.assertEqual(cm.exception.differences, {'A': [Extra(2), Extra(4)]})
+
+    def test_exit_context_retained_error(self):
+        """Acceptances should see every difference of an error that
+        uses a retention policy, not just the retained ones.
+        """
+        class accepted_missing(MinimalAcceptance):
+            def call_predicate(_self, item):
+                return isinstance(item[1], Missing)
+
+        differences = [Missing(1), Missing(2), Missing(3), Extra(4), Extra(5)]
+        with self.assertRaises(ValidationError) as cm:
+            with accepted_missing('acceptance message'):
+                raise ValidationError(iter(differences), 'description', retain=1)
+
+        self.assertEqual(cm.exception.differences, [Extra(4)])
+        self.assertEqual(cm.exception.description, 'acceptance message: description')
+        self.assertIn('2 differences, 1 retained', str(cm.exception))
+
+        with accepted_missing():  # <- Accepts all, no error.
+            raise ValidationError(iter(differences[:3]), retain=1)
+
+        # Lazy errors are re-raised as lazy errors.
+        with self.assertRaises(ValidationError) as cm:
+            with accepted_missing():
+                raise ValidationError(iter(differences), lazy=True)
+        self.assertIsNotNone(cm.exception._stream)
+        self.assertEqual(cm.exception.differences, [Extra(4), Extra(5)])
+
 
 class TestAcceptanceProtocol(unittest.TestCase):
     def setUp(self):
@@ -486,6 +545,35 @@ class TestAcceptedDifferences(unittest.TestCase):
         expected = {'a': Missing('X'), 'b': Missing('X')}
         self.assertAcceptance(differences, acceptance, expected)
 
+    def test_whole_scope_across_groups(self):
+        differences = {
+            'a': [Missing('X'), Missing('Y')],
+            'b': [Missing('X'), Missing('Y')],
+        }
+        acceptance = AcceptedDifferences(
+            [Missing('X'), Missing('X'), Missing('Y')],
+            scope='whole',
+        )
+        expected = {'b': Missing('Y')}
+        self.assertAcceptance(differences, acceptance, expected)
+
+    def test_large_allowance(self):
+        accepted = [Invalid(x) for x in range(0, 20000, 2)]
+        differences = [Invalid(x) for x in range(20000)]
+        expected = [Invalid(x) for x in range(1, 20000, 2)]
+        self.assertAcceptance(differences, AcceptedDifferences(accepted), expected)
+
+    def test_nan_and_unhashable_allowance(self):
+        differences = [
+            Deviation(float('nan'), 10),
+            Invalid(['a']),
+            Invalid(['a']),
+            Invalid('b'),
+        ]
+        accepted = [Deviation(float('nan'), 10), Invalid(['a'])]
+        expected = [Invalid(['a']), Invalid('b')]
+        self.assertAcceptance(differences, AcceptedDifferences(accepted), expected)
+
     def test_combination_of_cases(self):
         """This is a bit of an integration test."""
         differences = {
@@ -1124,6 +1212,21 @@ class TestAcceptedCount(unittest.TestCase):
         remaining = cm.exception.differences
         self.assertEqual(remaining, {'baz': Invalid('zzz')})
 
+    def test_reused_with_lazy_errors(self):
+        """Each use should have its own count even when a lazy error's
+        differences are evaluated after the acceptance is used again.
+        """
+        acceptance = AcceptedCount(2)
+        with self.assertRaises(ValidationError) as cm:
+            with acceptance:
+                differences = [Extra(1), Extra(2), Extra(3), Extra(4)]
+                raise ValidationError(iter(differences), lazy=True)
+
+        with acceptance:  # <- Accepts all, no error.
+            raise ValidationError(iter([Missing(5)]), lazy=True)
+
+        self.assertEqual(cm.exception.differences, [Extra(3), Extra(4)])
+
     def test_repr(self):
         acceptance = AcceptedCount(2)
         self.assertEqual(repr(acceptance), "AcceptedCount(2)")
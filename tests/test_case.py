@@ -160,6 +160,16 @@ class TestAssertValid(DataTestCase):
         message = str(cm.exception)
         self.assertTrue(message.endswith(']'), 'should show full diff when None')
 
+    def test_max_differences(self):
+        with self.assertRaises(ValidationError) as cm:
+            self.assertValid(['a', 'b', 'c'], int, max_differences=1)
+        self.assertEqual(cm.exception.differences, [Invalid('a')])
+        self.assertIn('at least 1 difference', str(cm.exception))
+
+        with self.assertRaises(ValidationError) as cm:
+            self.assertValidUnique([1, 1, 1], max_differences=1)
+        self.assertEqual(cm.exception.differences, [Extra(1)])
+
     @unittest.skipUnless(squint, 'requires squint')
     def test_query_objects(self):
         source = squint.Select([('A', 'B'), ('1', '2'), ('1', '2')])
@@ -235,6 +245,7 @@ class TestValidationWrappers(unittest.TestCase):
         validate methods.
         """
         method_calls = [
+            ('all', ([1, 2, 3], [int]), {}),
             ('predicate', ('aaa', 'aaa'), {}),
             ('regex', (['a', 'b'], '[ab]'), {}),
             ('approx', ([1.5, 1.5], 1.5), {}),
@@ -245,6 +256,7 @@ class TestValidationWrappers(unittest.TestCase):
             ('superset', ([1, 2], set([1, 2, 3])), {}),
             ('unique', ([1, 2, 3],), {}),
             ('order', (['x', 'y'], ['x', 'y']), {}),
+            ('sorted', ([1, 2, 3],), {}),
         ]
         method_names = set(x[0] for x in method_calls)
         all_names = set(x for x in dir(validate) if not x.startswith('_'))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import random
+from . import _unittest as unittest
+
+from datatest._diff_engines import (
+    difflib_opcodes,
+    myers_opcodes,
+    patience_opcodes,
+    auto_opcodes,
+    get_engine,
+)
+
+
+def lcs_length(a, b):
+    """Return length of longest common subsequence (brute force)."""
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for index, y in enumerate(b):
+            if x == y:
+                current.append(previous[index] + 1)
+            else:
+                current.append(max(previous[index + 1], current[index]))
+        previous = current
+    return previous[-1]
+
+
+class TestEngines(unittest.TestCase):
+    def assertValidOpcodes(self, opcodes, a, b):
+        """Check that *opcodes* cover both sequences and that applying
+        them to *a* produces *b*. Returns number of matched elements.
+        """
+        result = []
+        matched = 0
+        i_pos = j_pos = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            self.assertEqual((i1, j1), (i_pos, j_pos))
+            if tag == 'equal':
+                self.assertEqual(list(a[i1:i2]), list(b[j1:j2]))
+                result.extend(a[i1:i2])
+                matched += i2 - i1
+            else:
+                self.assertIn(tag, ('replace', 'delete', 'insert'))
+                result.extend(b[j1:j2])
+            i_pos, j_pos = i2, j2
+        self.assertEqual((i_pos, j_pos), (len(a), len(b)))
+        self.assertEqual(result, list(b))
+        return matched
+
+    def test_simple(self):
+        a = list('ACDEF')
+        b = list('ABCDE')
+        for engine in (myers_opcodes, patience_opcodes):
+            opcodes = engine(a, b)
+            self.assertEqual(opcodes, difflib_opcodes(a, b))
+
+    def test_empty(self):
+        for engine in (myers_opcodes, patience_opcodes):
+            self.assertEqual(engine([], []), [])
+            self.assertEqual(engine([], ['a']), [('insert', 0, 0, 0, 1)])
+            self.assertEqual(engine(['a'], []), [('delete', 0, 1, 0, 0)])
+
+    def test_myers_is_minimal(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            a = [rng.choice('abcd') for _ in range(rng.randrange(15))]
+            b = [rng.choice('abcd') for _ in range(rng.randrange(15))]
+            matched = self.assertValidOpcodes(myers_opcodes(a, b), a, b)
+            self.assertEqual(matched, lcs_length(a, b), (a, b))
+
+    def test_patience_is_valid(self):
+        rng = random.Random(5678)
+        for _ in range(200):
+            a = [rng.choice('abcdefgh') for _ in range(rng.randrange(20))]
+            b = [rng.choice('abcdefgh') for _ in range(rng.randrange(20))]
+            self.assertValidOpcodes(patience_opcodes(a, b), a, b)
+
+    def test_long_sequences(self):
+        b = list(range(20000))
+        a = list(b)
+        del a[5000]
+        a.insert(12000, 'x')
+        a[15000] = 'y'
+
+        for engine in (myers_opcodes, patience_opcodes, auto_opcodes):
+            opcodes = engine(a, b)
+            matched = self.assertValidOpcodes(opcodes, a, b)
+            self.assertEqual(matched, 19998)
+
+    def test_get_engine(self):
+        self.assertIs(get_engine('myers'), myers_opcodes)
+        self.assertIs(get_engine(difflib_opcodes), difflib_opcodes)
+        with self.assertRaises(ValueError):
+            get_engine('unknown')
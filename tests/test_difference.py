@@ -5,13 +5,16 @@ import re
 import textwrap
 from . import _unittest as unittest
 
+from datatest import differences
 from datatest.differences import (
     BaseDifference,
     Missing,
     Extra,
     Invalid,
     Deviation,
+    DifferenceTable,
     _make_difference,
+    register_difference_handler,
     NOVALUE,
 )
 
@@ -314,6 +317,92 @@ class TestHashability(unittest.TestCase):
             hash(Invalid('baz', ['qux']))
 
 
+class TestCachedComparison(unittest.TestCase):
+    def test_cached_values(self):
+        diff = Deviation(float('nan'), 10)
+        self.assertEqual(diff, Deviation(float('nan'), 10))
+        self.assertIs(diff._get_cmp_key(), diff._get_cmp_key())
+        self.assertEqual(hash(diff), hash(diff))
+
+    def test_nan_hash(self):
+        """Equal differences should have equal hashes."""
+        diff1 = Deviation(float('nan'), 10)
+        diff2 = Deviation(float('nan'), 10)
+        self.assertEqual(hash(diff1), hash(diff2))
+        self.assertEqual(len(set([diff1, diff2])), 1)
+
+    def test_unhashable_not_cached(self):
+        diff = Missing(['foo'])
+        with self.assertRaises(TypeError):
+            hash(diff)
+        with self.assertRaises(TypeError):
+            hash(diff)
+
+    def test_pickle(self):
+        import pickle
+        diff = Deviation(float('nan'), 10)
+        hash(diff)  # <- Populate cache.
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(diff, protocol)), diff)
+
+        diff = MinimalDifference('A', 'B')
+        hash(diff)
+        self.assertEqual(pickle.loads(pickle.dumps(diff)), diff)
+
+
+class TestDifferenceTable(unittest.TestCase):
+    def setUp(self):
+        self.differences = [
+            Deviation(-1, 10),
+            Missing('A'),
+            Deviation(2.5, 10.0),
+            Invalid('B'),
+            Deviation(+3, 10),
+            Invalid('C', 'D'),
+            MinimalDifference(1, 2, 3),
+            Extra(('x', 1)),
+        ]
+
+    def test_sequence_behavior(self):
+        table = DifferenceTable(self.differences)
+        self.assertEqual(len(table), 8)
+        self.assertEqual(list(table), self.differences)
+        self.assertEqual(table[2], Deviation(2.5, 10.0))
+        self.assertEqual(table[-1], Extra(('x', 1)))
+        self.assertEqual(table[1:3], [Missing('A'), Deviation(2.5, 10.0)])
+        self.assertEqual(table, self.differences)
+        self.assertTrue(DifferenceTable([Missing('A')]))
+        self.assertFalse(DifferenceTable())
+
+        table.append(Missing('Z'))
+        self.assertEqual(table[-1], Missing('Z'))
+
+    def test_typed_columns(self):
+        table = DifferenceTable([Deviation(-1, 10), Deviation(+3, 10)])
+        columns = table._shapes[0][1]
+        self.assertEqual([col.typecode for col in columns], ['l', 'l'])
+
+        # Value that doesn't fit the array converts column to list.
+        table.append(Deviation(1.5, 10))
+        columns = table._shapes[0][1]
+        self.assertIsInstance(columns[0], list)
+        self.assertEqual(columns[1].typecode, 'l')
+        self.assertEqual(list(table), [Deviation(-1, 10), Deviation(+3, 10),
+                                       Deviation(1.5, 10)])
+
+        # Types are preserved exactly.
+        table = DifferenceTable([Deviation(1, 10), Deviation(True, 10)])
+        self.assertIs(table[1].deviation, True)
+
+    def test_nan_values(self):
+        table = DifferenceTable([Deviation(float('nan'), 0.0)])
+        self.assertEqual(list(table), [Deviation(float('nan'), 0.0)])
+
+    def test_bad_value(self):
+        with self.assertRaises(TypeError):
+            DifferenceTable(['A'])
+
+
 class TestMakeDifference(unittest.TestCase):
     def test_numeric_vs_numeric(self):
         diff = _make_difference(5, 6)
@@ -464,3 +553,75 @@ class TestMakeDifference(unittest.TestCase):
 
         # NaN should work though.
         _make_difference(float('nan'), float('nan'))
+
+
+class TestDifferenceHandlers(unittest.TestCase):
+    def setUp(self):
+        self.registered = dict(differences._registered_handlers)
+        differences._handler_cache.clear()
+
+    def tearDown(self):
+        differences._registered_handlers.clear()
+        differences._registered_handlers.update(self.registered)
+        differences._handler_cache.clear()
+
+    def test_non_quantitative_types(self):
+        """Types without subtraction should be cached as Invalid."""
+        class Label(object):
+            def __init__(self, value):
+                self.value = value
+
+        diff = _make_difference(Label('a'), 'b')
+        self.assertIsInstance(diff, Invalid)
+        handler = differences._handler_cache[(Label, str)]
+        self.assertIs(handler, differences._make_invalid)
+
+    def test_type_errors_are_not_cached(self):
+        """A TypeError for one pair of values should not change the
+        differences built for other values of the same types.
+        """
+        class UTC(datetime.tzinfo):
+            def utcoffset(self, dt):
+                return datetime.timedelta(0)
+
+            def dst(self, dt):
+                return datetime.timedelta(0)
+
+        naive = datetime.datetime(2020, 1, 1)
+        aware = datetime.datetime(2020, 1, 1, tzinfo=UTC())
+        self.assertIsInstance(_make_difference(naive, aware), Invalid)
+
+        diff = _make_difference(datetime.datetime(2020, 1, 2), naive)
+        self.assertEqual(diff, Deviation(datetime.timedelta(days=+1), naive))
+
+    def test_value_errors_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            _make_difference(5, 5)  # <- Equal values are not differences.
+        self.assertEqual(_make_difference(6, 5), Deviation(+1, 5))
+
+    def test_registered_handler(self):
+        class Money(object):
+            def __init__(self, amount):
+                self.amount = amount
+
+        class Dollars(Money):
+            pass
+
+        def money_difference(actual, expected, show_expected):
+            return Deviation(actual.amount - expected.amount, expected.amount)
+
+        register_difference_handler(Money, Money, money_difference)
+        self.assertEqual(_make_difference(Money(5), Money(3)), Deviation(+2, 3))
+        self.assertEqual(_make_difference(Dollars(5), Money(7)), Deviation(-2, 7))
+
+        diff = _make_difference(Money(5), 3)  # <- No handler for these types.
+        self.assertIsInstance(diff, Invalid)
+
+    def test_registration_clears_cache(self):
+        self.assertEqual(_make_difference(5, 3), Deviation(+2, 3))
+        register_difference_handler(int, int, lambda a, b, show: Invalid(a, b))
+        self.assertEqual(_make_difference(5, 3), Invalid(5, 3))
+
+    def test_bad_handler(self):
+        with self.assertRaises(TypeError):
+            register_difference_handler(int, int, 'not callable')
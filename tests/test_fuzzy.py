@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import difflib
+import random
+from . import _unittest as unittest
+
+from datatest._fuzzy import (
+    FuzzyMatcher,
+    FuzzyIndex,
+)
+
+
+def ratio(a, b):
+    return difflib.SequenceMatcher(a=a, b=b).ratio()
+
+
+def random_strings(rng, count, alphabet='abcde ', max_length=12):
+    strings = []
+    for _ in range(count):
+        length = rng.randint(0, max_length)
+        strings.append(''.join(rng.choice(alphabet) for _ in range(length)))
+    return strings
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+    def test_same_as_ratio(self):
+        rng = random.Random(1729)
+        strings = random_strings(rng, 60)
+        for cutoff in (0.0, 0.4, 0.6, 0.8, 1.0):
+            fuzzy_match = FuzzyMatcher(cutoff)
+            for a in strings[:30]:
+                for b in strings[30:]:
+                    expected = ratio(a, b) >= cutoff
+                    self.assertEqual(fuzzy_match(a, b), expected, (a, b, cutoff))
+                    self.assertEqual(fuzzy_match(a, b), expected, 'cached result')
+
+    def test_argument_order(self):
+        """Ratios are not symmetric, *a* and *b* must not be swapped."""
+        a, b = 'baba', 'abbba'
+        self.assertNotEqual(ratio(a, b), ratio(b, a))
+        cutoff = max(ratio(a, b), ratio(b, a))
+        self.assertEqual(FuzzyMatcher(cutoff)(a, b), ratio(a, b) >= cutoff)
+        self.assertEqual(FuzzyMatcher(cutoff)(b, a), ratio(b, a) >= cutoff)
+
+    def test_bad_types(self):
+        fuzzy_match = FuzzyMatcher(0.6)
+        self.assertFalse(fuzzy_match('abc', 123))
+        self.assertFalse(fuzzy_match(123, 'abc'))
+        self.assertFalse(fuzzy_match('abc', None))
+        self.assertTrue(fuzzy_match(['a', 'b'], ['a', 'b']))  # Unhashable.
+
+    def test_bounded_cache(self):
+        fuzzy_match = FuzzyMatcher(0.6, maxsize=16)
+        for x in range(100):
+            fuzzy_match('abc', str(x))
+        self.assertLessEqual(len(fuzzy_match._results), 16)
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    def test_same_as_brute_force(self):
+        rng = random.Random(42)
+        for cutoff in (0.0, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+            members = random_strings(rng, 40, alphabet='abcdef')
+            values = random_strings(rng, 80, alphabet='abcdef')
+            index = FuzzyIndex(members, cutoff)
+            for value in values:
+                expected = any(ratio(m, value) >= cutoff for m in members)
+                self.assertEqual(index(value), expected, (value, cutoff))
+
+    def test_skips_implausible_candidates(self):
+        calls = []
+        def fuzzy_match(a, b):
+            calls.append(a)
+            return ratio(a, b) >= 0.8
+
+        members = ['ohio', 'oregon', 'kentucky', 'massachusetts', 'missouri']
+        index = FuzzyIndex(members, 0.8, fuzzy_match)
+        self.assertTrue(index('misouri'))
+        self.assertFalse(index('kansas'))
+        self.assertEqual(calls, ['missouri'])
+
+    def test_non_string_values(self):
+        index = FuzzyIndex(['abc', 'def'], 0.6)
+        self.assertFalse(index(123))
+        self.assertFalse(index(None))
+        self.assertFalse(index(['abc']))
+        self.assertTrue(index('abc'))
+        self.assertTrue(index('abx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
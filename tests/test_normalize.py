@@ -1,10 +1,16 @@
 """Tests for normalization functions."""
+import datetime
 import sqlite3
+import sys
 from . import _unittest as unittest
 from datatest.requirements import BaseRequirement
+from datatest.validation import validate
+from datatest.validation import ValidationError
 from datatest._utils import IterItems
 
 from datatest._normalize import TypedIterator
+from datatest._normalize import ColumnIterator
+from datatest._normalize import ChunkedColumnIterator
 from datatest._normalize import _normalize_lazy
 from datatest._normalize import _normalize_eager
 from datatest._normalize import normalize
@@ -35,8 +41,21 @@ class TestNormalizeLazyUnchanged(unittest.TestCase):
         self.assertIs(_normalize_lazy(data), data)
 
     def test_exhaustible_iterator(self):
+        pandas_module = sys.modules.pop('pandas', None)
+        try:
+            data = iter([1, 2, 3])
+            self.assertIs(_normalize_lazy(data), data)
+        finally:
+            if pandas_module is not None:
+                sys.modules['pandas'] = pandas_module
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_exhaustible_iterator_pandas_loaded(self):
+        """When pandas is loaded, iterators are peeked at to check for
+        DataFrame chunks but their values should be unchanged.
+        """
         data = iter([1, 2, 3])
-        self.assertIs(_normalize_lazy(data), data)
+        self.assertEqual(list(_normalize_lazy(data)), [1, 2, 3])
 
     def test_typediterator(self):
         data = TypedIterator(iter([1, 2, 3]), evaltype=tuple)
@@ -92,6 +111,51 @@ class TestNormalizeLazyPandas(unittest.TestCase):
         self.assertIsInstance(result, TypedIterator)
         self.assertEqual(result.fetch(), data)
 
+    def test_dataframe_chunks(self):
+        """Rows should be read one column at a time in bounded chunks."""
+        df = pandas.DataFrame({'A': ['x', 'y', 'z', 'w', 'v'],
+                               'B': [1, 2, 3, 4, 5],
+                               'C': [0.5, 1.5, 2.5, 3.5, 4.5]},
+                              columns=['A', 'B', 'C'])
+        result = _normalize_lazy(df)
+        self.assertIsInstance(result, ColumnIterator)
+
+        result.chunksize = 2
+        chunks = list(result.iter_columns())
+        self.assertEqual(chunks, [
+            [['x', 'y'], [1, 2], [0.5, 1.5]],
+            [['z', 'w'], [3, 4], [2.5, 3.5]],
+            [['v'], [5], [4.5]],
+        ])
+        self.assertIs(type(chunks[0][1][0]), int, msg='same type as DataFrame.values')
+
+        result = ColumnIterator(df, chunksize=2)
+        self.assertEqual(
+            list(result),
+            [('x', 1, 0.5), ('y', 2, 1.5), ('z', 3, 2.5), ('w', 4, 3.5), ('v', 5, 4.5)],
+        )
+
+    def test_dataframe_numpy_scalars(self):
+        """Homogeneous frames should give NumPy scalars like DataFrame.values."""
+        df = pandas.DataFrame({'a': [1, 2], 'b': [3, 4]}, columns=['a', 'b'])
+        validate(df, (numpy.int64, numpy.int64))
+        validate(df[['a']], numpy.int64)
+        self.assertEqual([type(x) for x in _normalize_lazy(df[['a']])],
+                         [type(x) for x in df.values[:, 0]])
+
+    def test_dataframe_mixed_scalars(self):
+        """Mixed-type frames should give the boxed values of
+        DataFrame.values (Python ints and Timestamps).
+        """
+        df = pandas.DataFrame({
+            'a': [1, 2],
+            'b': pandas.to_datetime(['2020-01-01', '2020-01-02']),
+        }, columns=['a', 'b'])
+        validate(df, (int, datetime.datetime))
+        validate(df, (int, pandas.Timestamp))
+        self.assertEqual([[type(x) for x in row] for row in _normalize_lazy(df)],
+                         [[type(x) for x in row] for row in df.values])
+
     def test_dataframe_with_otherindex(self):
         """DataFrames using other index types should be treated as mappings."""
         data = [(1, 'a'), (2, 'b'), (3, 'c')]
@@ -186,6 +250,119 @@ class TestNormalizeLazyPandas(unittest.TestCase):
         with self.assertRaises(ValueError):
             _normalize_lazy(s)
 
+    def test_dataframe_chunk_iterator(self):
+        """Generators of DataFrames should be read as one dataset."""
+        def chunks():
+            yield pandas.DataFrame([('x', 1), ('y', 2)])
+            yield pandas.DataFrame([('z', 3)])
+
+        result = _normalize_lazy(chunks())
+        self.assertIsInstance(result, ChunkedColumnIterator)
+        self.assertEqual(list(result), [('x', 1), ('y', 2), ('z', 3)])
+
+        result = _normalize_lazy(chunks())
+        self.assertEqual(list(result.iter_columns()), [
+            [['x', 'y'], [1, 2]],
+            [['z'], [3]],
+        ])
+
+    def test_series_chunk_iterator(self):
+        chunks = (pandas.Series(x) for x in [['x', 'y'], ['z']])
+        result = _normalize_lazy(chunks)
+        self.assertIsInstance(result, TypedIterator)
+        self.assertEqual(result.fetch(), ['x', 'y', 'z'])
+
+    def test_chunk_iterator_otherindex(self):
+        """Chunks are treated as one mapping when the first chunk does
+        not have a RangeIndex.
+        """
+        chunks = (x for x in [
+            pandas.Series(['x', 'y'], index=['a', 'b']),
+            pandas.Series(['z'], index=['c']),
+        ])
+        result = _normalize_lazy(chunks)
+        self.assertIsInstance(result, IterItems)
+        self.assertEqual(dict(result), {'a': 'x', 'b': 'y', 'c': 'z'})
+
+        chunks = (x for x in [
+            pandas.DataFrame([('x', 1)], index=['a']),
+            pandas.DataFrame([('y', 2)], index=['a']),
+        ])
+        result = _normalize_lazy(chunks)
+        with self.assertRaises(ValueError):
+            dict(result)  # <- Duplicates across chunks.
+
+    def test_chunk_iterator_type_error(self):
+        chunks = (x for x in [pandas.DataFrame([1, 2]), pandas.Series([3])])
+        result = _normalize_lazy(chunks)
+        with self.assertRaises(TypeError):
+            list(result)
+
+    def test_chunk_reader(self):
+        """Readers with a get_chunk() method should be read as one dataset."""
+        class ChunkReader(object):
+            def __init__(self, frames):
+                self._frames = iter(frames)
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                return self.get_chunk()
+
+            next = __next__  # Python 2.x support.
+
+            def get_chunk(self, size=None):
+                return next(self._frames)
+
+        reader = ChunkReader([pandas.DataFrame([1, 2]), pandas.DataFrame([3])])
+        result = _normalize_lazy(reader)
+        self.assertIsInstance(result, ChunkedColumnIterator)
+        self.assertEqual(list(result), [1, 2, 3])
+
+    def test_other_chunk_iterators(self):
+        """Any iterator of DataFrames should be read as one dataset."""
+        frames = [pandas.DataFrame([1, 2]), pandas.DataFrame([3])]
+
+        result = _normalize_lazy(iter(frames))
+        self.assertIsInstance(result, ChunkedColumnIterator)
+        self.assertEqual(list(result), [1, 2, 3])
+
+        result = _normalize_lazy(map(lambda df: df * 2, frames))
+        self.assertIsInstance(result, ChunkedColumnIterator)
+        self.assertEqual(list(result), [2, 4, 6])
+
+        validate(iter(frames), int)
+        with self.assertRaises(ValidationError):
+            validate(iter(frames), set([1, 2]))
+
+        items = IterItems(iter([('a', 1), ('b', 2)]))
+        self.assertIs(_normalize_lazy(items), items, msg='not peeked')
+
+    def test_non_chunk_generator(self):
+        """Other generators should give the same values."""
+        result = _normalize_lazy(x for x in [1, 2, 3])
+        self.assertEqual(list(result), [1, 2, 3])
+
+    def test_chunk_boundaries(self):
+        """Requirements should carry state across chunk boundaries."""
+        def chunks():
+            yield pandas.DataFrame({'A': [1, 2]})
+            yield pandas.DataFrame({'A': [2, 3]})
+
+        validate.order(chunks(), [1, 2, 2, 3])
+        validate.subset(chunks(), set([1, 2, 3]))
+        validate.superset(chunks(), set([1, 3]))
+        validate(chunks(), set([1, 2, 3]))
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique(chunks())
+        self.assertEqual(len(cm.exception.differences), 1)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.superset(chunks(), set([1, 3, 4]))
+        self.assertEqual(len(cm.exception.differences), 1)
+
 
 @unittest.skipUnless(numpy, 'requires numpy')
 class TestNormalizeLazyNumpy(unittest.TestCase):
@@ -266,6 +443,79 @@ class TestNormalizeLazyDBAPI2Cursor(unittest.TestCase):
         self.assertEqual(list(result), [20, 30, 10, 20, 10, 10])
 
 
+class TestNormalizeLazyNonIterableCursor(unittest.TestCase):
+    """Cursors are not required to be iterable by the DBAPI2 spec."""
+    def setUp(self):
+        conn = sqlite3.connect(':memory:')
+        conn.executescript('''
+            CREATE TABLE mydata(A, B);
+            INSERT INTO mydata VALUES('x', 20);
+            INSERT INTO mydata VALUES('x', 30);
+            INSERT INTO mydata VALUES('y', 10);
+            INSERT INTO mydata VALUES('y', 20);
+            INSERT INTO mydata VALUES('z', 10);
+        ''')
+        self.sizes = []  # Sizes passed to fetchmany().
+
+        class NonIterableCursor(object):
+            def __init__(cursor):
+                cursor._cursor = conn.cursor()
+                cursor.rowcount = -1
+                cursor.description = None
+                cursor.arraysize = 2
+
+            def execute(cursor, sql):
+                cursor._cursor.execute(sql)
+
+            def fetchone(cursor):
+                return cursor._cursor.fetchone()
+
+            def fetchmany(cursor, size=None):
+                if size is None:
+                    size = cursor.arraysize
+                self.sizes.append(size)
+                return cursor._cursor.fetchmany(size)
+
+        self.cursor = NonIterableCursor()
+
+    def test_multiple_columns(self):
+        self.cursor.execute('SELECT A, B FROM mydata;')
+        result = _normalize_lazy(self.cursor)
+        self.assertEqual(
+            list(result),
+            [('x', 20), ('x', 30), ('y', 10), ('y', 20), ('z', 10)],
+        )
+        self.assertEqual(self.sizes, [2, 2, 2, 2])  # <- Uses arraysize.
+
+    def test_single_column(self):
+        self.cursor.execute('SELECT B FROM mydata;')
+        result = _normalize_lazy(self.cursor)
+        self.assertEqual(list(result), [20, 30, 10, 20, 10])
+
+    def test_batch_size(self):
+        self.cursor.arraysize = 3
+        self.cursor.execute('SELECT B FROM mydata;')
+        self.assertEqual(list(_normalize_lazy(self.cursor)), [20, 30, 10, 20, 10])
+        self.assertEqual(self.sizes, [3, 3, 3])
+
+        self.cursor.arraysize = 1  # <- DBAPI2 default, uses 1000 instead.
+        self.sizes[:] = []
+        self.cursor.execute('SELECT B FROM mydata;')
+        self.assertEqual(list(_normalize_lazy(self.cursor)), [20, 30, 10, 20, 10])
+        self.assertEqual(self.sizes, [1000, 1000])
+
+        del self.cursor.arraysize  # <- Missing, uses 1000.
+        self.sizes[:] = []
+        self.cursor.execute('SELECT B FROM mydata;')
+        self.assertEqual(list(_normalize_lazy(self.cursor)), [20, 30, 10, 20, 10])
+        self.assertEqual(self.sizes, [1000, 1000])
+
+    def test_fetchone_fallback(self):
+        del self.cursor.__class__.fetchmany
+        self.cursor.execute('SELECT B FROM mydata;')
+        self.assertEqual(list(_normalize_lazy(self.cursor)), [20, 30, 10, 20, 10])
+
+
 class TestNormalizeEager(unittest.TestCase):
     def test_unchanged(self):
         """For given instances, should return original object."""
@@ -688,5 +688,89 @@ class TesCombinedTypeNesting(unittest.TestCase):
         self.assertEqual(repr(pred), expected)
 
 
+class TestPredicateCompile(unittest.TestCase):
+    """Compiled functions should give the same results as calling
+    the predicate itself.
+    """
+    def setUp(self):
+        class BadObj(object):
+            def __eq__(self, other):
+                if isinstance(other, BadObj):
+                    return True
+                raise TypeError('Sudden but inevitable betrayal!')
+            __hash__ = object.__hash__
+
+        TOKEN = object()
+
+        def divisible_or_token(x):
+            if x % 3 == 0:
+                return True
+            if x % 5 == 0:
+                return TOKEN
+            return False
+
+        self.TOKEN = TOKEN
+        self.values = [
+            0, 1, 3, 5, 1.0, 'abc', 'ABC', '', None, True, False,
+            float('nan'), int, str, BadObj(), ('abc', 1), ('abc', 1.0),
+            ('abc', 1, 'x'), ['abc', 1], (), ('abc', float('nan')),
+        ]
+        self.objs = [
+            int, str, divisible_or_token, Ellipsis, True, False,
+            float('nan'), re.compile('[AB]'), set(['abc', 1]), 1, 'abc',
+            BadObj(), ('abc', int), (str, float('nan')), (Ellipsis, 1),
+            (re.compile('a'), set([1, 2])), (divisible_or_token, Ellipsis),
+            ('abc', Predicate(int)), Predicate(str),
+        ]
+
+    def assertSameResults(self, pred):
+        compiled = pred.compile()
+        for value in self.values:
+            try:
+                expected = pred(value)
+            except Exception as err:
+                with self.assertRaises(err.__class__):
+                    compiled(value)
+                continue
+            actual = compiled(value)
+            msg = 'compiled {0!r} returned {1!r} for {2!r}, expected {3!r}'
+            msg = msg.format(pred, actual, value, expected)
+            self.assertEqual(bool(actual), bool(expected), msg=msg)
+
+    def test_parity(self):
+        for obj in self.objs:
+            self.assertSameResults(Predicate(obj))
+
+    def test_inverted_parity(self):
+        for obj in self.objs:
+            self.assertSameResults(~Predicate(obj))
+
+    def test_combined_parity(self):
+        preds = [Predicate(obj) for obj in self.objs]
+        for left, right in zip(preds, reversed(preds)):
+            self.assertSameResults(left & right)
+            self.assertSameResults(left | ~right)
+            self.assertSameResults(~(left | right))
+
+    def test_passthrough(self):
+        """Callable results should be returned as-is."""
+        pred = Predicate(self.objs[2])
+        self.assertIs(pred.compile()(5), self.TOKEN)
+
+    def test_nested_combinations(self):
+        pred = Predicate('foo') | (Predicate(lambda x: x > 3) & Predicate(int))
+        compiled = pred.compile()
+        self.assertTrue(compiled('foo'))
+        self.assertTrue(compiled(4))
+        self.assertFalse(compiled(4.0))
+        self.assertFalse(compiled(2))
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_types(self):
+        compiled = Predicate((str, int, float)).compile()
+        self.assertTrue(compiled((numpy.str_('a'), numpy.int8(1), numpy.float32(1.0))))
+        self.assertFalse(Predicate(numpy.dtype(float)).compile()(1))
+
+
 if __name__ == '__main__':
     unittest.main()
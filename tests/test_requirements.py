@@ -1,8 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
+import pickle
 import platform
 import re
 from . import _unittest as unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = False
+
+try:
+    import pandas
+except ImportError:
+    pandas = False
+
 from datatest._compatibility.collections.abc import Iterable
 from datatest._compatibility.collections.abc import Iterator
 from datatest._utils import (
@@ -19,6 +31,7 @@ from datatest import (
 from datatest._vendor.predicate import Predicate
 from datatest.requirements import (
     _build_description,
+    _deephash,
 
     # Abstract Requirement Classes
     BaseRequirement,
@@ -36,8 +49,10 @@ from datatest.requirements import (
     RequiredSuperset,
     RequiredUnique,
     RequiredOrder,
+    RequiredSorted,
     RequiredSequence,
     RequiredMapping,
+    RequiredAll,
 
     get_requirement,
     adapts_mapping,
@@ -319,6 +334,13 @@ class TestGroupRequirement(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid(1), Invalid(2)])
         self.assertEqual(desc, 'requires 3 or more elements')
 
+    def test_check_columns(self):
+        """Default implementation should rebuild rows."""
+        self.assertFalse(self.requirement.accepts_columns)
+        chunks = [[[1], ['a']], [[2], ['b']]]
+        diff, desc = self.requirement.check_columns(chunks)
+        self.assertEqual(list(diff), [Invalid((1, 'a')), Invalid((2, 'b'))])
+
     def test_check_items(self):
         data = [('A', [1, 2, 3]), ('B', [4, 5, 6])]
         diff, desc = self.requirement.check_items(data)
@@ -366,6 +388,26 @@ class TestGroupRequirement(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid(4)])
         self.assertEqual(desc, 'requires 3 or more elements')
 
+    def test_valid_group(self):
+        self.assertTrue(self.requirement.valid_group([1, 2, 3]))
+        self.assertFalse(self.requirement.valid_group([1, 2]))
+
+    def test_valid_data(self):
+        self.assertTrue(self.requirement.valid_data([1, 2, 3]))
+        self.assertFalse(self.requirement.valid_data([4, 5]))
+        self.assertFalse(self.requirement.valid_data(4))
+
+        self.assertTrue(self.requirement.valid_data({'A': [1, 2, 3]}))
+        self.assertFalse(self.requirement.valid_data({'A': [1, 2, 3], 'B': 6}))
+
+    def test_valid_items_short_circuit(self):
+        """Should stop checking at the first failing group."""
+        def items():
+            yield 'A', [1, 2]
+            raise AssertionError('should not evaluate more items')
+
+        self.assertFalse(self.requirement.valid_items(items()))
+
 
 class TestRequiredPredicate2(unittest.TestCase):
     def setUp(self):
@@ -479,6 +521,199 @@ class TestRequiredPredicate2(unittest.TestCase):
         ]
         self.assertEqual(evaluate_items(diff), expected)
 
+    def test_compiled_once(self):
+        """The predicate should be compiled once per instance and
+        the compiled function should not be pickled.
+        """
+        requirement = RequiredPredicate('abc')
+        requirement(['abc'])
+        compiled = requirement._compiled_pred
+        self.assertIsNotNone(compiled)
+
+        requirement({'A': ['abc'], 'B': 'abc'})
+        self.assertIs(requirement._compiled_pred, compiled)
+
+        copied = pickle.loads(pickle.dumps(requirement))
+        self.assertNotIn('_compiled_pred', copied.__dict__)
+        diff, _ = copied(['abc', 'xyz'])
+        self.assertEqual(list(diff), [Invalid('xyz')])
+
+    def test_valid_group(self):
+        self.assertTrue(self.requirement.valid_group(['10', '20', '30']))
+        self.assertFalse(self.requirement.valid_group(['10', '20', 'XX']))
+
+        def counts_to_three(x):
+            if 1 <= x <= 3:
+                return True
+            return Invalid('{0} is right out'.format(x))
+
+        requirement = RequiredPredicate(counts_to_three)
+        self.assertTrue(requirement.valid_group([1, 2, 3]))
+        self.assertFalse(requirement.valid_group([1, 2, 5]))
+
+    def test_valid_group_short_circuit(self):
+        def group():
+            yield '10'
+            yield 'XX'
+            raise AssertionError('should not evaluate more elements')
+
+        self.assertFalse(self.requirement.valid_group(group()))
+
+    def test_valid_group_subclass(self):
+        """Subclasses that override check_group() should not use the
+        fast path.
+        """
+        class RequiredNothing(RequiredPredicate):
+            def check_group(self, group):
+                return [], 'never fails'
+
+        requirement = RequiredNothing(lambda x: False)
+        self.assertTrue(requirement.valid_group(['abc']))
+
+
+class TestRequiredPredicateColumns(unittest.TestCase):
+    def assertSameAsRows(self, requirement, chunks):
+        rows = [row for columns in chunks for row in zip(*columns)]
+        expected, expected_desc = requirement.check_group(rows)
+        actual, actual_desc = requirement.check_columns(chunks)
+        self.assertEqual(list(actual), list(expected))
+        self.assertEqual(actual_desc, expected_desc)
+
+    def test_accepts_columns(self):
+        self.assertTrue(RequiredPredicate((str, int)).accepts_columns)
+        self.assertTrue(RequiredRegex(('^a', '^b')).accepts_columns)
+
+        self.assertFalse(RequiredPredicate(int).accepts_columns)
+        self.assertFalse(RequiredPredicate((int,)).accepts_columns)
+        self.assertFalse(RequiredPredicate(~Predicate((str, int))).accepts_columns)
+        self.assertFalse(RequiredPredicate((str, int), cache_size=8).accepts_columns)
+
+    def test_matches_rows(self):
+        chunks = [
+            [['a', 'b', 'c'], [1, 'x', 3], [0.5, 1.5, None]],
+            [['d', 5], [4, 5], [2.5, 3.5]],
+        ]
+        is_small = lambda x: x < 3
+        self.assertSameAsRows(RequiredPredicate((str, int, float)), chunks)
+        self.assertSameAsRows(RequiredPredicate((str, Ellipsis, is_small)), chunks)
+        self.assertSameAsRows(RequiredPredicate(('a', 1, 0.5)), chunks)
+        self.assertSameAsRows(RequiredPredicate((set(['a', 'd']), int, Ellipsis),
+                                                show_expected=True), chunks)
+        self.assertSameAsRows(RequiredRegex(('[a-c]', '\\d', Ellipsis)), chunks)
+
+    def test_wrong_number_of_columns(self):
+        chunks = [[['a', 'b'], [1, 2]]]
+        diff, _ = RequiredPredicate((str, int, int)).check_columns(chunks)
+        self.assertEqual(list(diff), [Invalid(('a', 1)), Invalid(('b', 2))])
+
+    def test_checks_stop_at_first_failing_column(self):
+        """Later columns are not checked for rows that already failed
+        (tuple predicates stop at the first non-matching value).
+        """
+        def is_positive(x):
+            if not isinstance(x, int):
+                raise ValueError('expected int')
+            return x > 0
+
+        chunks = [[['a', 1, 'c'], [1, 'x', -3]]]
+        requirement = RequiredPredicate((str, is_positive))
+        diff, _ = requirement.check_columns(chunks)
+        self.assertEqual(list(diff), [Invalid((1, 'x')), Invalid(('c', -3))])
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_dataframe(self):
+        df = pandas.DataFrame([('a', 1), ('b', 'x'), ('c', 3)])
+        requirement = RequiredPredicate((str, int))
+
+        calls = []
+        orig_check_columns = requirement.check_columns
+        def check_columns(chunks):
+            calls.append(chunks)
+            return orig_check_columns(chunks)
+        requirement.check_columns = check_columns
+
+        diff, _ = requirement.check_data(df)
+        self.assertEqual(list(diff), [Invalid(('b', 'x'))])
+        self.assertEqual(len(calls), 1, msg='should read frame column-wise')
+
+class TestRequiredPredicateMemo(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        def is_upper(x):
+            self.calls.append(x)
+            return x.isupper()
+        self.is_upper = is_upper
+
+    def test_disabled_by_default(self):
+        requirement = RequiredPredicate(self.is_upper)
+        self.assertIsNone(requirement.cache_info())
+        list(requirement.check_group(['A', 'A', 'A'])[0])
+        self.assertEqual(len(self.calls), 3)
+
+    def test_repeated_values(self):
+        requirement = RequiredPredicate(self.is_upper, cache_size=10)
+        differences, _ = requirement.check_group(['A', 'b', 'A', 'b', 'C'])
+        self.assertEqual(list(differences), [Invalid('b'), Invalid('b')])
+        self.assertEqual(self.calls, ['A', 'b', 'C'])
+
+        info = requirement.cache_info()
+        self.assertEqual(info, (2, 3, 10, 3))
+        self.assertEqual(info.hits, 2)
+
+        requirement.cache_clear()
+        self.assertEqual(requirement.cache_info(), (0, 0, 10, 0))
+
+    def test_least_recently_used(self):
+        requirement = RequiredPredicate(self.is_upper, cache_size=2)
+        list(requirement.check_group(['A', 'B', 'A', 'C', 'A', 'B'])[0])
+        # 'B' was evicted when 'C' was added, 'A' was kept (recently used).
+        self.assertEqual(self.calls, ['A', 'B', 'C', 'B'])
+        self.assertEqual(requirement.cache_info().currsize, 2)
+
+    def test_equal_values_of_different_types(self):
+        requirement = RequiredPredicate(int, cache_size=10)
+        differences, _ = requirement.check_group([1, 1.0, 1, 1.0])
+        self.assertEqual(list(differences), [Invalid(1.0), Invalid(1.0)])
+
+        requirement = RequiredPredicate((str, int), cache_size=10)
+        differences, _ = requirement.check_group([('a', 1), ('a', 1.0)])
+        self.assertEqual(list(differences), [Invalid(('a', 1.0))])
+
+    def test_unhashable_values(self):
+        requirement = RequiredPredicate(lambda x: len(x) == 1, cache_size=10)
+        differences, _ = requirement.check_group([['a'], ['a', 'b'], ['a']])
+        self.assertEqual(list(differences), [Invalid(['a', 'b'])])
+        self.assertEqual(requirement.cache_info().currsize, 0)
+
+    def test_returned_difference(self):
+        def counts_to_three(x):
+            self.calls.append(x)
+            if 1 <= x <= 3:
+                return True
+            return Invalid('{0} is right out'.format(x))
+
+        requirement = RequiredPredicate(counts_to_three, cache_size=10)
+        differences, _ = requirement.check_group([1, 5, 5])
+        expected = [Invalid('5 is right out'), Invalid('5 is right out')]
+        self.assertEqual(list(differences), expected)
+        self.assertEqual(self.calls, [1, 5])
+
+    def test_items_and_valid_group(self):
+        requirement = RequiredPredicate(self.is_upper, cache_size=10)
+        differences, _ = requirement.check_data({'x': 'a', 'y': 'a', 'z': 'B'})
+        self.assertEqual(dict(differences), {'x': Invalid('a'), 'y': Invalid('a')})
+        self.assertFalse(requirement.valid_group(['B', 'a']))
+        self.assertEqual(sorted(self.calls), ['B', 'a'])
+
+    def test_subclasses(self):
+        requirement = RequiredRegex('^[A-Z]+$', cache_size=10)
+        list(requirement.check_group(['AB', 'AB', 'x', 'x'])[0])
+        self.assertEqual(requirement.cache_info()[:2], (2, 2))
+
+        requirement = RequiredFuzzy('abc', cache_size=10)
+        list(requirement.check_group(['abd', 'abd', 'xyz'])[0])
+        self.assertEqual(requirement.cache_info()[:2], (1, 2))
+
 
 class TestRequiredRegex(unittest.TestCase):
     def test_all_true(self):
@@ -728,6 +963,17 @@ class TestRequiredFuzzy(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid('xyz', expected='abc')])
         self.assertEqual(desc, "does not satisfy 'abc', fuzzy matching at ratio 0.6 or greater")
 
+    def test_set_membership(self):
+        """Sets of strings should match values similar to any member."""
+        requirement = RequiredFuzzy(set(['ohio', 'missouri']), cutoff=0.8)
+        diff, desc = requirement(['ohio', 'misouri', 'kansas'])
+        self.assertEqual(list(diff), [Invalid('kansas')])
+
+        # Sets that are not made only of strings are matched exactly.
+        requirement = RequiredFuzzy(set(['ohio', 1]), cutoff=0.8)
+        diff, desc = requirement(['ohio', 'ohiio', 1])
+        self.assertEqual(list(diff), [Invalid('ohiio')])
+
     def test_empty_iterable(self):
         requirement = RequiredFuzzy('abc')
         result = requirement([])
@@ -745,6 +991,22 @@ class TestRequiredFuzzy(unittest.TestCase):
         self.assertEqual(list(diff), [Deviation(+2, 10)])
         self.assertEqual(desc, 'does not satisfy `10`, fuzzy matching at ratio 0.6 or greater')
 
+    def test_set_membership(self):
+        """Sets of strings should match values similar to any member."""
+        data = ['Missouri', 'Misouri', 'Ohoi', 'Kansas']
+        requirement = RequiredFuzzy(set(['Missouri', 'Ohio', 'Oregon']), cutoff=0.7)
+        diff, _ = requirement(data)
+        self.assertEqual(list(diff), [Invalid('Kansas')])
+
+        data = [('a', 'Ohoi'), ('a', 'Kansas')]
+        requirement = RequiredFuzzy(('a', set(['Ohio', 'Oregon'])), cutoff=0.7)
+        diff, _ = requirement(data)
+        self.assertEqual(list(diff), [Invalid(('a', 'Kansas'))])
+
+        requirement = RequiredFuzzy(set([1, 'abc']))  # Mixed sets match exactly.
+        diff, _ = requirement([1, 'abc', 'abd'])
+        self.assertEqual(list(diff), [Invalid('abd')])
+
     def test_novalue_token(self):
         data = [123, 'abc']
         requirement = RequiredFuzzy(NOVALUE)
@@ -936,6 +1198,18 @@ class TestRequiredSet2(unittest.TestCase):
         differences, description = requirement([])
         self.assertEqual(list(differences), [Missing(1)])
 
+    def test_valid_group(self):
+        self.assertTrue(self.requirement.valid_group([1, 2, 3, 3]))
+        self.assertFalse(self.requirement.valid_group([1, 2]))  # Missing.
+        self.assertFalse(self.requirement.valid_group([1, 2, 3, 4]))  # Extra.
+        self.assertFalse(self.requirement.valid_group([]))
+
+    def test_unhashable_elements(self):
+        data = [1, 2, 3, {'a': 1}, {'a': 1}, [4]]
+        differences, description = self.requirement(data)
+        self.assertEqual(list(differences), [Extra({'a': 1}), Extra([4])])
+        self.assertFalse(self.requirement.valid_group(data))
+
 
 class TestRequiredSuperset(unittest.TestCase):
     def test_element_group(self):
@@ -973,6 +1247,12 @@ class TestRequiredSuperset(unittest.TestCase):
         diff = sorted(diff, key=lambda x: x.args)
         self.assertEqual(diff, [Missing(1), Missing(2)])
 
+    def test_valid_data(self):
+        requirement = RequiredSuperset(set([1, 2]))
+        self.assertTrue(requirement.valid_data([1, 2, 3]))
+        self.assertFalse(requirement.valid_data([1, 3]))
+        self.assertFalse(requirement.valid_data({'a': [1, 2], 'b': [2]}))
+
 
 class TestRequiredSubset(unittest.TestCase):
     def test_element_group(self):
@@ -1010,6 +1290,13 @@ class TestRequiredSubset(unittest.TestCase):
         diff = sorted(diff, key=lambda x: x.args)
         self.assertEqual(diff, [Extra((3, 4))])
 
+    def test_valid_data(self):
+        requirement = RequiredSubset(set([1, 2, 3]))
+        self.assertTrue(requirement.valid_data([1, 2]))
+        self.assertFalse(requirement.valid_data([1, 2, 4]))
+        self.assertTrue(requirement.valid_data({'a': [1, 2], 'b': 3}))
+        self.assertFalse(requirement.valid_data({'a': [1, 2], 'b': 4}))
+
 
 class TestRequiredUnique(unittest.TestCase):
     def setUp(self):
@@ -1045,6 +1332,62 @@ class TestRequiredUnique(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.requirement({'a': (1, 2)})
 
+    def test_valid_data(self):
+        self.assertTrue(self.requirement.valid_data([1, 2, 3]))
+        self.assertFalse(self.requirement.valid_data([1, 2, 2]))
+        self.assertTrue(self.requirement.valid_data({'a': [1, 2], 'b': [1, 2]}))
+        self.assertFalse(self.requirement.valid_data({'a': [1, 2], 'b': [2, 2]}))
+
+        with self.assertRaises(ValueError):
+            self.requirement.valid_data({'a': (1, 2)})
+
+    def test_unhashable_elements(self):
+        data = [{'a': [1]}, [2], {'a': [1]}, [3], [2]]
+        diff, desc = self.requirement(data)
+        self.assertEqual(list(diff), [Extra({'a': [1]}), Extra([2])])
+
+        self.assertTrue(self.requirement.valid_data([{'a': 1}, {'a': 2}]))
+        self.assertFalse(self.requirement.valid_data([{'a': 1}, {'a': 1}]))
+
+
+class TestDeepHash(unittest.TestCase):
+    def test_hashable(self):
+        self.assertEqual(_deephash('abc'), hash('abc'))
+        self.assertEqual(_deephash((1, 2)), hash((1, 2)))
+
+    def test_unhashable(self):
+        obj1 = {'a': [1, 2, set([3])], 'b': ({'c': 4},)}
+        obj2 = {'a': [1, 2, set([3])], 'b': ({'c': 4},)}
+        self.assertEqual(_deephash(obj1), _deephash(obj2))
+
+        obj3 = {'a': [1, 2, set([3])], 'b': ({'c': 5},)}
+        self.assertNotEqual(_deephash(obj1), _deephash(obj3))
+
+        self.assertNotEqual(_deephash([1, 2]), _deephash([2, 1]))
+
+    def test_shared_references(self):
+        inner = [1, 2]
+        self.assertEqual(_deephash([inner, inner]), _deephash([[1, 2], [1, 2]]))
+
+    def test_recursive_reference(self):
+        obj = [1, 2]
+        obj.append(obj)
+        self.assertEqual(_deephash(obj), _deephash(obj))
+
+    def test_deeply_nested(self):
+        """Should not hit the recursion limit."""
+        obj = []
+        for _ in range(10000):
+            obj = [obj]
+        self.assertIsInstance(_deephash(obj), int)
+
+    def test_not_hashable(self):
+        class Unhashable(object):
+            __hash__ = None
+
+        with self.assertRaises(TypeError):
+            _deephash([1, Unhashable()])
+
 
 class TestRequiredOrder2(unittest.TestCase):
     def test_no_difference(self):
@@ -1179,6 +1522,118 @@ class TestRequiredOrder2(unittest.TestCase):
         self.assertEqual(list(differences), expected)
 
 
+    def test_engines(self):
+        data = [{'a': 1}, {'x': 0}, {'d': 4}, {'y': 5}, {'g': 7}]
+        requirement = [{'a': 1}, {'b': 2}, {'c': 3}, {'d': 4}, {'f': 6}]
+        expected = list(RequiredOrder(requirement, engine='difflib')(data)[0])
+        for engine in ('myers', 'patience'):
+            differences, _ = RequiredOrder(requirement, engine=engine)(data)
+            self.assertEqual(list(differences), expected, msg=engine)
+
+        with self.assertRaises(ValueError):
+            RequiredOrder(requirement, engine='unknown')
+
+    def test_long_sequence(self):
+        requirement = list(range(10000))
+        data = list(requirement)
+        data[2000:2001] = []      # <- Remove 2000.
+        data.insert(7000, 'x')
+        differences, _ = RequiredOrder(requirement)(data)
+        expected = [
+            Missing((2000, 2000)),
+            Extra((7000, 'x')),
+        ]
+        self.assertEqual(list(differences), expected)
+
+
+class TestRequiredSorted(unittest.TestCase):
+    def test_ascending(self):
+        requirement = RequiredSorted()
+
+        differences, description = requirement.check_group([1, 2, 2, 3])
+        self.assertEqual(list(differences), [])
+        self.assertEqual(description, 'elements are not in ascending order')
+
+        differences, _ = requirement.check_group([1, 3, 2, 4, 0])
+        self.assertEqual(list(differences), [Invalid((2, 2)), Invalid((4, 0))])
+
+    def test_strict(self):
+        requirement = RequiredSorted(strict=True)
+        differences, description = requirement.check_group([1, 2, 2, 3])
+        self.assertEqual(list(differences), [Invalid((2, 2))])
+        self.assertEqual(description, 'elements are not in strictly ascending order')
+
+    def test_reverse(self):
+        requirement = RequiredSorted(reverse=True)
+        differences, _ = requirement.check_group([3, 2, 2, 4, 1])
+        self.assertEqual(list(differences), [Invalid((3, 4))])
+
+        requirement = RequiredSorted(reverse=True, strict=True)
+        differences, _ = requirement.check_group([3, 2, 2, 4, 1])
+        self.assertEqual(list(differences), [Invalid((2, 2)), Invalid((3, 4))])
+
+    def test_key(self):
+        requirement = RequiredSorted(key=str.lower)
+        differences, _ = requirement.check_group(['a', 'B', 'c', 'A'])
+        self.assertEqual(list(differences), [Invalid((3, 'A'))])
+
+    def test_empty_and_single(self):
+        requirement = RequiredSorted()
+        self.assertEqual(list(requirement.check_group([])[0]), [])
+        self.assertEqual(list(requirement.check_group([5])[0]), [])
+
+    def test_single_pass(self):
+        """Data should be consumed one element at a time."""
+        consumed = []
+        def generate():
+            for x in [1, 2, 0, 3]:
+                consumed.append(x)
+                yield x
+
+        differences, _ = RequiredSorted().check_group(generate())
+        self.assertEqual(consumed, [])  # <- Not started until iterated.
+        self.assertEqual(next(differences), Invalid((2, 0)))
+        self.assertEqual(consumed, [1, 2, 0])
+
+    def test_valid_group(self):
+        self.assertTrue(RequiredSorted().valid_group([1, 2, 3]))
+        self.assertFalse(RequiredSorted().valid_group(iter([1, 3, 2])))
+
+    def test_mapping_data(self):
+        requirement = RequiredSorted()
+        data = {'A': [1, 2, 3], 'B': [2, 1], 'C': 7}
+        differences, _ = requirement.check_data(data)
+        differences = dict((k, list(v)) for k, v in differences)
+        self.assertEqual(differences, {'B': [Invalid((1, 1))]})
+
+    def test_incomparable(self):
+        requirement = RequiredSorted()
+        differences, _ = requirement.check_group([1, 'a', 'b', None])
+        self.assertEqual(list(differences), [Invalid((1, 'a')), Invalid((3, None))])
+
+    def test_key_mapping(self):
+        requirement = RequiredSorted(key={'A': abs, 'B': None, 'C': abs})
+        data = {'A': [1, -2, 3], 'B': [1, -2, 3], 'D': [2, 1], 'E': 5}
+        differences, _ = requirement.check_data(data)
+        differences = dict((k, list(v)) for k, v in differences)
+        expected = {'B': [Invalid((1, -2))], 'D': [Invalid((1, 1))]}
+        self.assertEqual(differences, expected, msg='missing C is ignored')
+
+        self.assertTrue(requirement.valid_data({'A': [1, -2], 'D': [1, 2]}))
+        self.assertFalse(requirement.valid_data({'A': [1, -2], 'D': [2, 1]}))
+
+        with self.assertRaises(ValueError):
+            requirement.check_group([1, 2])
+
+    def test_mapping_factory(self):
+        """Each group can have its own sort key."""
+        requirement = RequiredMapping({'A': abs, 'B': None}, RequiredSorted)
+        data = {'A': [1, -2, 3], 'B': [1, -2, 3]}
+        differences, _ = requirement.check_data(data)
+        differences = dict((k, list(v)) for k, v in differences)
+        self.assertEqual(differences, {'B': [Invalid((1, -2))]})
+
+
 class TestRequiredSequence(unittest.TestCase):
     def test_passing(self):
         requirement = RequiredSequence(['a', 'b', 'c', 'd'])
@@ -1227,6 +1682,85 @@ class TestRequiredSequence(unittest.TestCase):
         ]
         self.assertEqual(list(diff), expected)
 
+    def test_valid_group(self):
+        requirement = RequiredSequence(['a', 2, set(['c'])])
+        self.assertTrue(requirement.valid_group(['a', 2, 'c']))
+        self.assertFalse(requirement.valid_group(['a', 1, 'c']))
+        self.assertFalse(requirement.valid_group(['a', 2]))
+        self.assertFalse(requirement.valid_group(['a', 2, 'c', 'd']))
+
+        factory = lambda val: RequiredPredicate(set([val, repr(val)]))
+        requirement = RequiredSequence([1.0, 2], factory=factory)
+        self.assertTrue(requirement.valid_group(['1.0', 2]))
+        self.assertFalse(requirement.valid_group(['1', 2]))
+
+    def test_compiled_positions(self):
+        requirement = RequiredSequence(['a', int, re.compile('^c'), (1, 2)])
+        values, predicates, all_plain = requirement._get_compiled()
+        self.assertEqual(values, ['a', int, re.compile('^c'), (1, 2)])
+        self.assertEqual([x is None for x in predicates], [True, False, False, True])
+        self.assertFalse(all_plain)
+        self.assertIs(requirement._get_compiled(), requirement._get_compiled())
+
+        diff, _ = requirement(['a', 1.5, 'cat', (1, 3)])
+        expected = [Invalid(1.5, expected=int), Invalid((1, 3), expected=(1, 2))]
+        self.assertEqual(list(diff), expected)
+
+    def test_plain_values(self):
+        requirement = RequiredSequence(['a', 'b', 1, (2, 3)])
+        self.assertTrue(requirement._get_compiled()[2])
+
+        self.assertIsNone(requirement(['a', 'b', 1, (2, 3)]))
+        diff, _ = requirement.check_group(('a', 'b', 1.0, (2, 3)))
+        self.assertEqual(list(diff), [])
+        self.assertIsNone(requirement(iter(['a', 'b', 1, (2, 3)])))
+
+        diff, _ = requirement(iter(['a', 'x', 1, (2, 3), 'y']))
+        self.assertEqual(list(diff), [Invalid('x', expected='b'), Extra('y')])
+
+        self.assertTrue(requirement.valid_group(['a', 'b', 1, (2, 3)]))
+        self.assertFalse(requirement.valid_group(iter(['a', 'b', 1])))
+
+    def test_plain_values_bad_comparison(self):
+        class BadObj(object):
+            def __eq__(self, other):
+                raise TypeError('Sudden but inevitable betrayal!')
+
+        requirement = RequiredSequence(['a', 'b'])
+        bad = BadObj()
+        diff, _ = requirement(['a', bad])
+        self.assertEqual(list(diff), [Invalid(bad, expected='b')])
+
+    def test_iterator_requirement(self):
+        """Exhaustible iterables should not be cached."""
+        requirement = RequiredSequence(iter(['a', 'b']))
+        self.assertIsNone(requirement(['a', 'b']))
+        self.assertIsNone(requirement._compiled)
+
+    def test_pickle(self):
+        requirement = RequiredSequence(['a', int, 'c'])
+        requirement(['a', 1, 'c'])  # <- Compiles predicates.
+        copied = pickle.loads(pickle.dumps(requirement))
+        diff, _ = copied(['a', 'b', 'c'])
+        self.assertEqual(list(diff), [Invalid('b', expected=int)])
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_array(self):
+        requirement = RequiredSequence([1, 2, 3])
+        self.assertIsNone(requirement(numpy.array([1, 2, 3])))
+        self.assertTrue(requirement.valid_group(numpy.array([1, 2, 3])))
+
+        diff, _ = requirement(numpy.array([1, 5, 3]))
+        self.assertEqual(list(diff), [Deviation(+3, 2)])
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_array_mixed_types(self):
+        """Expected values should not be coerced to the array's dtype."""
+        requirement = RequiredSequence(['a', 1])
+        diff, _ = requirement(numpy.array(['a', '1']))
+        self.assertEqual(list(diff), [Invalid('1', expected=1)])
+        self.assertFalse(requirement.valid_group(numpy.array(['a', '1'])))
+
 
 class TestRequiredMapping(unittest.TestCase):
     def test_instantiation(self):
@@ -1248,7 +1782,7 @@ class TestRequiredMapping(unittest.TestCase):
         diff, desc = requirement({'a': 'x', 'b': 10, 'c': 10})
         expected = {'a': Invalid('x', 'j'), 'b': Invalid(10, 'k'), 'c': Deviation(+1, 9)}
         self.assertEqual(dict(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, "does not satisfy 'j'")  # <- From first difference.
 
         # Test that tuples are also treated as single-elements.
         requirement = RequiredMapping({'a': (1, 'j'), 'b': (9, 9)})
@@ -1256,7 +1790,7 @@ class TestRequiredMapping(unittest.TestCase):
         expected = {'a': Invalid((1, 'x'), expected=(1, 'j')),
                     'b': Invalid((9, 10), expected=(9, 9))}
         self.assertEqual(dict(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, "does not satisfy `(1, 'j')`")
 
         # Test custom difference handling.
         def func1(x):
@@ -1269,7 +1803,7 @@ class TestRequiredMapping(unittest.TestCase):
         diff, desc = requirement({'a': 'qux', 'b': 'quux'})
         expected = {'a': Invalid('bar'), 'b': Invalid('baz')}
         self.assertEqual(dict(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, 'does not satisfy func1()')
 
     def test_equality_of_multiple_elements(self):
         requirement = RequiredMapping({'a': 'j', 'b': 9})
@@ -1279,7 +1813,7 @@ class TestRequiredMapping(unittest.TestCase):
             ('b', [Deviation(+1, 9)]),
         ]
         self.assertEqual(evaluate_items(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, "does not satisfy 'j'")  # <- From first difference.
 
         # Test groups of tuple elements.
         requirement = RequiredMapping({'a': (1, 'j'), 'b': (9, 9)})
@@ -1289,7 +1823,7 @@ class TestRequiredMapping(unittest.TestCase):
             ('b', [Invalid((9, 10))]),
         ]
         self.assertEqual(evaluate_items(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, "does not satisfy `(1, 'j')`")
 
     def test_set_membership_differences(self):
         requirement = RequiredMapping({'a': set(['x', 'y']), 'b': set(['x', 'y'])})
@@ -1324,7 +1858,7 @@ class TestRequiredMapping(unittest.TestCase):
             ('d', [Missing('y')]),
         ]
         self.assertEqual(evaluate_items(diff), expected)
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, 'does not satisfy `9`')  # <- From first difference.
 
         # Extra keys unexpectedly found in data.
         requirement = RequiredMapping({'a': 'j'})
@@ -1471,10 +2005,212 @@ class TestRequiredMapping(unittest.TestCase):
         _, desc = requirement({'a': ['x', 'y'], 'b': ['y', 'z']})
         self.assertEqual(desc, 'does not satisfy set membership')
 
-        # Test different messages--uses default instead.
+        # Test different messages--uses message of first difference.
         requirement = RequiredMapping({'a': set(['x']), 'b': 'y'})
         _, desc = requirement({'a': ['x', 'y'], 'b': ['y', 'z']})
-        self.assertEqual(desc, 'does not satisfy mapping requirements')
+        self.assertEqual(desc, 'does not satisfy set membership')
+
+    def test_valid_data(self):
+        requirement = RequiredMapping({'a': 'x', 'b': set(['y', 'z']), 'c': 3})
+
+        self.assertTrue(requirement.valid_data({'a': 'x', 'b': ['y', 'z'], 'c': 3}))
+        self.assertFalse(requirement.valid_data({'a': 'x', 'b': ['y', 'z'], 'c': 4}))
+        self.assertFalse(requirement.valid_data({'a': 'x', 'b': ['y'], 'c': 3}))
+        self.assertFalse(requirement.valid_data({'a': 'x', 'b': ['y', 'z']}))  # Missing key.
+        self.assertFalse(requirement.valid_data({'a': 'x', 'b': ['y', 'z'], 'c': 3, 'd': 4}))  # Extra key.
+
+    def test_valid_data_custom_requirement(self):
+        requirement = RequiredMapping({'a': RequiredSet(set([1, 2]))})
+        self.assertTrue(requirement.valid_data({'a': [1, 2]}))
+        self.assertFalse(requirement.valid_data({'a': [1]}))
+
+    def test_valid_items_short_circuit(self):
+        requirement = RequiredMapping({'a': 1, 'b': 2})
+
+        def items():
+            yield 'a', 100
+            raise AssertionError('should not evaluate more items')
+
+        self.assertFalse(requirement.valid_items(items()))
+
+    def test_reuse_built_requirements(self):
+        created = []
+        def factory(obj):
+            created.append(obj)
+            return RequiredSet(obj)
+
+        requirement = RequiredMapping({'a': set([1, 2]), 'b': set([3])}, factory)
+        data = {'a': [1, 2], 'b': [3, 4]}
+        first = dict(requirement(data)[0])
+        self.assertEqual(requirement._entries, {}, msg='not kept after first use')
+        second = dict(requirement(data)[0])
+        third = dict(requirement(data)[0])
+        self.assertEqual(first.keys(), second.keys())
+        self.assertEqual(first.keys(), third.keys())
+        self.assertEqual(list(first['b']), [Extra(4)])
+        self.assertEqual(list(second['b']), [Extra(4)])
+        self.assertEqual(list(third['b']), [Extra(4)])
+        self.assertTrue(requirement.valid_data({'a': [1, 2], 'b': [3]}))
+
+        # Built for the first use, then built and kept for the second.
+        self.assertEqual(len(created), 4)
+
+    def test_element_and_group_differences(self):
+        """Single elements show expected values but groups do not,
+        even when the same key is checked both ways.
+        """
+        requirement = RequiredMapping({'a': RequiredPredicate('x')})
+        diff, _ = requirement({'a': ['y']})
+        self.assertEqual(evaluate_items(diff), [('a', [Invalid('y')])])
+
+        requirement = RequiredMapping({'a': 'x'}, RequiredRegex)
+        diff, _ = requirement({'a': 'y'})
+        self.assertEqual(dict(diff), {'a': Invalid('y', expected='x')})
+        diff, _ = requirement({'a': ['y']})
+        self.assertEqual(evaluate_items(diff), [('a', [Invalid('y')])])
+
+    def test_pickle(self):
+        requirement = RequiredMapping({'a': 'x', 'b': (str, 1), 'c': ['p', 'q']})
+        data = {'a': 'y', 'b': ('z', 1), 'c': ['q', 'p']}
+        expected = evaluate_items(requirement(data)[0])  # <- Builds entries.
+
+        copied = pickle.loads(pickle.dumps(requirement))
+        self.assertEqual(copied.mapping, requirement.mapping)
+        self.assertEqual(evaluate_items(copied(data)[0]), expected)
+
+
+class TestRequiredAll(unittest.TestCase):
+    def test_and_operator(self):
+        interval = RequiredInterval(0, 10)
+        unique = RequiredUnique()
+        regex = RequiredRegex(r'\d')
+
+        requirement = interval & unique
+        self.assertIsInstance(requirement, RequiredAll)
+        self.assertEqual(requirement.requirements, [interval, unique])
+
+        requirement = requirement & regex  # <- Flattened.
+        self.assertEqual(requirement.requirements, [interval, unique, regex])
+
+        with self.assertRaises(TypeError):
+            interval & 5
+
+    def test_init(self):
+        requirement = RequiredAll([int, set([1, 2])])
+        self.assertIsInstance(requirement.requirements[0], RequiredPredicate)
+        self.assertIsInstance(requirement.requirements[1], RequiredSet)
+
+        with self.assertRaises(ValueError):
+            RequiredAll([])
+
+    def test_group(self):
+        requirement = RequiredAll([RequiredInterval(0, 10),
+                                   RequiredUnique(),
+                                   RequiredSet([1, 2, 3])])
+        differences, description = requirement(iter([1, 2, 2, 12]))
+        self.assertEqual(description, 'does not satisfy all requirements')
+        self.assertEqual(evaluate_items(differences), [
+            ('does not satisfy set membership', [Missing(3), Extra(12)]),
+            ('elements `x` do not satisfy `0 <= x <= 10`', [Deviation(+2, 10)]),
+            ('elements should be unique', [Extra(2)]),
+        ])
+
+    def test_group_single_pass(self):
+        consumed = []
+        def data():
+            for x in [1, 2, 3, 3]:
+                consumed.append(x)
+                yield x
+
+        requirement = RequiredAll([RequiredInterval(0, 2),
+                                   RequiredUnique(),
+                                   RequiredOrder([1, 2, 3])])
+        differences, _ = requirement(data())
+        self.assertEqual(consumed, [1, 2, 3, 3])
+        self.assertEqual(evaluate_items(differences), [
+            ('does not match required order', [Extra((3, 3))]),
+            ('elements `x` do not satisfy `0 <= x <= 2`',
+             [Deviation(+1, 2), Deviation(+1, 2)]),
+            ('elements should be unique', [Extra(3)]),
+        ])
+
+    def test_mapping_labels(self):
+        requirement = RequiredAll({'small': RequiredInterval(0, 10),
+                                   'unique': RequiredUnique()})
+        differences, _ = requirement([3, 3, 11])
+        self.assertEqual(evaluate_items(differences), [
+            ('small', [Deviation(+1, 10)]),
+            ('unique', [Extra(3)]),
+        ])
+
+    def test_duplicate_labels(self):
+        requirement = RequiredAll([RequiredUnique(), RequiredUnique()])
+        differences, _ = requirement([1, 1])
+        self.assertEqual(evaluate_items(differences), [
+            ('elements should be unique', [Extra(1)]),
+            ('elements should be unique (1)', [Extra(1)]),
+        ])
+
+    def test_items(self):
+        requirement = RequiredAll([RequiredInterval(0, 10), RequiredUnique()])
+        data = {'a': iter([1, 1]), 'b': [12]}
+        differences, _ = requirement(data)
+        self.assertEqual(evaluate_items(differences), [
+            (('elements `x` do not satisfy `0 <= x <= 10`', 'b'), [Deviation(+2, 10)]),
+            (('elements should be unique', 'a'), [Extra(1)]),
+        ])
+
+    def test_items_requirement(self):
+        requirement = RequiredAll([RequiredMapping({'a': 1, 'b': 2}),
+                                   RequiredInterval(0, 1)])
+        differences, _ = requirement({'a': 1, 'b': 3})
+        self.assertEqual(evaluate_items(differences), [
+            (('does not satisfy `2`', 'b'), Deviation(+1, 2)),
+            (('elements `x` do not satisfy `0 <= x <= 1`', 'b'), Deviation(+2, 1)),
+        ])
+
+    def test_check_group(self):
+        requirement = RequiredAll([RequiredInterval(0, 10), RequiredUnique()])
+        differences, description = requirement.check_group([1, 1, 12])
+        self.assertEqual(list(differences), [Deviation(+2, 10), Extra(1)])
+        self.assertEqual(description, 'does not satisfy all requirements')
+
+        differences, description = requirement.check_group([1, 1])
+        self.assertEqual(list(differences), [Extra(1)])
+        self.assertEqual(description, 'elements should be unique')
+
+    def test_mapping_value(self):
+        """Combined requirements should be usable as mapping values."""
+        requirement = RequiredMapping({
+            'a': RequiredPredicate(int) & RequiredUnique(),
+            'b': RequiredPredicate(int) & RequiredUnique(),
+        })
+        self.assertIsNone(requirement({'a': [1, 2], 'b': 3}))
+        self.assertTrue(requirement.valid_data({'a': [1, 2], 'b': 3}))
+
+        differences, _ = requirement({'a': [1, 'x', 1], 'b': 3})
+        self.assertEqual(evaluate_items(differences),
+                         [('a', [Invalid('x'), Extra(1)])])
+        self.assertFalse(requirement.valid_data({'a': [1, 'x', 1], 'b': 3}))
+
+    def test_valid(self):
+        requirement = RequiredAll([int, RequiredUnique()])
+        self.assertIsNone(requirement(iter([1, 2, 3])))
+        self.assertTrue(requirement.valid_data([1, 2, 3]))
+        self.assertFalse(requirement.valid_data([1, 2, 2]))
+
+    def test_custom_requirement(self):
+        class RequiredTwo(GroupRequirement):
+            def check_group(self, group):
+                group = list(group)
+                if len(group) == 2:
+                    return [], ''
+                return [Extra(x) for x in group[2:]], 'expected two elements'
+
+        requirement = RequiredAll([RequiredTwo(), RequiredPredicate(int)])
+        differences, _ = requirement(iter([1, 2, 3]))
+        self.assertEqual(evaluate_items(differences),
+                         [('expected two elements', [Extra(3)])])
 
 
 class TestGetRequirement(unittest.TestCase):
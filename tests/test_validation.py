@@ -2,6 +2,10 @@
 import re
 import sys
 import textwrap
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 from . import _unittest as unittest
 from datatest.differences import (
     BaseDifference,
@@ -11,10 +15,15 @@ from datatest.differences import (
     Deviation,
 )
 from datatest._utils import IterItems
+from datatest.requirements import RequiredInterval
+from datatest.requirements import RequiredUnique
 
 from datatest.validation import ValidationError
 from datatest.validation import validate
 from datatest.validation import valid
+from datatest.validation import RetainFirst
+from datatest.validation import RetainSample
+from datatest.acceptances import accepted
 
 
 # Remove for datatest version 0.9.8.
@@ -305,6 +314,26 @@ class TestValidationError(unittest.TestCase):
         """)
         self.assertEqual(str(err), truncation_plus_notice)
 
+    def test_str_truncation_sort_order(self):
+        """Truncated output should match the leading lines of the
+        fully sorted output (including past the first batch of
+        differences selected for display).
+        """
+        values = [(x * 7919) % 1000 for x in range(1000)]  # Shuffled.
+        err = ValidationError([Invalid(x) for x in values], 'invalid data')
+        full_lines = str(err).split('\n')
+
+        err._should_truncate = lambda line_count, char_count: line_count > 50
+        truncated_lines = str(err).split('\n')
+        self.assertEqual(truncated_lines[1:-1], full_lines[1:51])
+        self.assertEqual(truncated_lines[0], 'invalid data (1000 differences): [')
+
+        err = ValidationError(dict((x, Invalid(x)) for x in values), 'invalid data')
+        full_lines = str(err).split('\n')
+        err._should_truncate = lambda line_count, char_count: line_count > 20
+        truncated_lines = str(err).split('\n')
+        self.assertEqual(truncated_lines[1:-1], full_lines[1:21])
+
     def test_repr(self):
         err = ValidationError([MinimalDifference('A')])  # <- No description.
         expected = "ValidationError([MinimalDifference('A')])"
@@ -439,6 +468,33 @@ class TestValidationIntegration(unittest.TestCase):
 
         self.assertFalse(valid(a, b))
 
+    def test_valid_short_circuit(self):
+        """Should stop at the first failing element."""
+        def data():
+            yield 1
+            yield 'abc'
+            raise AssertionError('should not evaluate more elements')
+
+        self.assertFalse(valid(data(), int))
+
+    def test_valid_agrees_with_validate(self):
+        cases = [
+            ([1, 2, 3], int),
+            ([1, 2, 'x'], int),
+            ({'A': 1, 'B': 2}, {'A': 1, 'B': 2}),
+            ({'A': 1, 'B': 2}, {'A': 1, 'B': 3}),
+            ({'A': [1, 2]}, set([1, 2])),
+            (['a', 'b', 'c'], ['a', 'b', 'c']),
+            (['a', 'c'], ['a', 'b', 'c']),
+        ]
+        for data, requirement in cases:
+            try:
+                validate(data, requirement)
+                expected = True
+            except ValidationError:
+                expected = False
+            self.assertIs(valid(data, requirement), expected)
+
     def test_validate(self):
         a = set([1, 2, 3])
         b = set([2, 3, 4])
@@ -604,6 +660,18 @@ class TestValidate(unittest.TestCase):
         expected = {'A': Invalid('axx', expected='aaa')}
         self.assertEqual(actual, expected)
 
+    def test_predicate_cache_size(self):
+        data = ['AA', 'AA', 'b', 'b', 'CC']
+        with self.assertRaises(ValidationError) as cm:
+            validate.predicate(data, str.isupper, cache_size=4)
+        self.assertEqual(cm.exception.differences, [Invalid('b'), Invalid('b')])
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.regex(data, '^[A-Z]+$', cache_size=4)
+        self.assertEqual(cm.exception.differences, [Invalid('b'), Invalid('b')])
+
+        validate.fuzzy(['abc', 'abd', 'abd'], 'abc', cache_size=4)
+
     def test_interval_method(self):
         data = {'A': 5, 'B': 7, 'C': 9}
         validate.interval(data, 5, 10)
@@ -709,3 +777,458 @@ class TestValidate(unittest.TestCase):
         actual = cm.exception.differences
         expected = {'x': [Missing((1, 'B'))], 'y': [Extra((0, 'B'))]}
         self.assertEqual(actual, expected)
+
+    def test_sorted_method(self):
+        validate.sorted([1, 2, 2, 3])
+        validate.sorted(iter([3, 2, 1]), reverse=True)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.sorted([1, 2, 2, 3], strict=True)
+        self.assertEqual(cm.exception.differences, [Invalid((2, 2))])
+
+        with self.assertRaises(ValidationError) as cm:
+            data = {'x': [1, 2], 'y': [-1, -3, 2]}
+            validate.sorted(data, key={'x': None, 'y': abs})
+        self.assertEqual(cm.exception.differences, {'y': [Invalid((2, 2))]})
+
+    def test_sorted_method_key_mapping(self):
+        """Missing groups are ignored and extra groups are checked
+        in natural order.
+        """
+        validate.sorted({'a': [1, 3]}, key={'a': None, 'b': abs})
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.sorted({'a': [3, 1], 'c': [2, -3]}, key={'a': None, 'b': abs})
+        expected = {'a': [Invalid((1, 1))], 'c': [Invalid((1, -3))]}
+        self.assertEqual(cm.exception.differences, expected)
+
+        with self.assertRaises(ValueError):
+            validate.sorted([1, 2], key={'a': abs})
+
+    def test_sorted_method_incomparable(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate.sorted([1, 'a', 'b'])
+        self.assertEqual(cm.exception.differences, [Invalid((1, 'a'))])
+
+    def test_sorted_method_keeps_order_in_message(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate.sorted([5, 4, 3, 2, 1])
+        message = str(cm.exception)
+        self.assertLess(message.index('(1, 4)'), message.index('(4, 1)'))
+
+    def test_all_method(self):
+        data = iter([1, 2, 3])
+        validate.all(data, [int, RequiredUnique()])
+
+        with self.assertRaises(ValidationError) as cm:
+            data = iter([1, 2, 2, 11])
+            validate.all(data, [RequiredInterval(0, 10), RequiredUnique()])
+        actual = cm.exception.differences
+        expected = {
+            'elements `x` do not satisfy `0 <= x <= 10`': [Deviation(+1, 10)],
+            'elements should be unique': [Extra(2)],
+        }
+        self.assertEqual(actual, expected)
+        self.assertEqual(cm.exception.description,
+                         'does not satisfy all requirements')
+
+    def test_combined_mapping_value(self):
+        requirement = {'a': RequiredInterval(0, 10) & RequiredUnique()}
+        validate({'a': [1, 2]}, requirement)
+        self.assertTrue(valid({'a': [1, 2]}, requirement))
+
+        with self.assertRaises(ValidationError) as cm:
+            validate({'a': [1, 1]}, requirement)
+        self.assertEqual(cm.exception.differences, {'a': [Extra(1)]})
+        self.assertFalse(valid({'a': [1, 1]}, requirement))
+
+
+class TestMaxDifferences(unittest.TestCase):
+    def test_stops_consuming_data(self):
+        consumed = []
+        def data():
+            for x in range(1000):
+                consumed.append(x)
+                yield x
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data(), lambda x: x < 10, max_differences=3)
+
+        self.assertEqual(cm.exception.differences,
+                         [Invalid(10), Invalid(11), Invalid(12)])
+        self.assertTrue(cm.exception._partial)
+        self.assertEqual(len(consumed), 14, msg='stops after one more difference')
+
+    def test_not_partial(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate([1, 2, 'x', 'y'], int, max_differences=2)
+        self.assertEqual(cm.exception.differences, [Invalid('x'), Invalid('y')])
+        self.assertFalse(cm.exception._partial)
+        self.assertTrue(str(cm.exception).startswith('does not satisfy `int` (2 differences)'))
+
+    def test_str_at_least(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate(['x', 'y', 'z'], int, max_differences=2)
+
+        expected = dedent_and_strip("""
+            does not satisfy `int` (at least 2 differences): [
+                Invalid('x'),
+                Invalid('y'),
+            ]
+        """)
+        self.assertEqual(str(cm.exception), expected)
+
+    def test_mapping_of_groups(self):
+        data = {'A': [1, 'x', 'y'], 'B': ['z']}
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data, int, max_differences=3)
+        self.assertFalse(cm.exception._partial)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data, int, max_differences=2)
+        self.assertTrue(cm.exception._partial)
+        self.assertEqual(sum(len(v) for v in cm.exception.differences.values()), 2)
+
+    def test_str_at_least_groups(self):
+        """Each difference in a group should be counted."""
+        with self.assertRaises(ValidationError) as cm:
+            validate({'a': ['x'] * 20}, int, max_differences=5)
+        message = str(cm.exception)
+        self.assertTrue(message.startswith('does not satisfy `int` (at least 5 differences)'))
+
+    def test_stops_consuming_items(self):
+        consumed = []
+        def items():
+            for x in range(1000):
+                consumed.append(x)
+                yield (x, 'a')
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(IterItems(items()), int, max_differences=5)
+        self.assertEqual(len(cm.exception.differences), 5)
+        self.assertTrue(cm.exception._partial)
+        self.assertEqual(len(consumed), 6, msg='stops after one more difference')
+
+        del consumed[:]
+        requirement = dict((x, int) for x in range(1000))
+        with self.assertRaises(ValidationError) as cm:
+            validate(IterItems(items()), requirement, max_differences=5)
+        self.assertEqual(len(cm.exception.differences), 5)
+        self.assertEqual(len(consumed), 6, msg='stops after one more difference')
+
+    def test_mapping_of_elements(self):
+        data = {'A': 'x', 'B': 'y', 'C': 'z'}
+        requirement = {'A': 'a', 'B': 'b', 'C': 'c'}
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data, requirement, max_differences=2)
+        self.assertEqual(len(cm.exception.differences), 2)
+        self.assertTrue(cm.exception._partial)
+
+    def test_methods(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate.interval([1, 20, 30, 40], 0, 10, max_differences=1)
+        self.assertEqual(cm.exception.differences, [Deviation(+10, 10)])
+        self.assertTrue(cm.exception._partial)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique([1, 1, 1, 1], max_differences=2)
+        self.assertEqual(cm.exception.differences, [Extra(1), Extra(1)])
+        self.assertTrue(cm.exception._partial)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.regex(['a', 'b', 'c'], '^[ab]$', max_differences=5)
+        self.assertEqual(cm.exception.differences, [Invalid('c')])
+        self.assertFalse(cm.exception._partial)
+
+    def test_bad_value(self):
+        with self.assertRaises(ValueError):
+            validate([1, 2], int, max_differences=0)
+
+
+class TestRetentionPolicies(unittest.TestCase):
+    def test_retain_first(self):
+        policy = RetainFirst(2)
+        consumed = []
+        def differences():
+            for x in 'abcde':
+                consumed.append(x)
+                yield Invalid(x)
+
+        self.assertEqual(policy.retain(differences()), [Invalid('a'), Invalid('b')])
+        self.assertEqual(len(consumed), 5, msg='should consume all differences')
+
+    def test_retain_sample(self):
+        policy = RetainSample(3, seed=1234)
+        differences = [Invalid(x) for x in range(100)]
+
+        sample = policy.retain(iter(differences))
+        self.assertEqual(len(sample), 3)
+        self.assertTrue(all(x in differences for x in sample))
+        self.assertEqual(sample, policy.retain(iter(differences)), msg='seed is reproducible')
+
+        self.assertEqual(policy.retain([Invalid(1)]), [Invalid(1)])
+
+    def test_bad_k(self):
+        with self.assertRaises(ValueError):
+            RetainFirst(0)
+
+        with self.assertRaises(ValueError):
+            RetainSample('a')
+
+
+class TestValidationErrorRetention(unittest.TestCase):
+    def test_list_of_differences(self):
+        differences = (Invalid(x) for x in range(10))
+        err = ValidationError(differences, 'invalid data', retain=3)
+        self.assertEqual(err.differences, [Invalid(0), Invalid(1), Invalid(2)])
+        self.assertEqual(err._counts, {(None, Invalid): 10})
+
+    def test_mapping_of_differences(self):
+        differences = {
+            'A': (Invalid(x) for x in range(5)),
+            'B': [Missing('x'), Extra('y')],
+            'C': Invalid('z'),
+        }
+        err = ValidationError(differences, retain=1)
+        expected = {
+            'A': [Invalid(0)],
+            'B': [Missing('x')],
+            'C': Invalid('z'),
+        }
+        self.assertEqual(err.differences, expected)
+
+        expected_counts = {
+            ('A', Invalid): 5,
+            ('B', Missing): 1,
+            ('B', Extra): 1,
+            ('C', Invalid): 1,
+        }
+        self.assertEqual(err._counts, expected_counts)
+
+    def test_single_item_containers(self):
+        """Only values given as a single difference should be
+        unwrapped--containers of one difference should stay as-is.
+        """
+        differences = {
+            'A': [Invalid('x')],
+            'B': (Invalid(x) for x in ['y']),
+            'C': Invalid('z'),
+        }
+        err = ValidationError(differences, retain=2)
+        expected = {
+            'A': [Invalid('x')],
+            'B': [Invalid('y')],
+            'C': Invalid('z'),
+        }
+        self.assertEqual(err.differences, expected)
+
+        err = ValidationError({'A': [Invalid('x')], 'C': Invalid('z')}, lazy=True)
+        self.assertEqual(err.differences, {'A': [Invalid('x')], 'C': Invalid('z')})
+
+    def test_lazy_evaluation(self):
+        consumed = []
+        def differences():
+            for x in range(10):
+                consumed.append(x)
+                yield Invalid(x)
+
+        err = ValidationError(differences(), retain=2)
+        self.assertEqual(consumed, [0], msg='only first difference is peeked')
+
+        err.differences
+        self.assertEqual(len(consumed), 10)
+
+    def test_str(self):
+        err = ValidationError((Invalid(x) for x in range(10)), 'invalid data', retain=2)
+        expected = dedent_and_strip("""
+            invalid data (10 differences, 2 retained): [
+                Invalid(0),
+                Invalid(1),
+            ]
+        """)
+        self.assertEqual(str(err), expected)
+
+        err = ValidationError([Invalid(0), Invalid(1)], 'invalid data', retain=2)
+        expected = dedent_and_strip("""
+            invalid data (2 differences): [
+                Invalid(0),
+                Invalid(1),
+            ]
+        """)
+        self.assertEqual(str(err), expected)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            ValidationError(iter([]), retain=2)
+
+        with self.assertRaises(ValueError):
+            ValidationError({'A': []}, retain=2)
+
+    def test_validate(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate(range(100), lambda x: x < 10, retain=RetainSample(5))
+        self.assertEqual(len(cm.exception.differences), 5)
+        self.assertIn('90 differences, 5 retained', str(cm.exception))
+
+        with self.assertRaises(ValidationError) as cm:
+            data = {'A': range(20), 'B': range(5)}
+            validate.interval(data, max=1, retain=2)
+        expected = {
+            'A': [Deviation(+1, 1), Deviation(+2, 1)],
+            'B': [Deviation(+1, 1), Deviation(+2, 1)],
+        }
+        self.assertEqual(cm.exception.differences, expected)
+        self.assertIn('21 differences, 4 retained', str(cm.exception))
+
+
+class TestLazyValidationError(unittest.TestCase):
+    @staticmethod
+    def _counting(consumed, values):
+        for x in values:
+            consumed.append(x)
+            yield Invalid(x)
+
+    def test_differences(self):
+        consumed = []
+        err = ValidationError(self._counting(consumed, 'cab'), lazy=True)
+        self.assertEqual(consumed, ['c'], msg='only first difference is peeked')
+        self.assertEqual(err.differences, [Invalid('c'), Invalid('a'), Invalid('b')])
+
+        err = ValidationError({'A': iter([Invalid(1), Invalid(2)]), 'B': Invalid(3)}, lazy=True)
+        self.assertEqual(err.differences, {'A': [Invalid(1), Invalid(2)], 'B': Invalid(3)})
+
+    def test_str_keeps_stream_order(self):
+        err = ValidationError(iter([Invalid('c'), Invalid('a')]), 'desc', lazy=True)
+        expected = dedent_and_strip("""
+            desc (2 differences): [
+                Invalid('c'),
+                Invalid('a'),
+            ]
+        """)
+        self.assertEqual(str(err), expected)
+
+    def test_truncated_str(self):
+        consumed = []
+        err = ValidationError(self._counting(consumed, range(100)), 'desc', lazy=True)
+        err._should_truncate = lambda line_count, char_count: line_count > 2
+        expected = dedent_and_strip("""
+            desc (at least 4 differences): [
+                Invalid(0),
+                Invalid(1),
+                ...
+        """)
+        self.assertEqual(str(err), expected)
+        self.assertEqual(len(consumed), 4, msg='consume only what is displayed')
+        self.assertEqual(str(err), expected, msg='rendering is repeatable')
+
+        # Consumed differences are not lost.
+        self.assertEqual(err.differences, [Invalid(x) for x in range(100)])
+
+    def test_truncated_str_exhausted(self):
+        err = ValidationError(iter([Invalid(0), Invalid(1), Invalid(2)]), lazy=True)
+        err._should_truncate = lambda line_count, char_count: line_count > 2
+        expected = dedent_and_strip("""
+            3 differences: [
+                Invalid(0),
+                Invalid(1),
+                ...
+        """)
+        self.assertEqual(str(err), expected)
+
+    def test_truncated_mapping(self):
+        differences = {'A': iter([Invalid(1), Invalid(2)]), 'B': Invalid(3), 'C': Invalid(4)}
+        err = ValidationError(differences, lazy=True)
+        err._should_truncate = lambda line_count, char_count: line_count > 1
+        self.assertTrue(str(err).startswith('at least 4 differences: {\n'))
+        self.assertEqual(len(err.differences), 3)
+
+    def test_write_to(self):
+        err = ValidationError([Invalid('b'), Invalid('a')], 'desc')
+        fh = StringIO()
+        err.write_to(fh)
+        self.assertEqual(fh.getvalue(), str(err) + '\n')
+
+    def test_validate(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate(iter([5, 1, 7, 3]), lambda x: x < 2, lazy=True)
+        err = cm.exception
+        self.assertIsNotNone(err._stream)
+        self.assertEqual(err.differences, [Invalid(5), Invalid(7), Invalid(3)])
+
+
+class TestAcceptancePushdown(unittest.TestCase):
+    def test_explicit_acceptance(self):
+        data = {'A': 101, 'B': 206, 'C': 299}
+        requirement = {'A': 100, 'B': 200, 'C': 300}
+
+        validate(data, requirement, acceptance=accepted.tolerance(10))  # <- Passes.
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data, requirement, acceptance=accepted.tolerance(5, msg='tol'))
+        self.assertEqual(cm.exception.differences, {'B': Deviation(+6, 200)})
+        self.assertTrue(cm.exception.description.startswith('tol: '))
+
+    def test_explicit_group_scope(self):
+        data = ['a', 'b', 'x', 'y']
+        acceptance = accepted([Extra('x'), Extra('y'), Extra('z')])
+        validate.superset(data, set(['a', 'b']), acceptance=acceptance)
+
+    def test_bad_acceptance(self):
+        with self.assertRaises(TypeError):
+            validate([1, 2], int, acceptance=Missing)
+
+    def test_inferred_element_scope(self):
+        data = ['a', 'b', 'x', 'y']
+        ran_to_end = False
+        with accepted(Extra):
+            validate(data, set(['a', 'b']))  # <- Filtered by pushdown.
+            ran_to_end = True
+        self.assertTrue(ran_to_end)
+
+        with self.assertRaises(ValidationError) as cm:
+            with accepted(Extra, msg='accepted extra'):
+                with accepted.keys('A'):
+                    validate({'A': [1, 'x'], 'B': 'y'}, int)
+        self.assertEqual(cm.exception.differences, {'B': Invalid('y')})
+        self.assertTrue(cm.exception.description.startswith('accepted extra: '))
+
+    def test_out_of_order_exits(self):
+        """Acceptances that exit out of order should not leave stale
+        entries that filter later validations.
+        """
+        from datatest.acceptances import _get_active_acceptances
+
+        outer = accepted(Missing)
+        inner = accepted(Extra)
+        outer.__enter__()
+        inner.__enter__()  # <- Never exited before outer.
+        outer.__exit__(None, None, None)
+        self.assertEqual(_get_active_acceptances(), [])
+        inner.__exit__(None, None, None)  # <- Late exit is a no-op.
+        self.assertEqual(_get_active_acceptances(), [])
+
+        with self.assertRaises(ValidationError):
+            validate(['a', 'x'], set(['a']))  # <- Not filtered.
+
+        def generate():
+            with accepted(Extra):
+                yield 'first'
+                yield 'second'
+
+        generator = generate()
+        with accepted(Missing):
+            next(generator)  # <- Enters accepted(Extra) and suspends.
+        self.assertEqual(_get_active_acceptances(), [])
+        with self.assertRaises(ValidationError):
+            validate(['a', 'x'], set(['a']))  # <- Not filtered.
+        generator.close()
+
+    def test_inferred_stops_at_non_element_scope(self):
+        reached_end = []
+        with accepted(Extra('x'), scope='group'):  # <- Not pushed down.
+            with accepted(Missing):  # <- Pushed down.
+                validate(['x'], set(['y']))
+                reached_end.append(True)
+        self.assertEqual(reached_end, [], msg='error should be raised')
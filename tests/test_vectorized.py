@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Parity tests for the vectorized NumPy backend.
+
+Every array-backed check must give the same differences (in the same
+order) as checking the same elements one at a time.
+"""
+from __future__ import absolute_import
+from . import _unittest as unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+from datatest._normalize import ArrayIterator
+from datatest._normalize import normalize
+from datatest.requirements import (
+    RequiredPredicate,
+    RequiredApprox,
+    RequiredInterval,
+    RequiredSet,
+    RequiredSubset,
+    RequiredSuperset,
+    RequiredUnique,
+)
+from datatest.validation import validate
+from datatest.validation import ValidationError
+from datatest import _vectorized
+
+
+# Remove for datatest version 0.9.8.
+import warnings
+warnings.filterwarnings('ignore', message='subset and superset warning')
+
+
+def make_arrays():
+    nan = float('nan')
+    return [
+        numpy.array([], dtype=int),
+        numpy.array([3, 1, 2, 3, -5, 10, 1, 3]),
+        numpy.array([3, 1, 2, 3, 250], dtype='uint8'),
+        numpy.array([0.5, 1.0, 1.0000000001, -0.0, 0.0, 2.5, 1e300]),
+        numpy.array([1.0, nan, 2.0, nan, 1.0]),
+        numpy.array([1.5, 2.5], dtype='float32'),
+        numpy.array([True, False, True]),
+        numpy.array(['a', 'b', 'a', 'c']),
+        numpy.array([b'x', b'y', b'x']),
+        numpy.array([1, 'a', None, 1], dtype=object),
+    ]
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestParity(unittest.TestCase):
+    def assertParity(self, requirement):
+        for array in make_arrays():
+            expected, expected_desc = requirement.check_group(iter(list(array)))
+            actual, actual_desc = requirement.check_group(array)
+            expected = list(expected)
+            actual = list(actual)
+            if array.dtype.kind == 'f' and numpy.isnan(array).any():
+                # Set order of NaN values depends on object identity.
+                actual = sorted(repr(x) for x in actual)
+                expected = sorted(repr(x) for x in expected)
+            self.assertEqual(actual, expected, msg=repr(array))
+            self.assertEqual(actual_desc, expected_desc)
+
+            is_valid = requirement.valid_group(ArrayIterator(array))
+            self.assertEqual(is_valid, not expected, msg=repr(array))
+
+    def test_interval(self):
+        self.assertParity(RequiredInterval(0, 3))
+        self.assertParity(RequiredInterval(min=1.0))
+        self.assertParity(RequiredInterval(max=2, show_expected=True))
+        self.assertParity(RequiredInterval(-1, 2 ** 40))
+
+    def test_approx(self):
+        self.assertParity(RequiredApprox(1.0))
+        self.assertParity(RequiredApprox(1, places=3))
+        self.assertParity(RequiredApprox(3, delta=1))
+        self.assertParity(RequiredApprox(1.0, delta=0.0))
+        self.assertParity(RequiredApprox(2.5, places=-1))
+
+    def test_type_predicates(self):
+        for obj in [int, float, str, bytes, bool, object, numpy.integer]:
+            self.assertParity(RequiredPredicate(obj))
+            self.assertParity(RequiredPredicate(obj, show_expected=True))
+            self.assertParity(RequiredPredicate(obj, cache_size=4))
+
+    def test_set(self):
+        self.assertParity(RequiredSet(set([1, 2, 3])))
+        self.assertParity(RequiredSet(set(['a', 'b'])))
+        self.assertParity(RequiredSet(set([1.0, 0.0, 'a'])))
+
+    def test_subset_and_superset(self):
+        self.assertParity(RequiredSubset(set([1, 2, 3])))
+        self.assertParity(RequiredSubset(set(['a', 'b', True])))
+        self.assertParity(RequiredSuperset(set([1, 2, 'a', 0.0])))
+
+    def test_unique(self):
+        self.assertParity(RequiredUnique())
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestArrayIterator(unittest.TestCase):
+    def test_normalize(self):
+        array = numpy.array([1, 2, 3])
+        result = normalize(array, lazy_evaluation=True)
+        self.assertIsInstance(result, ArrayIterator)
+        self.assertIs(_vectorized.as_array(result), array)
+
+    def test_consumed(self):
+        """Arrays should only be used while no elements are consumed."""
+        array = numpy.array([1, 2, 3])
+        iterator = ArrayIterator(array)
+        next(iterator)
+        self.assertIsNone(_vectorized.as_array(iterator))
+
+        diffs, _ = RequiredInterval(2, 3).check_group(iterator)
+        self.assertEqual(list(diffs), [])
+
+    def test_unsupported(self):
+        self.assertIsNone(_vectorized.as_array([1, 2, 3]))
+        self.assertIsNone(_vectorized.as_array(numpy.array([[1, 2], [3, 4]])))
+        self.assertIsNone(_vectorized.interval_mask(numpy.array(['a']), 0, 1))
+        self.assertIsNone(_vectorized.distinct_elements(numpy.array([1.0, float('nan')])))
+
+    def test_candidates_only(self):
+        """Element-wise checks should only run for failing positions."""
+        checked = []
+        requirement = RequiredInterval(0, 10)
+        orig_check = requirement._check_element
+        def check_element(element):
+            checked.append(element)
+            return orig_check(element)
+        requirement._check_element = check_element
+
+        diffs, _ = requirement.check_group(numpy.arange(-2, 12))
+        self.assertEqual(len(list(diffs)), 3)
+        self.assertEqual(checked, [-2, -1, 11])
+
+
+def make_extension_series():
+    return [
+        pandas.Series(['a', 'b', 'a'], dtype='category'),
+        pandas.Series(['a', None, 'a'], dtype='category'),
+        pandas.Series([1, 'x', None, 1], dtype='category'),
+        pandas.Series(['a', None, 'c'], dtype='string'),
+        pandas.Series([1, None, 3], dtype='Int64'),
+        pandas.Series([None, None], dtype='Int64'),
+        pandas.Series([], dtype='Int64'),
+        pandas.Series([1.5, None], dtype='Float64'),
+        pandas.Series([True, None], dtype='boolean'),
+    ]
+
+
+@unittest.skipUnless(pandas, 'requires pandas')
+class TestExtensionParity(unittest.TestCase):
+    def test_type_predicates(self):
+        for obj in [int, float, str, bool, object, numpy.integer]:
+            requirement = RequiredPredicate(obj)
+            for series in make_extension_series():
+                group = normalize(series, lazy_evaluation=True)
+                self.assertIsInstance(group, ArrayIterator)
+                self.assertIsNotNone(requirement._get_array_differences(
+                    normalize(series, lazy_evaluation=True)))
+
+                expected, _ = requirement.check_group(iter(list(series.values)))
+                actual, _ = requirement.check_group(group)
+                msg = '{0!r} {1!r}'.format(obj, series)
+                self.assertEqual(repr(list(actual)), repr(list(expected)), msg=msg)
+
+    def test_checked_once(self):
+        """Non-missing elements should be decided by the dtype."""
+        checked = []
+        requirement = RequiredPredicate(str)
+        orig_check = requirement._check_element
+        def check_element(element):
+            checked.append(element)
+            return orig_check(element)
+        requirement._check_element = check_element
+
+        series = pandas.Series(['a', 'b', None] * 100, dtype='category')
+        diffs, _ = requirement.check_group(normalize(series, lazy_evaluation=True))
+        self.assertEqual(len(list(diffs)), 100)
+        self.assertEqual(checked[:2], ['a', 'b'])
+        self.assertEqual(len(checked), 102)  # <- Categories and missing values.
+
+    def test_consumed(self):
+        iterator = normalize(pandas.Series([1, 2], dtype='Int64'), lazy_evaluation=True)
+        next(iterator)
+        self.assertIsNone(_vectorized.as_extension_array(iterator))
+
+        diffs, _ = RequiredPredicate(int).check_group(iterator)
+        self.assertEqual(list(diffs), [])
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestValidate(unittest.TestCase):
+    def test_ndarray(self):
+        data = numpy.array([1, 5, 5, 20])
+        with self.assertRaises(ValidationError) as cm:
+            validate.interval(data, 0, 10)
+        self.assertEqual(cm.exception.differences,
+                         list(RequiredInterval(0, 10).check_group(list(data))[0]))
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique(data)
+        self.assertEqual(len(cm.exception.differences), 1)
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_series(self):
+        series = pandas.Series([0.5, 1.5, 1.5, 3.0])
+        self.assertIsInstance(normalize(series, lazy_evaluation=True), ArrayIterator)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.set(series, set([0.5, 1.5, 2.0]))
+        expected = list(RequiredSet(set([0.5, 1.5, 2.0])).check_group(list(series.values))[0])
+        self.assertEqual(cm.exception.differences, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()